@@ -1,4 +1,5 @@
 import base64
+import contextvars
 import numbers
 import textwrap
 import uuid
@@ -8,6 +9,8 @@ import io
 import re
 import sys
 import warnings
+from contextlib import contextmanager
+from functools import lru_cache
 import narwhals.stable.v1 as nw
 
 from _plotly_utils.optional_imports import get_module
@@ -23,6 +26,163 @@ def fullmatch(regex, string, flags=0):
     return re.match("(?:" + regex_string + r")\Z", string, flags=flags)
 
 
+# Configuration
+# -------------
+# Settings that are overridden in the current thread or asyncio task only
+# (see ValidatorConfig._override). The dict is replaced, never mutated.
+_config_overrides = contextvars.ContextVar("plotly_config_overrides", default={})
+
+
+class ValidatorConfig(object):
+    """
+    Singleton object containing the user defined configuration of whether
+    and how validators process property values. Available as
+    `plotly.io.config`.
+    """
+
+    _valid_copy_arrays = ("always", "if_writeable", "never")
+
+    def __init__(self):
+        self._list_array_threshold = 1000
+        self._lists_as_arrays = False
+        self._copy_arrays = "always"
+        self._validate = True
+
+    @property
+    def list_array_threshold(self):
+        """
+        Minimum length of a list or tuple of numbers above which it is
+        converted to a numpy array once and validated with vectorized
+        operations, rather than element by element (requires numpy)
+
+        Returns
+        -------
+        int
+        """
+        return self._list_array_threshold
+
+    @list_array_threshold.setter
+    def list_array_threshold(self, val):
+        if not isinstance(val, int) or isinstance(val, bool) or val < 0:
+            raise ValueError(
+                "The list_array_threshold property must be a non-negative "
+                "integer\n    Received value of type {typ}: {val}".format(
+                    typ=type_str(val), val=repr(val)
+                )
+            )
+
+        self._list_array_threshold = val
+
+    @property
+    def lists_as_arrays(self):
+        """
+        If True, lists and tuples of numbers that are validated with
+        vectorized operations (see `list_array_threshold`) are stored as
+        read-only numpy arrays. If False (default), they are stored as lists
+
+        Returns
+        -------
+        bool
+        """
+        return self._lists_as_arrays
+
+    @lists_as_arrays.setter
+    def lists_as_arrays(self, val):
+        if not isinstance(val, bool):
+            raise ValueError(
+                "The lists_as_arrays property must be a boolean\n"
+                "    Received value of type {typ}: {val}".format(
+                    typ=type_str(val), val=repr(val)
+                )
+            )
+
+        self._lists_as_arrays = val
+
+    @property
+    def copy_arrays(self):
+        """
+        When numpy arrays (or arrays backing pandas objects) that don't
+        need to be converted are stored in a figure:
+          - 'always' (default): a read-only copy of the array is stored
+          - 'if_writeable': read-only C-contiguous arrays are stored
+            without copying them, other arrays are copied
+          - 'never': a read-only view of C-contiguous arrays is stored
+            without copying them. Ownership of the array is transferred
+            to the figure, so the caller must not modify it afterwards.
+
+        Returns
+        -------
+        str
+        """
+        return _config_overrides.get().get("copy_arrays", self._copy_arrays)
+
+    @copy_arrays.setter
+    def copy_arrays(self, val):
+        self._check_copy_arrays(val)
+        self._copy_arrays = val
+
+    @staticmethod
+    def _check_copy_arrays(val):
+        if val not in ValidatorConfig._valid_copy_arrays:
+            raise ValueError(
+                "The copy_arrays property must be one of {valid}\n"
+                "    Received {val}".format(
+                    valid=ValidatorConfig._valid_copy_arrays, val=repr(val)
+                )
+            )
+
+    @property
+    def validate(self):
+        """
+        If True (default), property values assigned to graph objects are
+        validated and coerced. If False, values are stored as-is, which is
+        only appropriate for trusted figure specifications that have already
+        been validated (e.g. the output of `fig.to_dict()`).
+
+        See also `plotly.io.validation`, which temporarily disables
+        validation within a context of the current thread.
+
+        Returns
+        -------
+        bool
+        """
+        return _config_overrides.get().get("validate", self._validate)
+
+    @validate.setter
+    def validate(self, val):
+        self._check_validate(val)
+        self._validate = val
+
+    @staticmethod
+    def _check_validate(val):
+        if not isinstance(val, bool):
+            raise ValueError(
+                "The validate property must be a boolean\n"
+                "    Received value of type {typ}: {val}".format(
+                    typ=type_str(val), val=repr(val)
+                )
+            )
+
+    @contextmanager
+    def _override(self, **settings):
+        """
+        Context manager that overrides settings (e.g. validate=False) in the
+        current thread or asyncio task only. Other threads and tasks keep
+        seeing the values assigned to the properties.
+        """
+        for name, val in settings.items():
+            getattr(self, "_check_" + name)(val)
+
+        token = _config_overrides.set(dict(_config_overrides.get(), **settings))
+        try:
+            yield
+        finally:
+            _config_overrides.reset(token)
+
+
+config = ValidatorConfig()
+
+
 # Utility functions
 # -----------------
 def to_scalar_or_list(v):
@@ -137,10 +297,10 @@ def copy_to_readonly_numpy_array(v, kind=None, force_numeric=False):
             new_v = np.ascontiguousarray(v.astype(dtype))
         else:
             # Either no kind was requested or requested kind is satisfied
-            new_v = np.ascontiguousarray(v.copy())
+            new_v = share_or_copy_array(v)
     else:
         # v is a non-numeric homogenous array
-        new_v = v.copy()
+        new_v = share_or_copy_array(v)
 
     # Handle force numeric param
     # --------------------------
@@ -166,6 +326,106 @@ def copy_to_readonly_numpy_array(v, kind=None, force_numeric=False):
     return new_v
 
 
+def to_numeric_array(v, allowed_types, homogeneous=False):
+    """
+    Convert a long simple array of native Python numbers into a numpy array,
+    so that it can be validated with vectorized operations
+
+    Parameters
+    ----------
+    v : list or tuple
+        Simple array to convert
+    allowed_types : tuple of type
+        Exact types that the elements of v may have (e.g. (int, float))
+    homogeneous : bool
+        If True, all elements of v must have the same type
+
+    Returns
+    -------
+    np.ndarray or None
+        None if v is shorter than `config.list_array_threshold`, if numpy
+        is not installed, or if v holds elements of other types. In this
+        case v should be validated element by element.
+    """
+    if len(v) < config.list_array_threshold:
+        return None
+
+    np = get_module("numpy")
+    if np is None:
+        return None
+
+    types = set(map(type, v))
+    if not types.issubset(allowed_types) or (homogeneous and len(types) > 1):
+        return None
+
+    return np.array(v)
+
+
+def find_out_of_bounds_els(v, v_array, min_val, max_val):
+    """
+    Find the elements of an array that are not in the interval
+    [min_val, max_val]
+
+    Parameters
+    ----------
+    v : array like
+        Input value
+    v_array : np.ndarray
+        Numeric numpy array built from v
+
+    Returns
+    -------
+    list
+        Up to the first 10 out of bounds elements of v
+    """
+    np = get_module("numpy")
+    v_valid = np.logical_and(min_val <= v_array, v_array <= max_val)
+
+    if np.all(v_valid):
+        return []
+
+    v_invalid = np.logical_not(v_valid)
+    return np.array(v, dtype="object")[v_invalid][:10].tolist()
+
+
+def numeric_array_or_list(v, v_array):
+    """
+    Return the validated form of a simple array v that was validated as the
+    numeric numpy array v_array: a read-only numpy array if
+    `config.lists_as_arrays` is True, and a list otherwise
+    """
+    if config.lists_as_arrays and v_array.dtype.kind in ["u", "i", "f"]:
+        v_array.flags["WRITEABLE"] = False
+        return v_array
+    else:
+        return list(v)
+
+
+def share_or_copy_array(v):
+    """
+    Return a C-contiguous numpy array holding the elements of v that may
+    be made read-only without affecting v. Depending on
+    `config.copy_arrays`, this is a view of v or a copy of it.
+
+    Parameters
+    ----------
+    v : np.ndarray
+
+    Returns
+    -------
+    np.ndarray
+    """
+    copy_arrays = config.copy_arrays
+    if v.flags["C_CONTIGUOUS"] and (
+        copy_arrays == "never"
+        or (copy_arrays == "if_writeable" and not v.flags["WRITEABLE"])
+    ):
+        return v.view()
+    else:
+        np = get_module("numpy")
+        return np.ascontiguousarray(v.copy())
+
+
 def is_numpy_convertable(v):
     """
     Return whether a value is meaningfully convertable to a numpy array
@@ -762,7 +1022,6 @@ class NumberValidator(BaseValidator):
         if is_none_or_typed_array_spec(v):
             pass
         elif self.array_ok and is_homogeneous_array(v):
-            np = get_module("numpy")
             try:
                 v_array = copy_to_readonly_numpy_array(v, force_numeric=True)
             except (ValueError, TypeError, OverflowError):
@@ -770,21 +1029,26 @@ class NumberValidator(BaseValidator):
 
             # Check min/max
             if self.has_min_max:
-                v_valid = np.logical_and(
-                    self.min_val <= v_array, v_array <= self.max_val
+                some_invalid_els = find_out_of_bounds_els(
+                    v, v_array, self.min_val, self.max_val
                 )
-
-                if not np.all(v_valid):
-                    # Grab up to the first 10 invalid values
-                    v_invalid = np.logical_not(v_valid)
-                    some_invalid_els = np.array(v, dtype="object")[v_invalid][
-                        :10
-                    ].tolist()
-
+                if some_invalid_els:
                     self.raise_invalid_elements(some_invalid_els)
 
             v = v_array  # Always numeric numpy array
         elif self.array_ok and is_simple_array(v):
+            v_array = to_numeric_array(v, (int, float))
+            if v_array is not None:
+                # Long list of numbers, check min/max with numpy
+                if self.has_min_max:
+                    some_invalid_els = find_out_of_bounds_els(
+                        v, v_array, self.min_val, self.max_val
+                    )
+                    if some_invalid_els:
+                        self.raise_invalid_elements(some_invalid_els)
+
+                return numeric_array_or_list(v, v_array)
+
             # Check numeric
             invalid_els = [e for e in v if not isinstance(e, numbers.Number)]
 
@@ -910,7 +1174,6 @@ class IntegerValidator(BaseValidator):
         elif v in self.extras:
             return v
         elif self.array_ok and is_homogeneous_array(v):
-            np = get_module("numpy")
             v_array = copy_to_readonly_numpy_array(
                 v, kind=("i", "u"), force_numeric=True
             )
@@ -920,20 +1183,26 @@ class IntegerValidator(BaseValidator):
 
             # Check min/max
             if self.has_min_max:
-                v_valid = np.logical_and(
-                    self.min_val <= v_array, v_array <= self.max_val
+                some_invalid_els = find_out_of_bounds_els(
+                    v, v_array, self.min_val, self.max_val
                 )
-
-                if not np.all(v_valid):
-                    # Grab up to the first 10 invalid values
-                    v_invalid = np.logical_not(v_valid)
-                    some_invalid_els = np.array(v, dtype="object")[v_invalid][
-                        :10
-                    ].tolist()
+                if some_invalid_els:
                     self.raise_invalid_elements(some_invalid_els)
 
             v = v_array
         elif self.array_ok and is_simple_array(v):
+            v_array = to_numeric_array(v, (int,))
+            if v_array is not None:
+                # Long list of integers, check min/max with numpy
+                if self.has_min_max:
+                    some_invalid_els = find_out_of_bounds_els(
+                        v, v_array, self.min_val, self.max_val
+                    )
+                    if some_invalid_els:
+                        self.raise_invalid_elements(some_invalid_els)
+
+                return numeric_array_or_list(v, v_array)
+
             # Check integer type
             invalid_els = [
                 e for e in v if not isinstance(e, int) and e not in self.extras
@@ -1377,6 +1646,12 @@ class ColorValidator(BaseValidator):
                 # Numbers are allowed and we have an array of numbers.
                 # All good
                 pass
+            elif v.size and self.all_valid_color_strs(v.ravel().tolist()):
+                # Array of valid color strings. All good, but without
+                # numbers the array should have a string dtype
+                if not self.numbers_allowed():
+                    v = v.astype("U")
+                    v.flags["WRITEABLE"] = False
             else:
                 validated_v = [self.validate_coerce(e, should_raise=False) for e in v]
 
@@ -1390,6 +1665,9 @@ class ColorValidator(BaseValidator):
                     v = copy_to_readonly_numpy_array(validated_v, kind="O")
                 else:
                     v = copy_to_readonly_numpy_array(validated_v, kind="U")
+        elif self.array_ok and is_simple_array(v) and self.all_valid_color_strs(v):
+            # List of valid color strings
+            v = list(v)
         elif self.array_ok and is_simple_array(v):
             validated_v = [self.validate_coerce(e, should_raise=False) for e in v]
 
@@ -1460,30 +1738,79 @@ class ColorValidator(BaseValidator):
         elif not isinstance(v, str):
             # If not allow_numbers then value must be a string
             return None
+        elif ColorValidator.is_valid_color_str(v):
+            return v
         else:
-            # Remove spaces so regexes don't need to bother with them.
-            v_normalized = v.replace(" ", "").lower()
-
-            # if ColorValidator.re_hex.fullmatch(v_normalized):
-            if fullmatch(ColorValidator.re_hex, v_normalized):
-                # valid hex color (e.g. #f34ab3)
-                return v
-            elif fullmatch(ColorValidator.re_rgb_etc, v_normalized):
-                # elif ColorValidator.re_rgb_etc.fullmatch(v_normalized):
-                # Valid rgb(a), hsl(a), hsv(a) color
-                # (e.g. rgba(10, 234, 200, 50%)
-                return v
-            elif fullmatch(ColorValidator.re_ddk, v_normalized):
-                # Valid var(--*) DDK theme variable, inspired by CSS syntax
-                # (e.g. var(--accent) )
-                # DDK will crawl & eval var(-- colors for Graph theming
-                return v
-            elif v_normalized in ColorValidator.named_colors:
-                # Valid named color (e.g. 'coral')
-                return v
-            else:
-                # Not a valid color
-                return None
+            # Not a valid color
+            return None
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def is_valid_color_str(v):
+        """
+        Return whether a string is a valid color. Results are kept in a
+        bounded LRU cache since the same handful of color strings tend to be
+        validated over and over again.
+
+        Parameters
+        ----------
+        v : str
+            Candidate color string
+
+        Returns
+        -------
+        bool
+        """
+        # Remove spaces so regexes don't need to bother with them.
+        v_normalized = v.replace(" ", "").lower()
+
+        # if ColorValidator.re_hex.fullmatch(v_normalized):
+        if fullmatch(ColorValidator.re_hex, v_normalized):
+            # valid hex color (e.g. #f34ab3)
+            return True
+        elif fullmatch(ColorValidator.re_rgb_etc, v_normalized):
+            # elif ColorValidator.re_rgb_etc.fullmatch(v_normalized):
+            # Valid rgb(a), hsl(a), hsv(a) color
+            # (e.g. rgba(10, 234, 200, 50%)
+            return True
+        elif fullmatch(ColorValidator.re_ddk, v_normalized):
+            # Valid var(--*) DDK theme variable, inspired by CSS syntax
+            # (e.g. var(--accent) )
+            # DDK will crawl & eval var(-- colors for Graph theming
+            return True
+        elif v_normalized in ColorValidator.named_colors:
+            # Valid named color (e.g. 'coral')
+            return True
+        else:
+            # Not a valid color
+            return False
+
+    @staticmethod
+    def all_valid_color_strs(elements):
+        """
+        Return whether all elements of a flat sequence are valid color
+        strings. Each distinct element is only validated once, so this is
+        cheap for large arrays with few distinct colors.
+
+        Parameters
+        ----------
+        elements : list or tuple
+            Candidate color values
+
+        Returns
+        -------
+        bool
+        """
+        try:
+            distinct = set(elements)
+        except TypeError:
+            # Unhashable elements (e.g. nested lists)
+            return False
+
+        return all(
+            isinstance(e, str) and ColorValidator.is_valid_color_str(e)
+            for e in distinct
+        )
 
 
 class ColorlistValidator(BaseValidator):
@@ -1731,6 +2058,12 @@ class AngleValidator(BaseValidator):
             # Normalize v onto the interval [-180, 180)
             v = (v + 180) % 360 - 180
         elif self.array_ok and is_simple_array(v):
+            v_array = to_numeric_array(v, (int, float), homogeneous=True)
+            if v_array is not None:
+                # Long list of all ints or all floats, normalize with numpy
+                v_array = (v_array + 180) % 360 - 180
+                return numeric_array_or_list(v_array.tolist(), v_array)
+
             # Check numeric
             invalid_els = [e for e in v if not isinstance(e, numbers.Number)]
 
@@ -2467,6 +2800,22 @@ class CompoundValidator(BaseValidator):
 
         return module_str
 
+    @staticmethod
+    def load_data_docs(validator):
+        if validator.data_docs is None:
+            # Validators built from the validator registry don't carry
+            # their docs, load them from the generated validator class
+            from plotly.validator_cache import ValidatorCache
+
+            validator.data_docs = ValidatorCache.get_data_docs(
+                validator.parent_name, validator.plotly_name
+            )
+
+        return validator.data_docs
+
+    def get_data_docs(self):
+        return CompoundValidator.load_data_docs(self)
+
     @property
     def data_class(self):
         if self._data_class is None:
@@ -2491,7 +2840,7 @@ class CompoundValidator(BaseValidator):
             plotly_name=self.plotly_name,
             class_str=self.data_class_str,
             module_str=self.module_str,
-            constructor_params_str=self.data_docs,
+            constructor_params_str=self.get_data_docs(),
         )
 
         return desc
@@ -2552,6 +2901,9 @@ class CompoundArrayValidator(BaseValidator):
             self.data_class_str, parent_name
         )
 
+    def get_data_docs(self):
+        return CompoundValidator.load_data_docs(self)
+
     def description(self):
 
         desc = (
@@ -2568,7 +2920,7 @@ class CompoundArrayValidator(BaseValidator):
             plotly_name=self.plotly_name,
             class_str=self.data_class_str,
             module_str=self.module_str,
-            constructor_params_str=self.data_docs,
+            constructor_params_str=self.get_data_docs(),
         )
 
         return desc
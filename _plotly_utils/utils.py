@@ -1,4 +1,5 @@
 import base64
+import binascii
 import decimal
 import json as _json
 import sys
@@ -10,6 +11,7 @@ from _plotly_utils.basevalidators import (
     ImageUriValidator,
     copy_to_readonly_numpy_array,
     is_homogeneous_array,
+    is_typed_array_spec,
 )
 
 
@@ -36,18 +38,24 @@ plotlyjsShortTypes = {
 }
 
 
-def to_typed_array_spec(v):
+def to_typed_array(v, float_precision="float64", max_decimals=None):
     """
-    Convert numpy array to plotly.js typed array spec
-    If not possible return the original value
+    Convert numpy array to an array with the dtype of a plotly.js typed array
+    If not possible return None
+
+    Parameters
+    ----------
+    v: np.ndarray
+        Array to convert
+    float_precision: str (default "float64")
+        Precision of float arrays. If "float32", float64 arrays are
+        converted to float32, which halves their size.
+    max_decimals: int or None (default None)
+        If not None, float arrays are rounded to this number of decimals
     """
-    v = copy_to_readonly_numpy_array(v)
-
-    # Skip b64 encoding if numpy is not installed,
-    # or if v is not a numpy array, or if v is empty
-    np = get_module("numpy", should_load=False)
-    if not np or not isinstance(v, np.ndarray) or v.size == 0:
-        return v
+    # Skip empty arrays
+    if v.size == 0:
+        return None
 
     dtype = str(v.dtype)
 
@@ -62,7 +70,7 @@ def to_typed_array_spec(v):
         elif max <= int32max and min >= int32min:
             v = v.astype("int32")
         else:
-            return v
+            return None
 
     elif dtype == "uint64":
         max = v.max()
@@ -74,44 +82,182 @@ def to_typed_array_spec(v):
         elif max <= uint32max and min >= 0:
             v = v.astype("uint32")
         else:
-            return v
+            return None
 
-    dtype = str(v.dtype)
+    elif dtype in ("float32", "float64"):
+        if max_decimals is not None:
+            v = v.round(max_decimals)
+        if float_precision == "float32":
+            v = v.astype("float32")
 
-    if dtype in plotlyjsShortTypes:
-        arrObj = {
-            "dtype": plotlyjsShortTypes[dtype],
-            "bdata": base64.b64encode(v).decode("ascii"),
-        }
+    if str(v.dtype) not in plotlyjsShortTypes:
+        return None
 
-        if v.ndim > 1:
-            arrObj["shape"] = str(v.shape)[1:-1]
+    return v
 
-        return arrObj
 
-    return v
+def to_typed_array_spec(v, float_precision="float64", max_decimals=None):
+    """
+    Convert numpy array to plotly.js typed array spec
+    If not possible return the original value
+
+    Parameters
+    ----------
+    v:
+        Array to convert
+    float_precision: str (default "float64")
+        See to_typed_array
+    max_decimals: int or None (default None)
+        See to_typed_array
+    """
+    v = copy_to_readonly_numpy_array(v)
+
+    # Skip b64 encoding if numpy is not installed,
+    # or if v is not a numpy array
+    np = get_module("numpy", should_load=False)
+    if not np or not isinstance(v, np.ndarray):
+        return v
+
+    typed_v = to_typed_array(
+        v, float_precision=float_precision, max_decimals=max_decimals
+    )
+    if typed_v is None:
+        return v
+
+    arrObj = {
+        "dtype": plotlyjsShortTypes[str(typed_v.dtype)],
+        "bdata": base64.b64encode(typed_v).decode("ascii"),
+    }
+
+    if typed_v.ndim > 1:
+        arrObj["shape"] = str(typed_v.shape)[1:-1]
+
+    return arrObj
+
 
+# Keys that are skipped for conversion to the typed array spec, unless
+# other keys are specified
+typed_array_skipped_keys = ("geojson", "layer", "layers", "range")
 
-def is_skipped_key(key):
+
+def is_skipped_key(key, skipped_keys=None):
     """
     Return whether the key is skipped for conversion to the typed array spec
+
+    Parameters
+    ----------
+    key: str
+        Property name
+    skipped_keys: collection of str or None (default None)
+        Names of the properties that are skipped. If None,
+        typed_array_skipped_keys is used.
     """
-    skipped_keys = ["geojson", "layer", "layers", "range"]
-    return any(skipped_key == key for skipped_key in skipped_keys)
+    if skipped_keys is None:
+        skipped_keys = typed_array_skipped_keys
+    return key in skipped_keys
+
+
+# Types that convert_to_base64 doesn't need to descend into
+_scalar_types = frozenset([type(None), bool, int, float, str])
 
 
-def convert_to_base64(obj):
+def convert_to_base64(
+    obj, float_precision="float64", max_decimals=None, skipped_keys=None
+):
+    """
+    Convert the numpy arrays of a figure dict, in place, to the plotly.js
+    typed array spec
+
+    Parameters
+    ----------
+    obj: dict or list
+        Figure dict, or part of one
+    float_precision: str (default "float64")
+        See to_typed_array_spec
+    max_decimals: int or None (default None)
+        See to_typed_array_spec
+    skipped_keys: collection of str or None (default None)
+        Names of the properties whose values are neither converted nor
+        descended into. If None, typed_array_skipped_keys is used.
+    """
     if isinstance(obj, dict):
         for key, value in obj.items():
-            if is_skipped_key(key):
+            if is_skipped_key(key, skipped_keys):
                 continue
             elif is_homogeneous_array(value):
-                obj[key] = to_typed_array_spec(value)
+                obj[key] = to_typed_array_spec(
+                    value, float_precision=float_precision, max_decimals=max_decimals
+                )
             else:
-                convert_to_base64(value)
+                convert_to_base64(value, float_precision, max_decimals, skipped_keys)
     elif isinstance(obj, list) or isinstance(obj, tuple):
         for value in obj:
-            convert_to_base64(value)
+            # Skip the recursive call for the scalar elements of long lists
+            if type(value) not in _scalar_types:
+                convert_to_base64(value, float_precision, max_decimals, skipped_keys)
+
+
+# numpy dtypes of the plotly.js typed array dtypes, which are little-endian
+plotlyjsTypedArrayDtypes = {
+    name: "<" + short for name, short in plotlyjsShortTypes.items()
+}
+plotlyjsTypedArrayDtypes.update(
+    {short: "<" + short for short in plotlyjsShortTypes.values()}
+)
+
+
+def from_typed_array_spec(v):
+    """
+    Convert plotly.js typed array spec to a read-only numpy array
+    If not possible return the original value
+
+    The array is a view of the decoded bytes, so no copy is made beyond
+    the base64 decoding itself.
+    """
+    np = get_module("numpy")
+    if not np or not is_typed_array_spec(v):
+        return v
+
+    dtype = plotlyjsTypedArrayDtypes.get(v["dtype"])
+    bdata = v["bdata"]
+    if dtype is None or not isinstance(bdata, str):
+        return v
+
+    # a2b_base64 accepts ascii strings, unlike b64decode which first copies
+    # them to bytes
+    arr = np.frombuffer(binascii.a2b_base64(bdata), dtype=dtype)
+
+    shape = v.get("shape")
+    if shape is not None:
+        if isinstance(shape, str):
+            shape = [int(n) for n in shape.split(",") if n.strip()]
+        arr = arr.reshape(shape)
+
+    return arr
+
+
+def convert_from_base64(obj):
+    """
+    Convert the plotly.js typed array specs of a figure dict, in place, to
+    read-only numpy arrays
+
+    Parameters
+    ----------
+    obj: dict or list
+        Figure dict, or part of one
+    """
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if is_typed_array_spec(value):
+                obj[key] = from_typed_array_spec(value)
+            elif type(value) not in _scalar_types:
+                convert_from_base64(value)
+    elif isinstance(obj, list):
+        for i, value in enumerate(obj):
+            if is_typed_array_spec(value):
+                obj[i] = from_typed_array_spec(value)
+            elif type(value) not in _scalar_types:
+                convert_from_base64(value)
 
 
 def cumsum(x):
@@ -0,0 +1,147 @@
+"""
+Benchmarks of figure JSON serialization
+
+Run from the root of the repository with:
+
+    $ python benchmarks/bench_json.py
+"""
+import json
+import re
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import plotly.graph_objects as go
+import plotly.io as pio
+from _plotly_utils.utils import PlotlyJSONEncoder
+from plotly.io._json import (
+    _datetime_values_to_isoformat,
+    _safe,
+    _swap_orjson,
+    clean_to_json_compatible,
+)
+
+
+def text_figure(n=200000):
+    labels = [
+        "<b>point {i}</b><br>https://plotly.com/{i}".format(i=i) for i in range(n)
+    ]
+    return go.Figure(
+        go.Scattergl(
+            x=np.arange(n),
+            y=np.random.rand(n),
+            text=labels,
+            hovertext=labels,
+            customdata=labels,
+        )
+    )
+
+
+def numeric_figure(n=1000000):
+    return go.Figure(go.Scattergl(x=np.arange(n), y=np.random.rand(n)))
+
+
+# Single-pass alternatives to _safe, kept for comparison
+_translate_table = str.maketrans(dict(_swap_orjson))
+_unsafe_re = re.compile("|".join(re.escape(c) for c, _ in _swap_orjson))
+_swap_dict = dict(_swap_orjson)
+
+
+def _safe_translate(json_str):
+    return json_str.translate(_translate_table)
+
+
+def _safe_re(json_str):
+    return _unsafe_re.sub(lambda m: _swap_dict[m.group()], json_str)
+
+
+def annotated_figure(n=20000):
+    return go.Figure(
+        go.Scatter(x=np.arange(n), y=np.random.rand(n)),
+        layout=dict(
+            annotations=[
+                dict(x=i, y=0.5, text="<b>{i}</b>".format(i=i), showarrow=False)
+                for i in range(n)
+            ],
+            shapes=[
+                dict(type="rect", x0=i, x1=i + 0.5, y0=0, y1=1, line=dict(color="red"))
+                for i in range(n)
+            ],
+        ),
+    )
+
+
+def timed(fn, repeat=5):
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def bench_safe():
+    for name, fig in [("text", text_figure()), ("numeric", numeric_figure())]:
+        # Unescaped JSON, as produced by the encoders before calling _safe
+        json_str = json.dumps(
+            fig.to_plotly_json(), cls=PlotlyJSONEncoder, separators=(",", ":")
+        )
+        print(
+            "{name} figure, {size:.1f} MB of JSON".format(
+                name=name, size=len(json_str) / 1e6
+            )
+        )
+        for label, fn in [
+            ("_safe (str.replace)", lambda: _safe(json_str, _swap_orjson)),
+            ("str.translate", lambda: _safe_translate(json_str)),
+            ("re.sub", lambda: _safe_re(json_str)),
+        ]:
+            print("  {label:<24}{t:8.4f}s".format(label=label, t=timed(fn)))
+
+
+def bench_to_json():
+    fig = text_figure()
+    for engine in ["json", "orjson"]:
+        try:
+            t = timed(lambda: pio.to_json(fig, engine=engine), repeat=3)
+        except ValueError:
+            continue
+        print("to_json text figure, {engine:<16}{t:8.4f}s".format(engine=engine, t=t))
+
+
+def bench_clean():
+    fig_dict = annotated_figure().to_plotly_json()
+    modules = {
+        "sage_all": None,
+        "np": np,
+        "pd": pd,
+        "image": None,
+    }
+    n = len(fig_dict["layout"]["annotations"])
+    t = timed(
+        lambda: clean_to_json_compatible(
+            fig_dict, numpy_allowed=True, datetime_allowed=True, modules=modules
+        ),
+        repeat=3,
+    )
+    print("clean_to_json_compatible, {n} annotations {t:8.4f}s".format(n=n, t=t))
+
+
+def bench_datetime(n=1000000):
+    values = pd.Series(
+        pd.date_range("2020-01-01", periods=n, freq="1500ms", tz="US/Eastern")
+    )
+
+    def isoformat_loop():
+        # Previous implementation, through datetime objects
+        return [d.isoformat() for d in values.dt.to_pydatetime().tolist()]
+
+    for label, fn in [
+        ("isoformat loop", isoformat_loop),
+        ("vectorized", lambda: _datetime_values_to_isoformat(values, np, pd)),
+    ]:
+        t = timed(fn, repeat=3)
+        print("{n} datetimes, {label:<16}{t:8.4f}s".format(n=n, label=label, t=t))
+
+
+if __name__ == "__main__":
+    bench_safe()
+    bench_to_json()
+    bench_clean()
+    bench_datetime()
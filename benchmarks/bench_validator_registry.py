@@ -0,0 +1,93 @@
+"""
+Cold start benchmarks of the validator registry
+
+Run from the root of the repository with:
+
+    $ python benchmarks/bench_validator_registry.py
+
+Each sample runs a fresh Python process that imports plotly.graph_objects
+and builds and serializes a first figure. The 'registry' samples build the
+validators from plotly/validators/_validators.jsonl, as plotly does by
+default, while the 'modules' samples disable the registry so that every
+validator is imported from its generated module, as plotly did before the
+registry was introduced.
+
+The first figure is timed after the modules that both code paths share
+have been imported, since importing them takes the same time with and
+without the registry.
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+_child_source = """
+import time
+
+import plotly.graph_objects as go
+import plotly.io, plotly.offline, plotly.basedatatypes, plotly.graph_objs._figure
+from plotly.validator_cache import ValidatorCache
+
+if {disable_registry}:
+    ValidatorCache._registry_index = {{}}
+
+start = time.perf_counter()
+fig = go.Figure(
+    [
+        go.Scatter(x=[1, 2, 3], y=[1, 3, 2], marker=dict(color="red", size=8)),
+        go.Bar(x=[1, 2, 3], y=[2, 1, 3], marker=dict(line=dict(width=1))),
+        go.Heatmap(z=[[1, 2], [3, 4]], colorbar=dict(title="z"), xaxis="x2"),
+    ],
+    layout=dict(
+        title="Title",
+        xaxis=dict(range=[0, 4], domain=[0, 0.45]),
+        xaxis2=dict(domain=[0.55, 1]),
+        legend=dict(orientation="h"),
+        annotations=[dict(text="Note", x=1, y=1, showarrow=False)],
+    ),
+)
+fig.to_json()
+end = time.perf_counter()
+print(end - start)
+"""
+
+
+def _run_child(disable_registry, env):
+    out = subprocess.run(
+        [sys.executable, "-c", _child_source.format(disable_registry=disable_registry)],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(out)
+
+
+def bench_cold_start(repeat=20):
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.getcwd()] + [p for p in [env.get("PYTHONPATH")] if p]
+    )
+
+    # Write bytecode caches before sampling, then alternate between the two
+    # code paths so that both see the same system load
+    samples = {True: [], False: []}
+    for disable_registry in samples:
+        _run_child(disable_registry, env)
+    for _ in range(repeat):
+        for disable_registry in samples:
+            samples[disable_registry].append(_run_child(disable_registry, env))
+
+    for disable_registry, times in samples.items():
+        print(
+            "{name}: first figure {figure:.3f}s (median of {repeat})".format(
+                name="modules" if disable_registry else "registry",
+                figure=statistics.median(times),
+                repeat=repeat,
+            )
+        )
+
+
+if __name__ == "__main__":
+    bench_cold_start()
@@ -0,0 +1,38 @@
+"""
+Benchmarks of the validator cache warmup
+
+Run from the root of the repository with:
+
+    $ python benchmarks/bench_validator_warmup.py
+
+The first warmup of a process imports the graph_objs modules and constructs
+the validators. The second warmup, after clearing the validator cache, only
+constructs the validators, which is the most that a persistent validator
+cache could save, since restoring validators imports the same modules.
+"""
+import time
+
+from plotly.validator_cache import ValidatorCache, warmup
+
+
+def bench_warmup(trace_types=None):
+    start = time.perf_counter()
+    warmup(trace_types=trace_types)
+    first = time.perf_counter() - start
+    n = len(ValidatorCache._cache)
+
+    ValidatorCache._cache.clear()
+    start = time.perf_counter()
+    warmup(trace_types=trace_types)
+    second = time.perf_counter() - start
+
+    print(
+        "warmup({trace_types}): {n} validators, first {first:.2f}s, "
+        "validators only {second:.2f}s".format(
+            trace_types=trace_types, n=n, first=first, second=second
+        )
+    )
+
+
+if __name__ == "__main__":
+    bench_warmup()
@@ -23,6 +23,7 @@ from codegen.utils import (
 from codegen.validators import (
     write_validator_py,
     write_data_validator_py,
+    write_validator_registry,
     get_data_validator_instance,
 )
 
@@ -184,6 +185,13 @@ def perform_codegen():
     # ### Data (traces) validator ###
     write_data_validator_py(outdir, base_traces_node)
 
+    # ### Validator registry ###
+    # Compact form of the validator params that is used to construct
+    # validators at runtime without importing the modules written above
+    write_validator_registry(
+        outdir, all_layout_nodes + all_trace_nodes + all_frame_nodes, base_traces_node
+    )
+
     # Alls
     # ----
     alls = {}
@@ -1,3 +1,5 @@
+import json
+import os
 import os.path as opath
 from io import StringIO
 
@@ -265,3 +267,176 @@ def write_data_validator_py(outdir, base_trace_node: TraceNode):
     # filepath = opath.join(outdir, "validators", "__init__.py")
     filepath = opath.join(outdir, "validators", "_data.py")
     write_source_py(source, filepath, leading_newlines=2)
+
+
+def get_validator_registry_key(node: PlotlyNode):
+    """
+    Registry key of a datatype PlotlyNode. This is the path of the node's
+    Python property (e.g. 'layout.annotations' rather than
+    'layout.annotation')
+
+    Parameters
+    ----------
+    node : PlotlyNode
+
+    Returns
+    -------
+    str
+    """
+    if node.parent_path_str:
+        return node.parent_path_str + "." + node.name_property
+    else:
+        return node.name_property
+
+
+def build_validator_registry_entry(node: PlotlyNode):
+    """
+    Build the compact validator registry entry for a datatype PlotlyNode
+
+    The entry holds the name of the validator's superclass in
+    _plotly_utils.basevalidators along with the constructor params that
+    the generated validator class would pass to it. The plotly_name and
+    parent_name params are omitted because they are recovered from the
+    registry key at runtime, and compound data_docs are omitted because
+    they are only needed to build error messages.
+
+    Parameters
+    ----------
+    node : PlotlyNode
+        The datatype node (node.is_datatype must evaluate to true)
+
+    Returns
+    -------
+    dict
+        Dict with 'superclass' and 'params' keys, or None if the node's
+        validator superclass is not defined in _plotly_utils
+    """
+    assert node.is_datatype
+
+    validator_parts = node.name_base_validator.split(".")
+    if validator_parts[0] != "_plotly_utils":
+        return None
+
+    params = {
+        prop: eval(repr_val)
+        for prop, repr_val in node.get_validator_params().items()
+        if prop not in ("plotly_name", "parent_name", "data_docs")
+    }
+
+    return {"superclass": validator_parts[-1], "params": params}
+
+
+def build_validator_registry(nodes, base_trace_node: TraceNode):
+    """
+    Build the validator registry for all datatype nodes
+
+    Parameters
+    ----------
+    nodes : list of PlotlyNode
+        All trace, layout, and frame datatype nodes
+    base_trace_node : TraceNode
+        PlotlyNode that is the parent of all of the individual trace nodes
+
+    Returns
+    -------
+    dict
+        Mapping from registry key (e.g. 'scatter.marker.color') to registry
+        entry
+    """
+    # ### Data (traces) validator ###
+    data_params = build_data_validator_params(base_trace_node)
+    data_entry = {
+        "superclass": "BaseDataValidator",
+        "params": {"class_strs_map": eval(data_params["class_strs_map"])},
+    }
+    registry = {"data": data_entry}
+
+    deferred_nodes = []
+    for node in nodes:
+        if node.is_mapped:
+            # No validator for mapped nodes (see write_validator_py)
+            continue
+
+        entry = build_validator_registry_entry(node)
+        if entry is None:
+            deferred_nodes.append(node)
+        else:
+            registry[get_validator_registry_key(node)] = entry
+
+    # Nodes whose validators subclass other generated validators
+    # (e.g. frame.data -> plotly.validators.DataValidator) reuse the entry
+    # of the root-level validator they extend
+    for node in deferred_nodes:
+        root_name = node.name_base_validator.split(".")[-1]
+        root_prop = root_name[: -len("Validator")].lower()
+        registry[get_validator_registry_key(node)] = registry[root_prop]
+
+    return registry
+
+
+def serialize_validator_registry(registry):
+    """
+    Serialize the validator registry in its indexed form
+
+    The entries are grouped by parent path, and the entries of each parent
+    path are written as a single JSON line. The first line is a JSON index
+    that maps each parent path to the offset and length in bytes of its
+    line, relative to the end of the index line. This way the entries of a
+    parent path are only decoded when one of its properties is first used.
+
+    Parameters
+    ----------
+    registry : dict
+        Mapping from registry key (e.g. 'scatter.marker.color') to registry
+        entry, as returned by build_validator_registry
+
+    Returns
+    -------
+    bytes
+    """
+    grouped = {}
+    for key, entry in registry.items():
+        parent_path, _, prop_name = key.rpartition(".")
+        grouped.setdefault(parent_path, {})[prop_name] = entry
+
+    index = {}
+    lines = []
+    offset = 0
+    for parent_path in sorted(grouped):
+        line = (
+            json.dumps(grouped[parent_path], sort_keys=True, separators=(",", ":"))
+            + "\n"
+        ).encode("utf-8")
+        index[parent_path] = [offset, len(line)]
+        lines.append(line)
+        offset += len(line)
+
+    index_line = (
+        json.dumps(index, sort_keys=True, separators=(",", ":")) + "\n"
+    ).encode("utf-8")
+    return index_line + b"".join(lines)
+
+
+def write_validator_registry(outdir, nodes, base_trace_node: TraceNode):
+    """
+    Build the validator registry and write it to
+    plotly/validators/_validators.jsonl
+
+    Parameters
+    ----------
+    outdir : str
+        Root outdir in which the validators package should reside
+    nodes : list of PlotlyNode
+        All trace, layout, and frame datatype nodes
+    base_trace_node : TraceNode
+        PlotlyNode that is the parent of all of the individual trace nodes
+    Returns
+    -------
+    None
+    """
+    registry = build_validator_registry(nodes, base_trace_node)
+
+    filepath = opath.join(outdir, "validators", "_validators.jsonl")
+    os.makedirs(opath.dirname(filepath), exist_ok=True)
+    with open(filepath, "wb") as f:
+        f.write(serialize_validator_registry(registry))
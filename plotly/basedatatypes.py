@@ -18,6 +18,10 @@ from _plotly_utils.utils import (
     convert_to_base64,
 )
 from _plotly_utils.exceptions import PlotlyKeyError
+from _plotly_utils.basevalidators import (
+    config as _validator_config,
+    is_typed_array_spec,
+)
 from .optional_imports import get_module
 
 from . import shapeannotation
@@ -29,6 +33,90 @@ from . import _subplots
 Undefined = object()
 
 
+# Types of property values that are immutable, and so never need to be copied
+_immutable_prop_types = frozenset([type(None), bool, int, float, complex, str, bytes])
+
+
+def _deepcopy_props(props):
+    """
+    Deep copy a properties dict, or a list of properties dicts.
+
+    This is equivalent to deepcopy, except that scalars are returned
+    without going through the deepcopy machinery and read-only numpy
+    arrays are shared with the copy instead of being duplicated. Validated
+    arrays are read-only and are never modified in place, so the copy and
+    the original can safely share them.
+    """
+    np = get_module("numpy", should_load=False)
+    return _deepcopy_prop_value(props, np.ndarray if np else None)
+
+
+def _deepcopy_prop_value(v, ndarray_type):
+    typ = type(v)
+    if typ in _immutable_prop_types:
+        return v
+    elif typ is dict:
+        return {k: _deepcopy_prop_value(el, ndarray_type) for k, el in v.items()}
+    elif typ is list or typ is tuple:
+        res = [
+            (
+                el
+                if type(el) in _immutable_prop_types
+                else _deepcopy_prop_value(el, ndarray_type)
+            )
+            for el in v
+        ]
+        return res if typ is list else tuple(res)
+    elif (
+        ndarray_type is not None
+        and isinstance(v, ndarray_type)
+        and not v.flags["WRITEABLE"]
+    ):
+        return v
+    else:
+        return deepcopy(v)
+
+
+def _is_mutable_value(val, input_val, validator=None):
+    """
+    Return whether the value val of a property, coerced by validator from
+    the value input_val supplied by the user, may be modified in place
+    without going through the property setters.
+
+    This is the case for dicts and lists that are stored as-is (e.g. by
+    AnyValidator), for lists whose nested dicts or lists are returned by the
+    property getter, and for numpy arrays that share their memory with an
+    array owned by the user (e.g. when copy_arrays="never"). Typed array
+    specs are considered immutable, like the arrays they encode.
+    """
+    if isinstance(val, dict):
+        return not is_typed_array_spec(val)
+    elif isinstance(val, list):
+        if val is input_val:
+            return True
+        elif not val or not isinstance(val[0], (dict, list)):
+            return False
+        presented = validator.present(val) if validator is not None else val
+        return isinstance(presented, (dict, list)) or (
+            isinstance(presented, tuple)
+            and len(presented) > 0
+            and isinstance(presented[0], (dict, list))
+        )
+
+    np = get_module("numpy", should_load=False)
+    if np is None or not isinstance(val, np.ndarray):
+        return False
+    elif val is input_val:
+        return True
+
+    # Arrays decoded from typed array specs are views of immutable bytes,
+    # other views may be modified through the array they were created from
+    base = val
+    while isinstance(base, np.ndarray) and base.base is not None:
+        base = base.base
+    return base is not val and not isinstance(base, bytes)
+
+
 def _len_dict_item(item):
     """
     Because a parsed dict path is a tuple containings strings or integers, to
@@ -409,7 +497,13 @@ class BaseFigure(object):
     # Constructor
     # -----------
     def __init__(
-        self, data=None, layout_plotly=None, frames=None, skip_invalid=False, **kwargs
+        self,
+        data=None,
+        layout_plotly=None,
+        frames=None,
+        skip_invalid=False,
+        validate=True,
+        **kwargs,
     ):
         """
         Construct a BaseFigure object
@@ -449,18 +543,39 @@ class BaseFigure(object):
             skipped silently. If False (default) invalid properties in the
             figure specification will result in a ValueError
 
+        validate: bool
+            If False, property values are stored without being validated.
+            This speeds up the construction of figures from trusted
+            specifications that have already been validated (e.g. the output
+            of `fig.to_dict()`). Default True. See also
+            `plotly.io.validation`.
+
         Raises
         ------
         ValueError
             if a property in the specification of data, layout, or frames
             is invalid AND skip_invalid is False
         """
-        from .validators import DataValidator, LayoutValidator, FramesValidator
+        from .validator_cache import ValidatorCache
 
         super(BaseFigure, self).__init__()
 
         # Initialize validation
-        self._validate = kwargs.pop("_validate", True)
+        self._validate = kwargs.pop("_validate", True) and validate
+
+        # Revision
+        # --------
+        # Counter that is incremented whenever the properties of the figure
+        # change, and the cache of the last JSON representation of the
+        # figure computed by plotly.io.to_json, as a
+        # (to_json options, revision, JSON string) tuple
+        self._revision = 0
+        self._json_cache = None
+
+        # Whether any property of the figure holds a value that may be
+        # modified in place, without changing the revision of the figure
+        # (see _is_mutable_value)
+        self._has_mutable_values = False
 
         # Assign layout_plotly to layout
         # ------------------------------
@@ -479,13 +594,32 @@ class BaseFigure(object):
 
         # Handle case where data is a Figure or Figure-like dict
         # ------------------------------------------------------
+        # Whether to validate the imported data, layout, and frames
+        validate_import = self._validate
+
+        # Whether any property of the figure was stored without being
+        # validated, because validation was disabled when it was set
+        self._has_unvalidated_props = not validate_import
+
         if isinstance(data, BaseFigure):
             # Bring over subplot fields
             self._grid_str = data._grid_str
             self._grid_ref = data._grid_ref
 
-            # Extract data, layout, and frames
-            data, layout, frames = data.data, data.layout, data.frames
+            # Extract data, layout, and frames. If all the properties of
+            # the input figure were validated, they are imported without
+            # validating them again. The imported objects copy the property
+            # dicts, sharing scalars and read-only arrays with the input
+            # figure.
+            if not data._has_unvalidated_props:
+                validate_import = False
+                self._has_unvalidated_props = False
+            self._has_mutable_values = data._has_mutable_values
+            data, layout, frames = (
+                [dict(trace_props) for trace_props in data._data],
+                data._layout,
+                data.frames,
+            )
 
         elif isinstance(data, dict) and (
             "data" in data or "layout" in data or "frames" in data
@@ -507,20 +641,26 @@ class BaseFigure(object):
         # ### Construct data validator ###
         # This is the validator that handles importing sequences of trace
         # objects
-        self._data_validator = DataValidator(set_uid=self._set_trace_uid)
+        self._data_validator = ValidatorCache.build_validator(
+            "", "data", set_uid=self._set_trace_uid
+        )
 
         # ### Import traces ###
         data = self._data_validator.validate_coerce(
-            data, skip_invalid=skip_invalid, _validate=self._validate
+            data, skip_invalid=skip_invalid, _validate=validate_import
         )
 
         # ### Save tuple of trace objects ###
         self._data_objs = data
 
-        # ### Import clone of trace properties ###
+        # ### Import trace properties ###
         # The _data property is a list of dicts containing the properties
-        # explicitly set by the user for each trace.
-        self._data = [deepcopy(trace._props) for trace in data]
+        # explicitly set by the user for each trace. The trace objects were
+        # just constructed by the data validator, so their properties dicts
+        # are adopted rather than copied.
+        self._data = [trace._take_orphan_props() for trace in data]
+        if any(trace._has_mutable_values for trace in data):
+            self._has_mutable_values = True
 
         # ### Create data defaults ###
         # _data_defaults is a tuple of dicts, one for each trace. When
@@ -550,15 +690,17 @@ class BaseFigure(object):
         # ------
         # ### Construct layout validator ###
         # This is the validator that handles importing Layout objects
-        self._layout_validator = LayoutValidator()
+        self._layout_validator = ValidatorCache.get_validator("", "layout")
 
         # ### Import Layout ###
         self._layout_obj = self._layout_validator.validate_coerce(
-            layout, skip_invalid=skip_invalid, _validate=self._validate
+            layout, skip_invalid=skip_invalid, _validate=validate_import
         )
 
-        # ### Import clone of layout properties ###
-        self._layout = deepcopy(self._layout_obj._props)
+        # ### Import layout properties ###
+        self._layout = self._layout_obj._take_orphan_props()
+        if self._layout_obj._has_mutable_values:
+            self._has_mutable_values = True
 
         # ### Initialize layout defaults dict ###
         self._layout_defaults = {}
@@ -585,13 +727,18 @@ class BaseFigure(object):
         # ### Construct frames validator ###
         # This is the validator that handles importing sequences of frame
         # objects
-        self._frames_validator = FramesValidator()
+        self._frames_validator = ValidatorCache.get_validator("", "frames")
 
         # ### Import frames ###
         self._frame_objs = self._frames_validator.validate_coerce(
             frames, skip_invalid=skip_invalid
         )
 
+        # ### Validate future updates of imported objects ###
+        if validate_import != self.__validate:
+            for obj in itertools.chain(self._data_objs, [self._layout_obj]):
+                obj._validate = self.__validate
+
         # Note: Because frames are not currently supported in the widget
         # context, we don't need to follow the pattern above and create
         # _frames and _frame_defaults properties and then reparent the
@@ -645,6 +792,25 @@ class BaseFigure(object):
                 )
                 raise type_err
 
+    def clone(self):
+        """
+        Create a copy of this figure
+
+        The properties of this figure are copied without being validated
+        again, and the copy validates future updates only if this figure
+        does. Scalar values and read-only numpy arrays (e.g. validated data
+        arrays) are shared between the two figures, so this is typically
+        much faster than `copy.deepcopy(fig)`. Constructing a figure from
+        another figure (e.g. `go.Figure(fig)`) is equivalent when the other
+        figure was validated, and validates its properties otherwise.
+
+        Returns
+        -------
+        BaseFigure
+            A new figure of the same type as this figure
+        """
+        return self.__class__(self, validate=self.__validate)
+
     # Magic Methods
     # -------------
     def __reduce__(self):
@@ -697,7 +863,7 @@ class BaseFigure(object):
             for p in prop[:-1]:
                 res = res[p]
 
-            res._validate = self._validate
+            res._validate = self.__validate
 
             res[prop[-1]] = value
 
@@ -1001,6 +1167,8 @@ class BaseFigure(object):
 
             raise ValueError(err_msg)
 
+        self._bump_revision()
+
         # Remove traces
         # -------------
         remove_uids = set(orig_uids).difference(set(new_uids))
@@ -1011,9 +1179,11 @@ class BaseFigure(object):
             if id(trace) in remove_uids:
                 delete_inds.append(i)
 
-                # Unparent trace object to be removed
+                # Unparent trace object to be removed. The trace's
+                # properties dict is removed from _data below, so it is
+                # handed over to the trace rather than copied
                 old_trace = self.data[i]
-                old_trace._orphan_props.update(deepcopy(old_trace._props))
+                old_trace._orphan_props.update(old_trace._props)
                 old_trace._parent = None
                 old_trace._trace_ind = None
 
@@ -1746,12 +1916,19 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
                         self._data[trace_ind], key_path_str, trace_v
                     )
 
+                    # Values set through restyle are stored as-is
+                    if val_changed and _is_mutable_value(trace_v, trace_v):
+                        self._has_mutable_values = True
+
                     # Update any_vals_changed status
                     any_vals_changed = any_vals_changed or val_changed
 
             if any_vals_changed:
                 restyle_changes[key_path_str] = v
 
+        if restyle_changes:
+            self._bump_revision()
+
         return restyle_changes
 
     def _restyle_child(self, child, key_path_str, val):
@@ -1777,6 +1954,8 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
         None
         """
 
+        self._bump_revision()
+
         # Compute trace index
         # -------------------
         trace_index = child._trace_ind
@@ -2246,8 +2425,10 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
                 )
             )
 
-        # Make deep copy of trace data (Optimize later if needed)
-        new_traces_data = [deepcopy(trace._props) for trace in data]
+        # Adopt the properties of the newly constructed trace objects
+        new_traces_data = [trace._take_orphan_props() for trace in data]
+        if any(trace._has_mutable_values for trace in data):
+            self._has_mutable_values = True
 
         # Update trace parent
         for trace in data:
@@ -2256,6 +2437,7 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
 
         # Update python side
         #  Use extend instead of assignment so we don't trigger serialization
+        self._bump_revision()
         self._data.extend(new_traces_data)
         self._data_defaults = self._data_defaults + [{} for _ in data]
         self._data_objs = self._data_objs + data
@@ -2519,6 +2701,7 @@ Please use the add_trace method with the row and col parameters.
         if self._layout_obj._props.get("template", None) is None:
             if pio.templates.default is not None:
                 # Assume default template is already validated
+                has_unvalidated_props = self._has_unvalidated_props
                 if self._allow_disable_validation:
                     self._layout_obj._validate = False
                 try:
@@ -2531,7 +2714,8 @@ Please use the add_trace method with the row and col parameters.
                         template_object = pio.templates[pio.templates.default]
                     self._layout_obj.template = template_object
                 finally:
-                    self._layout_obj._validate = self._validate
+                    self._layout_obj._validate = self.__validate
+                    self._has_unvalidated_props = has_unvalidated_props
 
     @property
     def layout(self):
@@ -2550,17 +2734,22 @@ Please use the add_trace method with the row and col parameters.
         # Validate new layout
         # -------------------
         new_layout = self._layout_validator.validate_coerce(new_layout)
-        new_layout_data = deepcopy(new_layout._props)
+        new_layout_data = new_layout._take_orphan_props()
+        if new_layout._has_mutable_values:
+            self._has_mutable_values = True
 
         # Unparent current layout
         # -----------------------
+        # The current layout properties dict is replaced below, so it is
+        # handed over to the layout object rather than copied
         if self._layout_obj:
-            old_layout_data = deepcopy(self._layout_obj._props)
+            old_layout_data = self._layout_obj._props
             self._layout_obj._orphan_props.update(old_layout_data)
             self._layout_obj._parent = None
 
         # Parent new layout
         # -----------------
+        self._bump_revision()
         self._layout = new_layout_data
         new_layout._parent = self
         new_layout._orphan_props.clear()
@@ -2658,6 +2847,13 @@ Invalid property path '{key_path_str}' for layout
             if val_changed:
                 relayout_changes[key_path_str] = v
 
+                # Values set through relayout are stored as-is
+                if _is_mutable_value(v, v):
+                    self._has_mutable_values = True
+
+        if relayout_changes:
+            self._bump_revision()
+
         return relayout_changes
 
     @staticmethod
@@ -2704,6 +2900,8 @@ Invalid property path '{key_path_str}' for layout
         # --------------
         assert child is self.layout
 
+        self._bump_revision()
+
         # Not in batch mode
         # -------------
         # Dispatch change callbacks and send relayout message
@@ -2863,6 +3061,35 @@ Invalid property path '{key_path_str}' for layout
 
         # Validate frames
         self._frame_objs = self._frames_validator.validate_coerce(new_frames)
+        self._bump_revision()
+
+    # Validation
+    # ----------
+    @property
+    def _validate(self):
+        """
+        Whether property values assigned to this figure are validated.
+        Validation may be disabled for this figure (e.g. with the validate
+        constructor argument), or globally with plotly.io.config.validate
+        """
+        return self.__validate and _validator_config.validate
+
+    @_validate.setter
+    def _validate(self, val):
+        self.__validate = val
+
+    # Revision
+    # --------
+    def _bump_revision(self):
+        """
+        Record that the properties of the figure changed, so that the
+        cached JSON representations of the figure are recomputed
+
+        Returns
+        -------
+        None
+        """
+        self._revision += 1
 
     # Update
     # ------
@@ -3060,11 +3287,15 @@ Invalid property path '{key_path_str}' for layout
                 ) = self._build_update_params_from_batch()
 
                 # ### Call plotly_update ###
+                # The batched values were already checked for mutable values
+                # by the property setters
+                has_mutable_values = self._has_mutable_values
                 self.plotly_update(
                     restyle_data=restyle_data,
                     relayout_data=relayout_data,
                     trace_indexes=trace_indexes,
                 )
+                self._has_mutable_values = has_mutable_values
 
                 # ### Clear out saved batch edits ###
                 self._batch_layout_edits.clear()
@@ -3236,11 +3467,15 @@ Invalid property path '{key_path_str}' for layout
             trace_indexes,
         ) = self._build_update_params_from_batch()
 
+        # The batched values were already checked for mutable values by the
+        # property setters
+        has_mutable_values = self._has_mutable_values
         (
             restyle_changes,
             relayout_changes,
             trace_indexes,
         ) = self._perform_plotly_update(restyle_data, relayout_data, trace_indexes)
+        self._has_mutable_values = has_mutable_values
 
         # Convert style / trace_indexes into animate form
         # -----------------------------------------------
@@ -3283,36 +3518,63 @@ Invalid property path '{key_path_str}' for layout
 
     # Exports
     # -------
-    def to_dict(self):
+    def to_dict(self, skipped_keys=None):
         """
         Convert figure to a dictionary
 
         Note: the dictionary includes the properties explicitly set by the
         user, it does not include default values of unspecified properties
 
+        Parameters
+        ----------
+        skipped_keys: collection of str or None (default None)
+            Names of the properties whose numpy arrays are not converted to
+            the plotly.js typed array spec, at any level of the figure. If
+            None, _plotly_utils.utils.typed_array_skipped_keys is used.
+
+        Returns
+        -------
+        dict
+        """
+        return self._to_dict(skipped_keys=skipped_keys)
+
+    def _to_dict(self, convert_arrays=True, skipped_keys=None):
+        """
+        Convert figure to a dictionary, optionally leaving its arrays
+        as they are instead of converting them to the typed array spec
+
+        Parameters
+        ----------
+        convert_arrays: bool (default True)
+            True if numpy arrays should be converted to the plotly.js typed
+            array spec, as done by to_dict
+        skipped_keys: collection of str or None (default None)
+            See to_dict
+
         Returns
         -------
         dict
         """
         # Handle data
         # -----------
-        data = deepcopy(self._data)
+        data = _deepcopy_props(self._data)
 
         # Handle layout
         # -------------
-        layout = deepcopy(self._layout)
+        layout = _deepcopy_props(self._layout)
 
         # Handle frames
         # -------------
         # Frame key is only added if there are any frames
         res = {"data": data, "layout": layout}
-        frames = deepcopy([frame._props for frame in self._frame_objs])
+        frames = _deepcopy_props([frame._props for frame in self._frame_objs])
 
         if frames:
             res["frames"] = frames
 
         # Add base64 conversion before sending to the front-end
-        convert_to_base64(res)
+        if convert_arrays:
+            convert_to_base64(res, skipped_keys=skipped_keys)
 
         return res
 
@@ -3437,6 +3699,29 @@ Invalid property path '{key_path_str}' for layout
             If not specified, the default encoder is set to the current value of
             plotly.io.json.config.default_encoder.
 
+        array_encoding: str or None (default "b64")
+            How the numpy arrays of the figure are encoded. One of:
+              - "b64" for base64 encoded typed arrays, which plotly.js decodes
+              - None for plain JSON lists
+
+        float_precision: str (default "float64")
+            Precision of base64 encoded float arrays. If "float32", float64
+            arrays are converted to float32, which halves the size of their
+            encoding at the cost of precision beyond about 7 significant digits.
+
+        max_decimals: int or None (default None)
+            If not None, base64 encoded float arrays are rounded to this number
+            of decimals.
+
+        skipped_keys: collection of str or None (default None)
+            Names of the properties whose arrays are not base64 encoded, at
+            any level of the figure. If None, the values of the "geojson",
+            "layer", "layers" and "range" properties are not encoded.
+
+        workers: int or None (default None)
+            If greater than 1, the traces and frames of the figure are encoded
+            concurrently by a pool of this many threads.
+
         Returns
         -------
         str
@@ -3500,6 +3785,30 @@ Invalid property path '{key_path_str}' for layout
             If not specified, the default encoder is set to the current value of
             plotly.io.json.config.default_encoder.
 
+        array_encoding: str or None (default "b64")
+            How the numpy arrays of the figure are encoded. One of:
+              - "b64" for base64 encoded typed arrays, which plotly.js decodes
+              - None for plain JSON lists
+
+        float_precision: str (default "float64")
+            Precision of base64 encoded float arrays. If "float32", float64
+            arrays are converted to float32, which halves the size of their
+            encoding at the cost of precision beyond about 7 significant digits.
+
+        max_decimals: int or None (default None)
+            If not None, base64 encoded float arrays are rounded to this number
+            of decimals.
+
+        skipped_keys: collection of str or None (default None)
+            Names of the properties whose arrays are not base64 encoded, at
+            any level of the figure. If None, the values of the "geojson",
+            "layer", "layers" and "range" properties are not encoded.
+
+        compression: str or None (default "infer")
+            Compression of the written file. One of "gzip", "zstd" (which
+            requires the zstandard package), None, or "infer" to infer it from
+            a ".gz" or ".zst" file suffix.
+
         Returns
         -------
         None
@@ -3508,6 +3817,36 @@ Invalid property path '{key_path_str}' for layout
 
         return pio.write_json(self, *args, **kwargs)
 
+    def write_binary(self, *args, **kwargs):
+        """
+        Write a figure to a file in the plotly binary figure format, which
+        can be read back quickly with plotly.io.read_binary
+
+        Parameters
+        ----------
+        file: str or writeable
+            A string representing a local file path or a writeable object
+            opened in binary mode (e.g. an open file descriptor)
+
+        validate: bool (default True)
+            True if the figure should be validated before being written,
+            False otherwise.
+
+        remove_uids: bool (default True)
+            True if trace UIDs should be omitted from the file
+
+        engine: str (default None)
+            The JSON encoding engine to use for the skeleton of the figure.
+            See to_json for the supported engines.
+
+        Returns
+        -------
+        None
+        """
+        import plotly.io as pio
+
+        return pio.write_binary(self, *args, **kwargs)
+
     def to_html(self, *args, **kwargs):
         """
         Convert a figure to an HTML string representation.
@@ -3696,6 +4035,10 @@ Invalid property path '{key_path_str}' for layout
         div_id: str (default None)
             If provided, this is the value of the id attribute of the div tag. If None, the
             id attribute is a UUID.
+        compression: str or None (default "infer")
+            Compression of the written file. One of "gzip", "zstd" (which
+            requires the zstandard package), None, or "infer" to infer it from
+            a ".gz" or ".zst" file suffix.
 
         Returns
         -------
@@ -4302,6 +4645,13 @@ class BasePlotlyType(object):
         # parent and doesn't use this.
         self._orphan_props = {}
 
+        # ### _has_mutable_values ###
+        # Whether a property of the object, or of one of its descendants
+        # while they had no parent, holds a value that may be modified in
+        # place (see _is_mutable_value). Only set on objects without a
+        # parent, since the flag is recorded on the figure otherwise.
+        self._has_mutable_values = False
+
         # ### _parent ###
         # The parent of the object. May be another BasePlotlyType or it may
         # be a BaseFigure (as is the case for the Layout and Trace objects)
@@ -4316,13 +4666,18 @@ class BasePlotlyType(object):
         # ### Backing property for backward compatible _validator property ##
         self.__validators = None
 
-    # @property
-    # def _validate(self):
-    #     fig = self.figure
-    #     if fig is None:
-    #         return True
-    #     else:
-    #         return fig._validate
+    @property
+    def _validate(self):
+        """
+        Whether property values assigned to this object are validated.
+        Validation may be disabled for this object (e.g. with the _validate
+        constructor argument), or globally with plotly.io.config.validate
+        """
+        return self.__validate and _validator_config.validate
+
+    @_validate.setter
+    def _validate(self, val):
+        self.__validate = val
 
     def _get_validator(self, prop):
         from .validator_cache import ValidatorCache
@@ -4859,30 +5214,7 @@ class BasePlotlyType(object):
                 else:
                     self._set_prop(prop, value)
             else:
-                # Make sure properties dict is initialized
-                self._init_props()
-
-                if isinstance(value, BasePlotlyType):
-                    # Extract json from graph objects
-                    value = value.to_plotly_json()
-
-                # Check for list/tuple of graph objects
-                if (
-                    isinstance(value, (list, tuple))
-                    and value
-                    and isinstance(value[0], BasePlotlyType)
-                ):
-                    value = [
-                        v.to_plotly_json() if isinstance(v, BasePlotlyType) else v
-                        for v in value
-                    ]
-
-                self._props[prop] = value
-
-                # Remove any already constructed graph object so that it will be
-                # reconstructed on property access
-                self._compound_props.pop(prop, None)
-                self._compound_array_props.pop(prop, None)
+                self._set_unvalidated_prop(prop, value)
 
         # Handle non-scalar case
         # ----------------------
@@ -4895,7 +5227,7 @@ class BasePlotlyType(object):
             for p in prop[:-1]:
                 res = res[p]
 
-            res._validate = self._validate
+            res._validate = self.__validate
 
             res[prop[-1]] = value
 
@@ -5168,6 +5500,100 @@ class BasePlotlyType(object):
         """
         return self.parent and self.parent._in_batch_mode
 
+    def _take_orphan_props(self):
+        """
+        Hand over the properties dict of this orphan object to a new parent,
+        leaving the object with an empty orphan properties dict.
+
+        Validators don't copy every property value (e.g. the values of
+        `meta` or `customdata` lists), so the properties may be shared with
+        the input the object was constructed from. They are copied with
+        _deepcopy_props, which shares only immutable scalars and read-only
+        numpy arrays with the input.
+
+        Returns
+        -------
+        dict
+        """
+        props = _deepcopy_props(self._orphan_props)
+        self._orphan_props = {}
+        return props
+
+    def _set_unvalidated_prop(self, prop, val):
+        """
+        Set the value of a property without validating it. Used when
+        validation is disabled. As with validated properties, a value of
+        None removes the property.
+
+        Parameters
+        ----------
+        prop : str
+            Name of a property
+        val
+            The new property value
+
+        Returns
+        -------
+        Any
+            The assigned value
+        """
+        if val is Undefined:
+            return
+
+        # Make sure properties dict is initialized
+        self._init_props()
+
+        if isinstance(val, BasePlotlyType):
+            # Extract json from graph objects
+            val = val.to_plotly_json()
+
+        # Check for list/tuple of graph objects
+        if (
+            isinstance(val, (list, tuple))
+            and val
+            and isinstance(val[0], BasePlotlyType)
+        ):
+            val = [
+                v.to_plotly_json() if isinstance(v, BasePlotlyType) else v for v in val
+            ]
+
+        if val is None and prop not in self._props:
+            return val
+
+        # Set or remove the property if not in batch mode, as in _set_prop
+        if not self._in_batch_mode:
+            if val is None:
+                self._props.pop(prop)
+            else:
+                self._props[prop] = val
+
+        # Remove any already constructed graph object so that it will be
+        # reconstructed on property access
+        self._compound_props.pop(prop, None)
+        self._compound_array_props.pop(prop, None)
+
+        # Notify the figure, if any, that it holds unvalidated properties
+        figure = self.figure
+        if figure is not None:
+            figure._has_unvalidated_props = True
+            figure._bump_revision()
+
+        # Send property update message
+        self._send_prop_set(prop, val)
+
+        return val
+
+    def _record_mutable_values(self):
+        """
+        Record that a property of this object holds a value that may be
+        modified in place. The flag is set on the figure of the object or,
+        if the object does not belong to a figure, on its topmost parent.
+        """
+        obj = self
+        while isinstance(obj, BasePlotlyType) and obj._parent is not None:
+            obj = obj._parent
+        obj._has_mutable_values = True
+
     def _set_prop(self, prop, val):
         """
         Set the value of a simple property
@@ -5191,9 +5617,15 @@ class BasePlotlyType(object):
             # Do nothing
             return
 
+        # Validation disabled
+        # -------------------
+        if not self._validate:
+            return self._set_unvalidated_prop(prop, val)
+
         # Import value
         # ------------
         validator = self._get_validator(prop)
+        input_val = val
 
         try:
             val = validator.validate_coerce(val)
@@ -5229,6 +5661,9 @@ class BasePlotlyType(object):
                 if not self._in_batch_mode:
                     self._props[prop] = val
 
+                if _is_mutable_value(val, input_val, validator):
+                    self._record_mutable_values()
+
                 # Send property update message
                 self._send_prop_set(prop, val)
 
@@ -5257,21 +5692,34 @@ class BasePlotlyType(object):
             # Do nothing
             return
 
+        # Validation disabled
+        # -------------------
+        if not self._validate:
+            return self._set_unvalidated_prop(prop, val)
+
         # Import value
         # ------------
         validator = self._get_validator(prop)
         val = validator.validate_coerce(val, skip_invalid=self._skip_invalid)
 
-        # Save deep copies of current and new states
-        # ------------------------------------------
+        # Save current and new states
+        # ---------------------------
+        # Outside of batch mode, the current properties dict is replaced
+        # below, so it is handed over to the current object rather than
+        # copied. The new object was just constructed by the validator, so
+        # its properties dict is adopted.
         curr_val = self._compound_props.get(prop, None)
-        if curr_val is not None:
-            curr_dict_val = deepcopy(curr_val._props)
-        else:
+        if curr_val is None:
             curr_dict_val = None
+        elif self._in_batch_mode:
+            curr_dict_val = _deepcopy_props(curr_val._props)
+        else:
+            curr_dict_val = curr_val._props
 
         if val is not None:
-            new_dict_val = deepcopy(val._props)
+            new_dict_val = val._take_orphan_props()
+            if val._has_mutable_values:
+                self._record_mutable_values()
         else:
             new_dict_val = None
 
@@ -5331,21 +5779,31 @@ class BasePlotlyType(object):
             # Do nothing
             return
 
+        # Validation disabled
+        # -------------------
+        if not self._validate:
+            return self._set_unvalidated_prop(prop, val)
+
         # Import value
         # ------------
         validator = self._get_validator(prop)
         val = validator.validate_coerce(val, skip_invalid=self._skip_invalid)
 
-        # Save deep copies of current and new states
-        # ------------------------------------------
+        # Save current and new states
+        # ---------------------------
+        # See _set_compound_prop
         curr_val = self._compound_array_props.get(prop, None)
-        if curr_val is not None:
-            curr_dict_vals = [deepcopy(cv._props) for cv in curr_val]
-        else:
+        if curr_val is None:
             curr_dict_vals = None
+        elif self._in_batch_mode:
+            curr_dict_vals = [_deepcopy_props(cv._props) for cv in curr_val]
+        else:
+            curr_dict_vals = [cv._props for cv in curr_val]
 
         if val is not None:
-            new_dict_vals = [deepcopy(nv._props) for nv in val]
+            new_dict_vals = [nv._take_orphan_props() for nv in val]
+            if any(nv._has_mutable_values for nv in val):
+                self._record_mutable_values()
         else:
             new_dict_vals = None
 
@@ -5591,7 +6049,7 @@ on_change callbacks are not supported in this case.
         -------
         dict
         """
-        return deepcopy(self._props if self._props is not None else {})
+        return _deepcopy_props(self._props if self._props is not None else {})
 
     def to_json(self, *args, **kwargs):
         """
@@ -5856,8 +6314,9 @@ class BaseLayoutType(BaseLayoutHierarchyType):
         """
         prop = self._strip_subplot_suffix_of_1(prop)
         if prop != "_subplotid_props" and prop in self._subplotid_props:
-            validator = self._get_validator(prop)
-            return validator.present(self._compound_props[prop])
+            # Subplot objects are constructed on access if they were
+            # assigned without validation
+            return self[prop]
         else:
             return super(BaseLayoutHierarchyType, self).__getattribute__(prop)
 
@@ -1,9 +1,8 @@
-from copy import deepcopy
 import pathlib
 from traitlets import List, Dict, observe, Integer
 from plotly.io._renderers import display_jupyter_version_warnings
 
-from .basedatatypes import BaseFigure, BasePlotlyType
+from .basedatatypes import BaseFigure, BasePlotlyType, _deepcopy_props
 from .callbacks import BoxSelector, LassoSelector, InputDeviceState, Points
 from .serializers import custom_serializers
 import anywidget
@@ -733,8 +732,8 @@ class BaseFigureWidget(BaseFigure, anywidget.AnyWidget):
         # Widget layout and data need to be set here in case there are
         # changes made to the figure after the widget is created but before
         # the cell is run.
-        self._widget_layout = deepcopy(self._layout_obj._props)
-        self._widget_data = deepcopy(self._data)
+        self._widget_layout = _deepcopy_props(self._layout_obj._props)
+        self._widget_data = _deepcopy_props(self._data)
         return {
             "application/vnd.jupyter.widget-view+json": {
                 "version_major": 2,
@@ -632,6 +632,13 @@ class FigureWidget(BaseFigureWidget):
             skipped silently. If False (default) invalid properties in the
             figure specification will result in a ValueError
 
+        validate: bool
+            If False, property values are stored without being validated.
+            This speeds up the construction of figures from trusted
+            specifications that have already been validated (e.g. the output
+            of `fig.to_dict()`). Default True. See also
+            `plotly.io.validation`.
+
         Raises
         ------
         ValueError
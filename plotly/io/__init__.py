@@ -3,32 +3,52 @@ import sys
 from typing import TYPE_CHECKING
 
 if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._kaleido import to_image, write_image, full_figure_for_development
+    from ._kaleido import (
+        to_image,
+        write_image,
+        write_images,
+        full_figure_for_development,
+        to_image_async,
+        write_image_async,
+        full_figure_for_development_async,
+    )
     from . import orca, kaleido
     from . import json
     from ._json import to_json, from_json, read_json, write_json
+    from ._binary import read_binary, write_binary
     from ._templates import templates, to_templated
-    from ._html import to_html, write_html
+    from ._html import to_html, write_html, to_html_report, write_html_report
     from ._renderers import renderers, show
+    from ._config import config, validation
     from . import base_renderers
 
     __all__ = [
         "to_image",
         "write_image",
+        "write_images",
         "orca",
         "json",
         "to_json",
         "from_json",
         "read_json",
         "write_json",
+        "read_binary",
+        "write_binary",
         "templates",
         "to_templated",
         "to_html",
         "write_html",
+        "to_html_report",
+        "write_html_report",
         "renderers",
         "show",
+        "config",
+        "validation",
         "base_renderers",
         "full_figure_for_development",
+        "to_image_async",
+        "write_image_async",
+        "full_figure_for_development_async",
     ]
 else:
     __all__, __getattr__, __dir__ = relative_import(
@@ -37,17 +57,27 @@ else:
         [
             "._kaleido.to_image",
             "._kaleido.write_image",
+            "._kaleido.write_images",
             "._kaleido.full_figure_for_development",
+            "._kaleido.to_image_async",
+            "._kaleido.write_image_async",
+            "._kaleido.full_figure_for_development_async",
             "._json.to_json",
             "._json.from_json",
             "._json.read_json",
             "._json.write_json",
+            "._binary.read_binary",
+            "._binary.write_binary",
             "._templates.templates",
             "._templates.to_templated",
             "._html.to_html",
             "._html.write_html",
+            "._html.to_html_report",
+            "._html.write_html_report",
             "._renderers.renderers",
             "._renderers.show",
+            "._config.config",
+            "._config.validation",
         ],
     )
 
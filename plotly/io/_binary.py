@@ -0,0 +1,300 @@
+import struct
+from pathlib import Path
+
+from _plotly_utils.optional_imports import get_module
+from _plotly_utils.basevalidators import (
+    config as validator_config,
+    copy_to_readonly_numpy_array,
+    is_homogeneous_array,
+    is_typed_array_spec,
+)
+from _plotly_utils.utils import (
+    from_typed_array_spec,
+    is_skipped_key,
+    plotlyjsShortTypes,
+    plotlyjsTypedArrayDtypes,
+    to_typed_array,
+)
+from plotly.io._json import _fig_to_json_dict, from_json_plotly, to_json_plotly
+from plotly.io._utils import validate_coerce_output_type
+
+# Binary figure files start with a fixed size prefix holding the magic
+# bytes, the format version and the size of the JSON skeleton that follows.
+# The skeleton is the figure dict with each typed array replaced by a
+# reference of the form {"__bref__": offset, "dtype": "f8", "shape": [...]}
+# to the array section, which starts at the first aligned position after the
+# skeleton. Arrays are stored uncompressed and little-endian, at aligned
+# offsets from the start of the array section, so that they can be used in
+# place from a memory map.
+_magic = b"PLOTLYBF"
+_version = 1
+_prefix = struct.Struct("<8sIIQ")
+_alignment = 64
+
+# Key of the array references. Keys of the figure dicts that start with
+# _escape_prefix are escaped in the skeleton by repeating the prefix, so that
+# no dict of the figure can be mistaken for an array reference.
+_ref_key = "__bref__"
+_escape_prefix = "__b"
+
+
+def _align(offset):
+    return -(-offset // _alignment) * _alignment
+
+
+def _escape_key(key):
+    if isinstance(key, str) and key.startswith(_escape_prefix):
+        return _escape_prefix + key
+    return key
+
+
+def _unescape_key(key):
+    if key.startswith(_escape_prefix):
+        return key[len(_escape_prefix) :]
+    return key
+
+
+def _split_arrays(obj, arrays):
+    """
+    Return the skeleton of a figure dict, or part of one: a copy with its
+    typed arrays replaced by references to the array section, and its keys
+    escaped
+
+    The arrays are appended to `arrays` along with their offsets.
+    """
+    if isinstance(obj, dict):
+        res = {}
+        for key, value in obj.items():
+            if is_skipped_key(key):
+                res[key] = value
+                continue
+
+            if is_typed_array_spec(value):
+                value = from_typed_array_spec(value)
+
+            if is_homogeneous_array(value):
+                typed_value = to_typed_array(copy_to_readonly_numpy_array(value))
+                if typed_value is not None:
+                    res[_escape_key(key)] = _add_array(typed_value, arrays)
+                    continue
+
+            res[_escape_key(key)] = _split_arrays(value, arrays)
+        return res
+    elif isinstance(obj, (list, tuple)):
+        return [_split_arrays(value, arrays) for value in obj]
+    else:
+        return obj
+
+
+def _add_array(v, arrays):
+    if arrays:
+        last_offset, last_array = arrays[-1]
+        offset = _align(last_offset + last_array.nbytes)
+    else:
+        offset = 0
+
+    short_type = plotlyjsShortTypes[str(v.dtype)]
+    np = get_module("numpy")
+    arrays.append(
+        (offset, np.ascontiguousarray(v, dtype=plotlyjsTypedArrayDtypes[short_type]))
+    )
+    return {_ref_key: offset, "dtype": short_type, "shape": list(v.shape)}
+
+
+def _join_arrays(obj, data, np):
+    """
+    Return the figure dict, or part of one, of a skeleton: a copy with the
+    references to the array section replaced by read-only views of the
+    arrays in `data`, and its keys unescaped
+    """
+    if isinstance(obj, dict):
+        if _ref_key in obj:
+            dtype = np.dtype(plotlyjsTypedArrayDtypes[obj["dtype"]])
+            shape = obj["shape"]
+            size = 1
+            for n in shape:
+                size *= n
+            offset = obj[_ref_key]
+            return (
+                data[offset : offset + size * dtype.itemsize].view(dtype).reshape(shape)
+            )
+
+        res = {}
+        for key, value in obj.items():
+            if is_skipped_key(key):
+                res[key] = value
+            else:
+                res[_unescape_key(key)] = _join_arrays(value, data, np)
+        return res
+    elif isinstance(obj, list):
+        return [_join_arrays(value, data, np) for value in obj]
+    else:
+        return obj
+
+
+def write_binary(fig, file, validate=True, remove_uids=True, engine=None):
+    """
+    Write a figure to a file in the plotly binary figure format
+
+    The file holds a JSON skeleton of the figure followed by its numeric
+    arrays, stored uncompressed so that `read_binary` can load them without
+    parsing or copying them.
+
+    Parameters
+    ----------
+    fig:
+        Figure object or dict representing a figure
+
+    file: str or writeable
+        A string representing a local file path or a writeable object
+        opened in binary mode (e.g. a pathlib.Path object or an open file
+        descriptor)
+
+    validate: bool (default True)
+        True if the figure should be validated before being written,
+        False otherwise.
+
+    remove_uids: bool (default True)
+        True if trace UIDs should be omitted from the file
+
+    engine: str (default None)
+        The JSON encoding engine to use for the skeleton. See to_json for
+        the supported engines.
+
+    Returns
+    -------
+    None
+    """
+    np = get_module("numpy")
+    if np is None:
+        raise ValueError("write_binary requires the numpy package")
+
+    # Split figure
+    # ------------
+    fig_dict = _fig_to_json_dict(fig, validate, remove_uids, array_encoding=None)
+    arrays = []
+    skeleton = _split_arrays(fig_dict, arrays)
+    skeleton_bytes = to_json_plotly(skeleton, engine=engine).encode("utf-8")
+
+    # Write file
+    # ----------
+    def write(f):
+        f.write(_prefix.pack(_magic, _version, 0, len(skeleton_bytes)))
+        f.write(skeleton_bytes)
+        position = _prefix.size + len(skeleton_bytes)
+        data_start = _align(position)
+        for offset, array in arrays:
+            f.write(b"\0" * (data_start + offset - position))
+            f.write(memoryview(array).cast("B"))
+            position = data_start + offset + array.nbytes
+
+    if isinstance(file, (str, Path)):
+        with open(file, "wb") as f:
+            write(f)
+    elif hasattr(file, "write"):
+        write(file)
+    else:
+        raise ValueError(
+            """
+The 'file' argument '{file}' is not a string, pathlib.Path object, or file descriptor.
+""".format(
+                file=file
+            )
+        )
+
+
+def read_binary(
+    file, output_type="Figure", skip_invalid=False, mmap=False, engine=None
+):
+    """
+    Construct a figure from a file in the plotly binary figure format
+
+    Parameters
+    ----------
+    file: str or readable
+        A string containing the path to a local file or a readable object
+        opened in binary mode (e.g. a pathlib.Path object or an open file
+        descriptor)
+
+    output_type: type or str (default 'Figure')
+        The output figure type or type name.
+        One of:  graph_objs.Figure, 'Figure', graph_objs.FigureWidget, 'FigureWidget'
+
+    skip_invalid: bool (default False)
+        False if invalid figure properties should result in an exception.
+        True if invalid figure properties should be silently ignored.
+
+    mmap: bool (default False)
+        True if the arrays of the figure should be read-only views of a
+        memory map of the file (np.memmap), which are only read from disk
+        when they are accessed. False if the file should be read at once.
+
+    engine: str (default None)
+        The JSON decoding engine to use for the skeleton. See from_json for
+        the supported engines.
+
+    Returns
+    -------
+    Figure or FigureWidget
+    """
+    np = get_module("numpy")
+    if np is None:
+        raise ValueError("read_binary requires the numpy package")
+
+    if isinstance(file, (str, Path)):
+        with open(file, "rb") as f:
+            fig_dict = _read_binary_dict(f, mmap, engine, np)
+    elif hasattr(file, "read"):
+        fig_dict = _read_binary_dict(file, mmap, engine, np)
+    else:
+        raise ValueError(
+            """
+The 'file' argument '{file}' is not a string, pathlib.Path object, or file descriptor.
+""".format(
+                file=file
+            )
+        )
+
+    # Construct figure
+    # ----------------
+    # The arrays are read-only, so they are stored in the figure without
+    # being copied. The copy policy is only overridden for the current
+    # thread, so figures built by other threads are not affected.
+    cls = validate_coerce_output_type(output_type)
+    if validator_config.copy_arrays == "always":
+        with validator_config._override(copy_arrays="if_writeable"):
+            return cls(fig_dict, skip_invalid=skip_invalid)
+    return cls(fig_dict, skip_invalid=skip_invalid)
+
+
+def _read_binary_dict(f, mmap, engine, np):
+    # Read skeleton
+    # -------------
+    prefix = f.read(_prefix.size)
+    if len(prefix) < _prefix.size or prefix[: len(_magic)] != _magic:
+        raise ValueError("The file is not a plotly binary figure file")
+
+    _, version, _, skeleton_size = _prefix.unpack(prefix)
+    if version > _version:
+        raise ValueError(
+            "The file has version {version} of the plotly binary figure format, "
+            "but only versions up to {supported} are supported".format(
+                version=version, supported=_version
+            )
+        )
+    fig_dict = from_json_plotly(f.read(skeleton_size), engine=engine)
+
+    # Read arrays
+    # -----------
+    data_start = _align(_prefix.size + skeleton_size)
+    if mmap:
+        f.seek(0, 2)
+        if f.tell() > data_start:
+            data = np.memmap(f, dtype="u1", mode="r", offset=data_start)
+        else:
+            data = np.empty(0, dtype="u1")
+    else:
+        f.read(data_start - _prefix.size - skeleton_size)
+        data = np.frombuffer(f.read(), dtype="u1")
+
+    return _join_arrays(fig_dict, data, np)
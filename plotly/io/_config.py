@@ -0,0 +1,36 @@
+from contextlib import contextmanager
+
+from _plotly_utils.basevalidators import config
+
+
+@contextmanager
+def validation(enabled):
+    """
+    Context manager to enable or disable the validation of graph object
+    property values
+
+    Disabling validation speeds up the construction of figures from trusted
+    specifications that have already been validated (e.g. a cached result of
+    `fig.to_dict()`). Values are stored as-is, so invalid values will not be
+    reported until the figure is rendered. Graph objects constructed while
+    validation is disabled can still be accessed and updated as usual, and
+    validate the updates that are made outside of the context.
+
+    The setting only applies to the current thread (or asyncio task), so
+    figures built concurrently by other threads are still validated
+    according to `plotly.io.config.validate`.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether property values should be validated within the context
+
+    Examples
+    --------
+    >>> import plotly.io as pio
+    >>> import plotly.graph_objects as go
+    >>> with pio.validation(False):
+    ...     fig = go.Figure(spec)  # doctest: +SKIP
+    """
+    with config._override(validate=enabled):
+        yield
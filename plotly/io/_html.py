@@ -1,10 +1,21 @@
+import re
 import uuid
 from pathlib import Path
 import webbrowser
 
 from _plotly_utils.optional_imports import get_module
-from plotly.io._utils import validate_coerce_fig_to_dict, plotly_cdn_url
-from plotly.offline.offline import _get_jconfig, get_plotlyjs
+from plotly.io._utils import (
+    validate_coerce_compression,
+    validate_coerce_fig_to_dict,
+    plotly_cdn_url,
+    write_text_chunks,
+)
+from plotly.offline.offline import (
+    _get_jconfig,
+    _plotlyjs_cache,
+    get_plotlyjs,
+    get_plotlyjs_bytes,
+)
 
 _json = get_module("json")
 
@@ -126,6 +137,48 @@ def to_html(
     """
     from plotly.io.json import to_json_plotly
 
+    html_parts = _to_html(
+        fig,
+        config=config,
+        auto_play=auto_play,
+        include_plotlyjs=include_plotlyjs,
+        include_mathjax=include_mathjax,
+        post_script=post_script,
+        full_html=full_html,
+        animation_opts=animation_opts,
+        default_width=default_width,
+        default_height=default_height,
+        validate=validate,
+        div_id=div_id,
+        to_json=to_json_plotly,
+    )
+    return "".join(html_parts)
+
+
+def _to_html(
+    fig,
+    config,
+    auto_play,
+    include_plotlyjs,
+    include_mathjax,
+    post_script,
+    full_html,
+    animation_opts,
+    default_width,
+    default_height,
+    validate,
+    div_id,
+    to_json,
+    lazy=False,
+):
+    """
+    Build the HTML representation of a figure, as a list of strings to be
+    joined. The data, layout, and frames of the figure are serialized with
+    the to_json function. If lazy is True, the figure is plotted by the
+    function defined by _lazy_render_script when it is scrolled into view.
+
+    See to_html for a description of the other parameters.
+    """
     # ## Validate figure ##
     fig_dict = validate_coerce_fig_to_dict(fig, validate)
 
@@ -133,11 +186,11 @@ def to_html(
     plotdivid = div_id or str(uuid.uuid4())
 
     # ## Serialize figure ##
-    jdata = to_json_plotly(fig_dict.get("data", []))
-    jlayout = to_json_plotly(fig_dict.get("layout", {}))
+    jdata = to_json(fig_dict.get("data", []))
+    jlayout = to_json(fig_dict.get("layout", {}))
 
     if fig_dict.get("frames", None):
-        jframes = to_json_plotly(fig_dict.get("frames", []))
+        jframes = to_json(fig_dict.get("frames", []))
     else:
         jframes = None
 
@@ -225,7 +278,18 @@ def to_html(
     # Serialize config dict to JSON
     jconfig = _json.dumps(config)
 
-    script = """\
+    if lazy:
+        script_template = """\
+                window.PLOTLYENV.renderLazily("{id}", function() {{\
+                    Plotly.newPlot(\
+                        "{id}",\
+                        {data},\
+                        {layout},\
+                        {config}\
+                    ){then_addframes}{then_animate}{then_post_script}\
+                }})"""
+    else:
+        script_template = """\
                 if (document.getElementById("{id}")) {{\
                     Plotly.newPlot(\
                         "{id}",\
@@ -233,7 +297,9 @@ def to_html(
                         {layout},\
                         {config}\
                     ){then_addframes}{then_animate}{then_post_script}\
-                }}""".format(
+                }}"""
+
+    script = script_template.format(
         id=plotdivid,
         data=jdata,
         layout=jlayout,
@@ -243,7 +309,57 @@ def to_html(
         then_post_script=then_post_script,
     )
 
-    # ## Handle loading/initializing plotly.js ##
+    # ## Handle loading/initializing plotly.js and MathJax ##
+    load_plotlyjs = _get_load_plotlyjs(include_plotlyjs)
+    mathjax_script = _get_mathjax_script(include_mathjax)
+
+    # ## Build HTML ##
+    # The parts are returned separately and joined by the caller, so that
+    # the plotly.js bundle (several MB) is not copied by str.format
+    div_head = """\
+<div>\
+        {mathjax_script}\
+        """.format(
+        mathjax_script=mathjax_script
+    )
+    div_tail = """\
+            <div id="{id}" class="plotly-graph-div" \
+style="height:{height}; width:{width};"></div>\
+            <script type="text/javascript">\
+                window.PLOTLYENV=window.PLOTLYENV || {{}};{base_url_line}\
+                {script};\
+            </script>\
+        </div>""".format(
+        id=plotdivid,
+        width=div_width,
+        height=div_height,
+        base_url_line=base_url_line,
+        script=script,
+    )
+    parts = [div_head, load_plotlyjs, div_tail]
+
+    if full_html:
+        parts.insert(
+            0,
+            """\
+<html>
+<head><meta charset="utf-8" /></head>
+<body>
+    """,
+        )
+        parts.append(
+            """
+</body>
+</html>"""
+        )
+    return parts
+
+
+def _get_load_plotlyjs(include_plotlyjs):
+    """
+    Return the HTML that loads plotly.js. See to_html for a description of
+    the include_plotlyjs parameter.
+    """
     include_plotlyjs_orig = include_plotlyjs
     if isinstance(include_plotlyjs, str):
         include_plotlyjs = include_plotlyjs.lower()
@@ -276,14 +392,16 @@ def to_html(
         )
 
     elif include_plotlyjs:
-        load_plotlyjs = """\
-        {win_config}
-        <script type="text/javascript">{plotlyjs}</script>\
-    """.format(
-            win_config=_window_plotly_config, plotlyjs=get_plotlyjs()
-        )
+        load_plotlyjs = _get_plotlyjs_script()
+
+    return load_plotlyjs
+
 
-    # ## Handle loading/initializing MathJax ##
+def _get_mathjax_script(include_mathjax):
+    """
+    Return the HTML that loads MathJax. See to_html for a description of the
+    include_mathjax parameter.
+    """
     include_mathjax_orig = include_mathjax
     if isinstance(include_mathjax, str):
         include_mathjax = include_mathjax.lower()
@@ -320,38 +438,79 @@ include_mathjax may be specified as False, 'cdn', or a string ending with '.js'
             )
         )
 
-    plotly_html_div = """\
-<div>\
-        {mathjax_script}\
-        {load_plotlyjs}\
-            <div id="{id}" class="plotly-graph-div" \
-style="height:{height}; width:{width};"></div>\
-            <script type="text/javascript">\
-                window.PLOTLYENV=window.PLOTLYENV || {{}};{base_url_line}\
-                {script};\
-            </script>\
-        </div>""".format(
-        mathjax_script=mathjax_script,
-        load_plotlyjs=load_plotlyjs,
-        id=plotdivid,
-        width=div_width,
-        height=div_height,
-        base_url_line=base_url_line,
-        script=script,
-    ).strip()
+    return mathjax_script
 
-    if full_html:
-        return """\
-<html>
-<head><meta charset="utf-8" /></head>
-<body>
-    {div}
-</body>
-</html>""".format(
-            div=plotly_html_div
+
+def _get_plotlyjs_script():
+    """
+    Return the HTML that embeds the plotly.js bundle, built once per bundle
+    returned by get_plotlyjs and cached along with it, so that
+    clear_plotlyjs_cache releases both
+    """
+    plotlyjs = get_plotlyjs()
+    cached = _plotlyjs_cache.get("script")
+    if cached is None or cached[0] is not plotlyjs:
+        script = "".join(
+            [
+                """\
+        {win_config}
+        <script type="text/javascript">""".format(
+                    win_config=_window_plotly_config
+                ),
+                plotlyjs,
+                """</script>\
+    """,
+            ]
         )
-    else:
-        return plotly_html_div
+        cached = (plotlyjs, script)
+        _plotlyjs_cache["script"] = cached
+    return cached[1]
+
+
+def _iter_html(fig, **kwargs):
+    """
+    Generate the HTML representation of a figure in chunks, so that the
+    JSON representation of the figure is never built as a single string.
+
+    See to_html for a description of the parameters.
+    """
+    # Serialize the figure to unique placeholders, and then stream the JSON
+    # representations in place of the placeholders
+    json_objs = {}
+    html_parts = _to_html(fig, to_json=_json_placeholders(json_objs), **kwargs)
+    yield from _iter_json_placeholders(html_parts, json_objs)
+
+
+def _json_placeholders(json_objs):
+    # Build a to_json function for _to_html that stores the objects in
+    # json_objs, under the unique placeholder it returns
+    def to_json_placeholder(obj):
+        placeholder = "__plotly_json_{id}__".format(id=uuid.uuid4().hex)
+        json_objs[placeholder] = obj
+        return placeholder
+
+    return to_json_placeholder
+
+
+def _iter_json_placeholders(html_parts, json_objs):
+    # Generate the HTML parts, with the JSON representations of the objects
+    # in json_objs streamed in place of their placeholders
+    from plotly.io.json import iter_json_plotly
+
+    pattern = re.compile("|".join(json_objs))
+
+    for html_str in html_parts:
+        # Skip the search in parts without placeholders (e.g. plotly.js)
+        if "__plotly_json_" not in html_str:
+            yield html_str
+            continue
+
+        pos = 0
+        for match in pattern.finditer(html_str):
+            yield html_str[pos : match.start()]
+            yield from iter_json_plotly(json_objs[match.group()])
+            pos = match.end()
+        yield html_str[pos:]
 
 
 def write_html(
@@ -369,6 +528,7 @@ def write_html(
     default_height="100%",
     auto_open=False,
     div_id=None,
+    compression="infer",
 ):
     """
     Write a figure to an HTML file representation
@@ -468,6 +628,12 @@ def write_html(
     div_id: str (default None)
         If provided, this is the value of the id attribute of the div tag. If None, the
         id attribute is a UUID.
+    compression: str or None (default "infer")
+        Compression of the written file. One of "gzip", "zstd" (which requires
+        the zstandard package), None, or "infer" for "gzip" if `file` is a path
+        ending in ".gz", "zstd" if it ends in ".zst", and None otherwise. The
+        HTML is compressed as it is written, and writeable objects must be
+        opened in binary mode when it is compressed.
 
     Returns
     -------
@@ -475,8 +641,9 @@ def write_html(
         Representation of figure as an HTML div string
     """
 
-    # Build HTML string
-    html_str = to_html(
+    # Build HTML chunks. The HTML representation is written in chunks as
+    # it is generated, so the full string is never held in memory
+    html_chunks = _iter_html(
         fig,
         config=config,
         auto_play=auto_play,
@@ -503,21 +670,298 @@ def write_html(
         # descriptor with a `write()` method or it's an invalid object.
         path = None
 
-    # Write HTML string
+    # Write HTML chunks
+    compression = validate_coerce_compression(compression, path)
     if path is not None:
         # To use a different file encoding, pass a file descriptor
-        path.write_text(html_str, "utf-8")
+        write_text_chunks(
+            html_chunks, path=path, encoding="utf-8", compression=compression
+        )
     else:
-        file.write(html_str)
+        write_text_chunks(html_chunks, file=file, compression=compression)
 
     # Check if we should copy plotly.min.js to output directory
     if path is not None and full_html and include_plotlyjs == "directory":
         bundle_path = path.parent / "plotly.min.js"
 
         if not bundle_path.exists():
-            bundle_path.write_text(get_plotlyjs(), encoding="utf-8")
+            bundle_path.write_bytes(get_plotlyjs_bytes())
 
     # Handle auto_open
     if path is not None and full_html and auto_open:
         url = path.absolute().as_uri()
         webbrowser.open(url)
+
+
+# Script defining window.PLOTLYENV.renderLazily(id, render), which calls
+# render once the element with the given id is scrolled into view
+_lazy_render_script = """\
+        <script type="text/javascript">\
+window.PLOTLYENV=window.PLOTLYENV || {};\
+window.PLOTLYENV.renderLazily = function(id, render) {\
+    var gd = document.getElementById(id);\
+    if (!gd) {return;}\
+    if (!("IntersectionObserver" in window)) {render(); return;}\
+    var observer = new IntersectionObserver(function(entries) {\
+        if (entries.some(function(entry) {return entry.isIntersecting;})) {\
+            observer.disconnect();\
+            render();\
+        }\
+    }, {rootMargin: "200px"});\
+    observer.observe(gd);\
+};\
+</script>"""
+
+
+def to_html_report(
+    figs,
+    config=None,
+    auto_play=True,
+    include_plotlyjs=True,
+    include_mathjax=False,
+    post_script=None,
+    animation_opts=None,
+    default_width="100%",
+    default_height="450px",
+    validate=True,
+    lazy=False,
+    title=None,
+):
+    """
+    Convert a sequence of figures to an HTML document string that displays
+    all of the figures and loads plotly.js only once.
+
+    Parameters
+    ----------
+    figs: iterable
+        Figure objects or dicts representing figures
+    config: dict or None (default None)
+        Plotly.js figure config options, used for all figures
+    auto_play: bool (default=True)
+        Whether to automatically start the animation sequence of figures
+        that contain frames once they are plotted.
+    include_plotlyjs: bool or string (default True)
+        Specifies how the plotly.js library is included in the document.
+        See to_html for the supported values.
+    include_mathjax: bool or string (default False)
+        Specifies how the MathJax.js library is included in the document.
+        See to_html for the supported values.
+    post_script: str or list or None (default None)
+        JavaScript snippet(s) to be run after each figure is plotted. The
+        string(s) may include '{plot_id}' placeholders that will then be
+        replaced by the `id` of the div element of the figure.
+    animation_opts: dict or None (default None)
+        dict of custom animation parameters to be passed to the function
+        Plotly.animate in Plotly.js, for figures that contain frames.
+    default_width, default_height: number or str (default '100%' and '450px')
+        The default figure width/height to use if a figure does not specify
+        its own layout.width/layout.height property. May be specified in
+        pixels as an integer (e.g. 500), or as a css width style string
+        (e.g. '500px', '100%').
+    validate: bool (default True)
+        True if the figures should be validated before being converted to
+        JSON, False otherwise.
+    lazy: bool (default False)
+        If True, each figure is plotted when its div is scrolled into view
+        (using an IntersectionObserver), rather than all figures being
+        plotted when the document loads.
+    title: str or None (default None)
+        If not None, the title of the document
+
+    Returns
+    -------
+    str
+        Representation of the figures as an HTML document string
+    """
+    return "".join(
+        _iter_html_report(
+            figs,
+            config=config,
+            auto_play=auto_play,
+            include_plotlyjs=include_plotlyjs,
+            include_mathjax=include_mathjax,
+            post_script=post_script,
+            animation_opts=animation_opts,
+            default_width=default_width,
+            default_height=default_height,
+            validate=validate,
+            lazy=lazy,
+            title=title,
+        )
+    )
+
+
+def _iter_html_report(
+    figs,
+    config,
+    auto_play,
+    include_plotlyjs,
+    include_mathjax,
+    post_script,
+    animation_opts,
+    default_width,
+    default_height,
+    validate,
+    lazy,
+    title,
+):
+    """
+    Generate the HTML document of a sequence of figures in chunks. The
+    figures are converted one at a time as the chunks are generated.
+
+    See to_html_report for a description of the parameters.
+    """
+    import html
+
+    load_plotlyjs = _get_load_plotlyjs(include_plotlyjs)
+    mathjax_script = _get_mathjax_script(include_mathjax)
+
+    yield """\
+<html>
+<head><meta charset="utf-8" />{title}</head>
+<body>
+    """.format(
+        title=(
+            "<title>{title}</title>".format(title=html.escape(title))
+            if title is not None
+            else ""
+        )
+    )
+    yield mathjax_script
+    yield load_plotlyjs
+    if lazy:
+        yield _lazy_render_script
+
+    for fig in figs:
+        json_objs = {}
+        html_parts = _to_html(
+            fig,
+            config=config,
+            auto_play=auto_play,
+            include_plotlyjs=False,
+            include_mathjax=False,
+            post_script=post_script,
+            full_html=False,
+            animation_opts=animation_opts,
+            default_width=default_width,
+            default_height=default_height,
+            validate=validate,
+            div_id=None,
+            to_json=_json_placeholders(json_objs),
+            lazy=lazy,
+        )
+        yield "\n    "
+        yield from _iter_json_placeholders(html_parts, json_objs)
+
+    yield """
+</body>
+</html>"""
+
+
+def write_html_report(
+    figs,
+    file,
+    config=None,
+    auto_play=True,
+    include_plotlyjs=True,
+    include_mathjax=False,
+    post_script=None,
+    animation_opts=None,
+    default_width="100%",
+    default_height="450px",
+    validate=True,
+    lazy=False,
+    title=None,
+    compression="infer",
+):
+    """
+    Write a sequence of figures to an HTML document that displays all of
+    the figures and loads plotly.js only once.
+
+    The document is written as it is generated, one figure at a time, so
+    that the HTML of all figures is never held in memory.
+
+    Parameters
+    ----------
+    figs: iterable
+        Figure objects or dicts representing figures
+    file: str or writeable
+        A string representing a local file path or a writeable object
+        (e.g. a pathlib.Path object or an open file descriptor)
+    config: dict or None (default None)
+        Plotly.js figure config options, used for all figures
+    auto_play: bool (default=True)
+        Whether to automatically start the animation sequence of figures
+        that contain frames once they are plotted.
+    include_plotlyjs: bool or string (default True)
+        Specifies how the plotly.js library is included in the document.
+        See write_html for the supported values.
+    include_mathjax: bool or string (default False)
+        Specifies how the MathJax.js library is included in the document.
+        See to_html for the supported values.
+    post_script: str or list or None (default None)
+        JavaScript snippet(s) to be run after each figure is plotted. The
+        string(s) may include '{plot_id}' placeholders that will then be
+        replaced by the `id` of the div element of the figure.
+    animation_opts: dict or None (default None)
+        dict of custom animation parameters to be passed to the function
+        Plotly.animate in Plotly.js, for figures that contain frames.
+    default_width, default_height: number or str (default '100%' and '450px')
+        The default figure width/height to use if a figure does not specify
+        its own layout.width/layout.height property. May be specified in
+        pixels as an integer (e.g. 500), or as a css width style string
+        (e.g. '500px', '100%').
+    validate: bool (default True)
+        True if the figures should be validated before being converted to
+        JSON, False otherwise.
+    lazy: bool (default False)
+        If True, each figure is plotted when its div is scrolled into view
+        (using an IntersectionObserver), rather than all figures being
+        plotted when the document loads.
+    title: str or None (default None)
+        If not None, the title of the document
+    compression: str or None (default "infer")
+        Compression of the written file. See write_html for the supported
+        values.
+
+    Returns
+    -------
+    None
+    """
+    html_chunks = _iter_html_report(
+        figs,
+        config=config,
+        auto_play=auto_play,
+        include_plotlyjs=include_plotlyjs,
+        include_mathjax=include_mathjax,
+        post_script=post_script,
+        animation_opts=animation_opts,
+        default_width=default_width,
+        default_height=default_height,
+        validate=validate,
+        lazy=lazy,
+        title=title,
+    )
+
+    if isinstance(file, str):
+        path = Path(file)
+    elif isinstance(file, Path):
+        path = file
+    else:
+        path = None
+
+    # Write HTML chunks
+    compression = validate_coerce_compression(compression, path)
+    if path is not None:
+        write_text_chunks(
+            html_chunks, path=path, encoding="utf-8", compression=compression
+        )
+    else:
+        write_text_chunks(html_chunks, file=file, compression=compression)
+
+    # Check if we should copy plotly.min.js to output directory
+    if path is not None and include_plotlyjs == "directory":
+        bundle_path = path.parent / "plotly.min.js"
+
+        if not bundle_path.exists():
+            bundle_path.write_bytes(get_plotlyjs_bytes())
@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+import uuid
+from pathlib import Path
+
+from plotly.offline import get_plotlyjs_version
+
+
+def image_cache_key(fig_dict, engine, format, width, height, scale, settings=None):
+    """
+    Compute the key of a static image in the image cache
+
+    The key is a hash of the figure dict, the export options, the rendering
+    settings of the engine and the version of plotly.js, so that it is
+    stable across processes and machines.
+
+    Parameters
+    ----------
+    fig_dict: dict
+        Validated figure dict
+    engine: str
+        Image export engine ("kaleido" or "orca")
+    format, width, height, scale:
+        Export options, with the defaults of the engine filled in
+    settings: dict or None
+        Other settings of the engine that affect rendering (e.g. the
+        locations of the plotly.js bundle and of the topojson files)
+
+    Returns
+    -------
+    str
+        Hexadecimal key
+    """
+    from plotly.io.json import to_json_plotly
+
+    # The json engine is used so that the key doesn't depend on the engines
+    # that are installed
+    fig_json = to_json_plotly(fig_dict, engine="json")
+    options = json.dumps(
+        [
+            engine,
+            format,
+            width,
+            height,
+            scale,
+            get_plotlyjs_version(),
+            sorted((settings or {}).items()),
+        ],
+        default=str,
+    )
+
+    key = hashlib.sha256(options.encode("utf-8"))
+    key.update(b"\0")
+    key.update(fig_json.encode("utf-8"))
+    return key.hexdigest()
+
+
+class ImageCache(object):
+    """
+    Size-bounded cache of static images in a directory
+
+    Each image is stored in a file named by its key. Reading an image
+    updates the modification time of its file, and the least recently used
+    images are removed when the total size of the images exceeds max_size.
+    Files are written atomically, so a directory can be shared by several
+    processes.
+    """
+
+    def __init__(self, directory, max_size):
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+        # Estimate of the total size of the images, which is only computed
+        # from the directory when it may exceed max_size
+        self._size = None
+
+    def get(self, key):
+        """
+        Return the image stored under key, or None if there is none
+        """
+        path = self.directory / key
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def put(self, key, data):
+        """
+        Store an image under key, and remove the least recently used images
+        if the cache is full
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.directory / ".{key}.{id}.tmp".format(
+            key=key, id=uuid.uuid4().hex
+        )
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, self.directory / key)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return
+
+        if self._size is None:
+            self._size = self._scan()[1]
+        else:
+            self._size += len(data)
+
+        if self._size > self.max_size:
+            self._evict()
+
+    def _scan(self):
+        # Return the (mtime, size, path) of the images and their total size
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.startswith("."):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        except OSError:
+            pass
+        return entries, total
+
+    def _evict(self):
+        entries, total = self._scan()
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        self._size = total
@@ -1,12 +1,18 @@
 import json
 import decimal
 import datetime
-import warnings
 from pathlib import Path
 
-from plotly.io._utils import validate_coerce_fig_to_dict, validate_coerce_output_type
+from plotly.io._utils import (
+    read_text,
+    validate_coerce_compression,
+    validate_coerce_fig_to_dict,
+    validate_coerce_output_type,
+    write_text_chunks,
+)
 from _plotly_utils.optional_imports import get_module
 from _plotly_utils.basevalidators import ImageUriValidator
+from _plotly_utils.utils import convert_from_base64, convert_to_base64
 
 
 # Orca configuration class
@@ -16,6 +22,7 @@ class JsonConfig(object):
 
     def __init__(self):
         self._default_engine = "auto"
+        self._cache = True
 
     @property
     def default_engine(self):
@@ -34,6 +41,31 @@ class JsonConfig(object):
 
         self._default_engine = val
 
+    @property
+    def cache(self):
+        """
+        Whether to_json caches the last JSON representation of each figure
+        and returns it until the properties of the figure change (default
+        True)
+
+        Returns
+        -------
+        bool
+        """
+        return self._cache
+
+    @cache.setter
+    def cache(self, val):
+        if not isinstance(val, bool):
+            raise ValueError(
+                "The cache property must be a boolean\n"
+                "    Received value of type {typ}: {val}".format(
+                    typ=type(val), val=repr(val)
+                )
+            )
+
+        self._cache = val
+
     @classmethod
     def validate_orjson(cls):
         orjson = get_module("orjson")
@@ -68,6 +100,11 @@ _swap_orjson = _swap_json + (
 
 
 def _safe(json_str, _swap):
+    # Chained str.replace calls are used on purpose. Each call runs entirely
+    # in C and is skipped when the character is absent, which makes this
+    # several times faster than single pass alternatives (str.translate with
+    # a multi-character table, or re.sub) on large payloads.
+    # See benchmarks/bench_json.py
     out = json_str
     for unsafe_char, safe_char in _swap:
         if unsafe_char in out:
@@ -105,6 +142,19 @@ def to_json_plotly(plotly_object, pretty=False, engine=None):
     --------
     to_json : Convert a plotly Figure to JSON with validation
     """
+    return _get_json_encoder(pretty=pretty, engine=engine)(plotly_object)
+
+
+def _get_json_encoder(pretty=False, engine=None):
+    """
+    Build a function that converts a plotly/Dash object to a JSON string
+    with the specified options. See to_json_plotly for a description of the
+    parameters.
+
+    Returns
+    -------
+    callable
+    """
     orjson = get_module("orjson", should_load=True)
 
     # Determine json engine
@@ -138,9 +188,11 @@ def to_json_plotly(plotly_object, pretty=False, engine=None):
 
         from _plotly_utils.utils import PlotlyJSONEncoder
 
-        return _safe(
-            json.dumps(plotly_object, cls=PlotlyJSONEncoder, **opts), _swap_json
-        )
+        def encode(plotly_object):
+            return _safe(
+                json.dumps(plotly_object, cls=PlotlyJSONEncoder, **opts), _swap_json
+            )
+
     elif engine == "orjson":
         JsonConfig.validate_orjson()
         opts = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
@@ -148,30 +200,255 @@ def to_json_plotly(plotly_object, pretty=False, engine=None):
         if pretty:
             opts |= orjson.OPT_INDENT_2
 
-        # Plotly
-        try:
-            plotly_object = plotly_object.to_plotly_json()
-        except AttributeError:
-            pass
-
-        # Try without cleaning
-        try:
+        def encode(plotly_object):
+            # Plotly
+            try:
+                plotly_object = plotly_object.to_plotly_json()
+            except AttributeError:
+                pass
+
+            # Try without cleaning
+            try:
+                return _safe(
+                    orjson.dumps(plotly_object, option=opts).decode("utf8"),
+                    _swap_orjson,
+                )
+            except TypeError:
+                pass
+
+            cleaned = clean_to_json_compatible(
+                plotly_object,
+                numpy_allowed=True,
+                datetime_allowed=True,
+                modules=modules,
+            )
             return _safe(
-                orjson.dumps(plotly_object, option=opts).decode("utf8"), _swap_orjson
+                orjson.dumps(cleaned, option=opts).decode("utf8"), _swap_orjson
             )
-        except TypeError:
-            pass
 
-        cleaned = clean_to_json_compatible(
-            plotly_object,
-            numpy_allowed=True,
-            datetime_allowed=True,
-            modules=modules,
-        )
-        return _safe(orjson.dumps(cleaned, option=opts).decode("utf8"), _swap_orjson)
+    return encode
+
+
+def iter_json_plotly(plotly_object, pretty=False, engine=None, chunk_size=65536):
+    """
+    Convert a plotly/Dash object to a JSON string representation that is
+    generated in chunks
+
+    The chunks concatenate to the string returned by `to_json_plotly`, but
+    the full string is never built. Large containers, arrays and strings
+    are encoded in pieces of bounded size, so this can be used to write
+    very large figures to a file or socket with limited memory overhead.
+
+    Parameters
+    ----------
+    plotly_object:
+        A plotly/Dash object represented as a dict, graph_object, or Dash component
+
+    pretty: bool (default False)
+        True if JSON representation should be pretty-printed, False if
+        representation should be as compact as possible.
+
+    engine: str (default None)
+        The JSON encoding engine to use. One of:
+          - "json" for an engine based on the built-in Python json module
+          - "orjson" for a faster engine that requires the orjson package
+          - "auto" for the "orjson" engine if available, otherwise "json"
+        If not specified, the default engine is set to the current value of
+        plotly.io.json.config.default_engine.
+
+    chunk_size: int (default 65536)
+        Approximate number of values (array elements, dict entries, or
+        characters of strings) that are encoded at once
+
+    Returns
+    -------
+    iterator of str
+
+    See Also
+    --------
+    to_json_plotly : Convert a plotly/Dash object to a JSON string
+    """
+    encode = _get_json_encoder(pretty=pretty, engine=engine)
+    np = get_module("numpy", should_load=False)
+    return _iter_json_chunks(plotly_object, encode, pretty, chunk_size, 0, np)
+
+
+# Types of values that are encoded as JSON scalars
+_json_scalar_types = frozenset([type(None), bool, int, float])
+
+
+def _json_size(obj, limit, np):
+    """
+    Estimate the number of values in an object, counting strings by their
+    length. Counting stops as soon as the estimate exceeds limit.
+    """
+    size = 0
+    stack = [obj]
+    while stack and size <= limit:
+        v = stack.pop()
+        if isinstance(v, dict):
+            size += len(v)
+            if size <= limit:
+                stack.extend(v.values())
+        elif isinstance(v, (list, tuple)):
+            size += len(v)
+            if size <= limit:
+                stack.extend(v)
+        elif isinstance(v, str):
+            size += len(v)
+        elif np is not None and isinstance(v, np.ndarray):
+            size += v.size
+        else:
+            size += 1
+
+    return size
+
+
+def _indent_json(json_str, indent):
+    # Indent all lines but the first of a pretty-printed JSON string
+    if indent:
+        return json_str.replace("\n", "\n" + indent)
+    return json_str
+
+
+def _json_array_items(json_str, indent, pretty):
+    # Strip the brackets of an encoded JSON array, leaving the items
+    # (indented to the level of the items of the enclosing array)
+    if pretty:
+        return indent + _indent_json(json_str[2:-2], indent)
+    return json_str[1:-1]
 
 
-def to_json(fig, validate=True, pretty=False, remove_uids=True, engine=None):
+def _json_list_groups(obj, chunk_size, np):
+    """
+    Split a list into batches of small consecutive elements, and large
+    elements that need to be encoded in pieces
+
+    Returns
+    -------
+    iterator of (list, False) batches or (element, True) large elements
+    """
+    for start in range(0, len(obj), chunk_size):
+        piece = obj[start : start + chunk_size]
+
+        # Fast path for lists of scalars and short strings (the common case
+        # of data arrays), which doesn't inspect elements one at a time
+        types = set(map(type, piece))
+        if types <= _json_scalar_types:
+            yield piece, False
+            continue
+        elif types <= _json_scalar_types | {str}:
+            if len(types) == 1:
+                str_size = sum(map(len, piece))
+            else:
+                str_size = sum(len(v) for v in piece if type(v) is str)
+
+            step = max(len(piece) * chunk_size // max(str_size, 1), 1)
+            if step > 1 or str_size <= chunk_size:
+                for i in range(0, len(piece), step):
+                    yield piece[i : i + step], False
+                continue
+
+        batch = []
+        batch_size = 0
+        for el in piece:
+            el_size = _json_size(el, chunk_size, np)
+            if batch and batch_size + el_size > chunk_size:
+                yield batch, False
+                batch = []
+                batch_size = 0
+
+            if el_size > chunk_size:
+                yield el, True
+            else:
+                batch.append(el)
+                batch_size += el_size
+
+        if batch:
+            yield batch, False
+
+
+def _iter_json_chunks(obj, encode, pretty, chunk_size, level, np):
+    if hasattr(obj, "to_plotly_json"):
+        obj = obj.to_plotly_json()
+
+    indent = "  " * level if pretty else ""
+    item_indent = "  " * (level + 1) if pretty else ""
+    item_sep = ",\n" if pretty else ","
+
+    # Encode small objects at once
+    if _json_size(obj, chunk_size, np) <= chunk_size:
+        yield _indent_json(encode(obj), indent)
+
+    elif isinstance(obj, dict) and all(isinstance(k, str) for k in obj):
+        key_sep = ": " if pretty else ":"
+        yield "{\n" if pretty else "{"
+        for i, (k, v) in enumerate(obj.items()):
+            yield (item_sep if i else "") + item_indent + encode(k) + key_sep
+            yield from _iter_json_chunks(v, encode, pretty, chunk_size, level + 1, np)
+        yield "\n" + indent + "}" if pretty else "}"
+
+    elif isinstance(obj, str):
+        # Strings are escaped character by character, so long strings
+        # (e.g. base64 encoded arrays) can be encoded in pieces
+        yield '"'
+        for i in range(0, len(obj), chunk_size):
+            yield encode(obj[i : i + chunk_size])[1:-1]
+        yield '"'
+
+    elif np is not None and isinstance(obj, np.ndarray) and obj.ndim > 0:
+        # Encode slices of consecutive rows of the array
+        row_size = max(obj.size // len(obj), 1)
+        yield "[\n" if pretty else "["
+        if row_size > chunk_size:
+            for i, row in enumerate(obj):
+                if i:
+                    yield item_sep
+                yield item_indent
+                yield from _iter_json_chunks(
+                    row, encode, pretty, chunk_size, level + 1, np
+                )
+        else:
+            step = max(chunk_size // row_size, 1)
+            for i in range(0, len(obj), step):
+                yield (item_sep if i else "") + _json_array_items(
+                    encode(obj[i : i + step]), indent, pretty
+                )
+        yield "\n" + indent + "]" if pretty else "]"
+
+    elif isinstance(obj, (list, tuple)):
+        # Encode batches of small consecutive elements at once, and large
+        # elements in pieces
+        yield "[\n" if pretty else "["
+        for i, (group, is_element) in enumerate(_json_list_groups(obj, chunk_size, np)):
+            if i:
+                yield item_sep
+            if is_element:
+                yield item_indent
+                yield from _iter_json_chunks(
+                    group, encode, pretty, chunk_size, level + 1, np
+                )
+            else:
+                yield _json_array_items(encode(group), indent, pretty)
+        yield "\n" + indent + "]" if pretty else "]"
+
+    else:
+        # Objects that can't be encoded in pieces
+        yield _indent_json(encode(obj), indent)
+
+
+def to_json(
+    fig,
+    validate=True,
+    pretty=False,
+    remove_uids=True,
+    engine=None,
+    array_encoding="b64",
+    float_precision="float64",
+    max_decimals=None,
+    skipped_keys=None,
+    workers=None,
+):
     """
     Convert a figure to a JSON string representation
 
@@ -199,18 +476,264 @@ def to_json(fig, validate=True, pretty=False, remove_uids=True, engine=None):
         If not specified, the default engine is set to the current value of
         plotly.io.json.config.default_engine.
 
+    array_encoding: str or None (default "b64")
+        How the numpy arrays of validated figures are encoded. One of:
+          - "b64" for base64 encoded typed arrays, which plotly.js decodes
+          - None for plain JSON lists
+        Dicts that are not validated are written as they are.
+
+    float_precision: str (default "float64")
+        Precision of base64 encoded float arrays. If "float32", float64
+        arrays are converted to float32, which halves the size of their
+        encoding at the cost of precision beyond about 7 significant digits.
+
+    max_decimals: int or None (default None)
+        If not None, base64 encoded float arrays are rounded to this number
+        of decimals.
+
+    skipped_keys: collection of str or None (default None)
+        Names of the properties whose arrays are not base64 encoded, at any
+        level of the figure. If None, the values of the "geojson", "layer",
+        "layers" and "range" properties are not encoded.
+
+    workers: int or None (default None)
+        If greater than 1, the traces and frames of the figure are encoded
+        concurrently by a pool of this many threads, and their encodings
+        are joined into the same string as with a single thread. This can
+        speed up the encoding of figures with many large traces.
+
     Returns
     -------
     str
         Representation of figure as a JSON string
 
+    Notes
+    -----
+    The last JSON representation of a Figure object is cached with the
+    options it was computed with, and is reused until the properties of the
+    figure change. Figures whose properties may be modified in place are
+    not cached, since these changes are not tracked. This is the case for
+    figures with frames, with properties that were not validated, with
+    dict or list values that are stored as-is (e.g. `meta` or
+    `customdata`), or with numpy arrays that are not copied (see
+    `plotly.io.config.copy_arrays`). Caching can be disabled with
+    `plotly.io.json.config.cache = False`.
+
     See Also
     --------
     to_json_plotly : Convert an arbitrary plotly graph_object or Dash component to JSON
     """
+    from plotly.basedatatypes import BaseFigure
+
+    if workers is not None and (
+        not isinstance(workers, int) or isinstance(workers, bool) or workers < 1
+    ):
+        raise ValueError("Invalid workers: %s" % workers)
+    skipped_keys = _coerce_skipped_keys(skipped_keys)
+
+    def encode_figure():
+        if workers is not None and workers > 1:
+            return _to_json_parallel(
+                fig,
+                validate,
+                pretty,
+                remove_uids,
+                engine,
+                array_encoding,
+                float_precision,
+                max_decimals,
+                skipped_keys,
+                workers,
+            )
+        fig_dict = _fig_to_json_dict(
+            fig,
+            validate,
+            remove_uids,
+            array_encoding,
+            float_precision,
+            max_decimals,
+            skipped_keys,
+        )
+        return to_json_plotly(fig_dict, pretty=pretty, engine=engine)
+
+    if not isinstance(fig, BaseFigure):
+        return encode_figure()
+    elif (
+        not config.cache
+        or fig._frame_objs
+        or fig._has_unvalidated_props
+        or fig._has_mutable_values
+    ):
+        fig._json_cache = None
+        return encode_figure()
+
+    # Look up cached representation
+    # -----------------------------
+    if engine is None:
+        engine = config.default_engine
+    key = (
+        pretty,
+        remove_uids,
+        engine,
+        array_encoding,
+        float_precision,
+        max_decimals,
+        skipped_keys,
+    )
+    revision = fig._revision
+    cached = fig._json_cache
+    if cached is not None and cached[0] == key and cached[1] == revision:
+        return cached[2]
+
+    json_str = encode_figure()
+    fig._json_cache = (key, revision, json_str)
+    return json_str
+
+
+# Figure properties whose elements are encoded concurrently by to_json
+_parallel_keys = ("data", "frames")
+
+
+def _to_json_parallel(
+    fig,
+    validate,
+    pretty,
+    remove_uids,
+    engine,
+    array_encoding,
+    float_precision,
+    max_decimals,
+    skipped_keys,
+    workers,
+):
+    """
+    Convert a figure to a JSON string, encoding the elements of its data
+    and frames lists in a pool of threads
+
+    Arrays are converted to typed arrays by the threads as well, and the
+    encodings are joined into the string returned by to_json_plotly for
+    the same figure dict.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    fig_dict = _fig_to_json_dict(
+        fig,
+        validate,
+        remove_uids,
+        array_encoding,
+        float_precision,
+        max_decimals,
+        skipped_keys,
+        encode_arrays=False,
+    )
+    convert_arrays = array_encoding == "b64" and _is_validated_dict(fig, validate)
+    encode = _get_json_encoder(pretty=pretty, engine=engine)
+
+    def encode_value(value):
+        if convert_arrays:
+            convert_to_base64(
+                value,
+                float_precision=float_precision,
+                max_decimals=max_decimals,
+                skipped_keys=skipped_keys,
+            )
+        return encode(value)
+
+    indent = "  " if pretty else ""
+    item_indent = "    " if pretty else ""
+    item_sep = ",\n" if pretty else ","
+    key_sep = ": " if pretty else ":"
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Encode list elements concurrently
+        # ---------------------------------
+        futures = {
+            key: [executor.submit(encode_value, el) for el in fig_dict[key]]
+            for key in _parallel_keys
+            if isinstance(fig_dict.get(key), list) and fig_dict[key]
+        }
+
+        # Encode other properties
+        # -----------------------
+        # These are converted together, so that the keys that are skipped
+        # by convert_to_base64 are the same as for the whole figure
+        rest = {k: v for k, v in fig_dict.items() if k not in futures}
+        if convert_arrays:
+            convert_to_base64(
+                rest,
+                float_precision=float_precision,
+                max_decimals=max_decimals,
+                skipped_keys=skipped_keys,
+            )
+
+        # Join encodings
+        # --------------
+        items = []
+        for key in fig_dict:
+            if key in futures:
+                value = (
+                    ("[\n" if pretty else "[")
+                    + item_sep.join(
+                        item_indent + _indent_json(future.result(), item_indent)
+                        for future in futures[key]
+                    )
+                    + ("\n" + indent + "]" if pretty else "]")
+                )
+            else:
+                value = _indent_json(encode(rest[key]), indent)
+            items.append(indent + encode(key) + key_sep + value)
+
+    if pretty:
+        return "{\n" + ",\n".join(items) + "\n}" if items else "{}"
+    return "{" + ",".join(items) + "}"
+
+
+def _fig_to_json_dict(
+    fig,
+    validate,
+    remove_uids,
+    array_encoding="b64",
+    float_precision="float64",
+    max_decimals=None,
+    skipped_keys=None,
+    encode_arrays=True,
+):
+    if array_encoding not in ("b64", None):
+        raise ValueError("Invalid array_encoding: %s" % array_encoding)
+    if float_precision not in ("float32", "float64"):
+        raise ValueError("Invalid float_precision: %s" % float_precision)
+
     # Validate figure
     # ---------------
-    fig_dict = validate_coerce_fig_to_dict(fig, validate)
+    # Arrays are converted to typed arrays with the default options while
+    # the figure is converted to a dict, and left as they are otherwise
+    default_encoding = (
+        encode_arrays
+        and array_encoding == "b64"
+        and float_precision == "float64"
+        and max_decimals is None
+        and skipped_keys is None
+    )
+    fig_dict = validate_coerce_fig_to_dict(
+        fig, validate, convert_arrays=default_encoding
+    )
+
+    # Encode arrays
+    # -------------
+    # Only the dicts built above are converted in place, not the dicts that
+    # are passed without validation
+    if (
+        encode_arrays
+        and array_encoding == "b64"
+        and not default_encoding
+        and _is_validated_dict(fig, validate)
+    ):
+        convert_to_base64(
+            fig_dict,
+            float_precision=float_precision,
+            max_decimals=max_decimals,
+            skipped_keys=skipped_keys,
+        )
 
     # Remove trace uid
     # ----------------
@@ -218,10 +741,45 @@ def to_json(fig, validate=True, pretty=False, remove_uids=True, engine=None):
         for trace in fig_dict.get("data", []):
             trace.pop("uid", None)
 
-    return to_json_plotly(fig_dict, pretty=pretty, engine=engine)
+    return fig_dict
 
 
-def write_json(fig, file, validate=True, pretty=False, remove_uids=True, engine=None):
+def _coerce_skipped_keys(skipped_keys):
+    # Skipped keys as a sorted tuple, so that they can be part of the to_json
+    # cache key
+    if skipped_keys is None:
+        return None
+    if isinstance(skipped_keys, str) or not all(
+        isinstance(key, str) for key in skipped_keys
+    ):
+        raise ValueError(
+            "Invalid skipped_keys: %s\n"
+            "    Must be a collection of property names" % (skipped_keys,)
+        )
+    return tuple(sorted(set(skipped_keys)))
+
+
+def _is_validated_dict(fig, validate):
+    # Whether _fig_to_json_dict builds a new dict from a validated figure,
+    # rather than returning the dict that is passed
+    from plotly.basedatatypes import BaseFigure
+
+    return isinstance(fig, BaseFigure) or (isinstance(fig, dict) and validate)
+
+
+def write_json(
+    fig,
+    file,
+    validate=True,
+    pretty=False,
+    remove_uids=True,
+    engine=None,
+    array_encoding="b64",
+    float_precision="float64",
+    max_decimals=None,
+    skipped_keys=None,
+    compression="infer",
+):
     """
     Convert a figure to JSON and write it to a file or writeable
     object
@@ -249,17 +807,58 @@ def write_json(fig, file, validate=True, pretty=False, remove_uids=True, engine=
           - "auto" for the "orjson" engine if available, otherwise "json"
         If not specified, the default engine is set to the current value of
         plotly.io.json.config.default_engine.
+
+    array_encoding: str or None (default "b64")
+        How the numpy arrays of validated figures are encoded. One of:
+          - "b64" for base64 encoded typed arrays, which plotly.js decodes
+          - None for plain JSON lists
+        Dicts that are not validated are written as they are.
+
+    float_precision: str (default "float64")
+        Precision of base64 encoded float arrays. If "float32", float64
+        arrays are converted to float32, which halves the size of their
+        encoding at the cost of precision beyond about 7 significant digits.
+
+    max_decimals: int or None (default None)
+        If not None, base64 encoded float arrays are rounded to this number
+        of decimals.
+
+    skipped_keys: collection of str or None (default None)
+        Names of the properties whose arrays are not base64 encoded, at any
+        level of the figure. If None, the values of the "geojson", "layer",
+        "layers" and "range" properties are not encoded.
+
+    compression: str or None (default "infer")
+        Compression of the written file. One of:
+          - "gzip" for gzip compression
+          - "zstd" for Zstandard compression, which requires the zstandard
+            package
+          - None for no compression
+          - "infer" for "gzip" if `file` is a path ending in ".gz", "zstd" if
+            it ends in ".zst", and None otherwise
+        The JSON representation is compressed as it is written, and
+        writeable objects must be opened in binary mode when it is
+        compressed.
+
     Returns
     -------
     None
     """
 
-    # Get JSON string
+    # Get JSON chunks
     # ---------------
-    # Pass through validate argument and let to_json handle validation logic
-    json_str = to_json(
-        fig, validate=validate, pretty=pretty, remove_uids=remove_uids, engine=engine
+    # The JSON representation is written in chunks as it is generated, so
+    # the full string is never held in memory
+    fig_dict = _fig_to_json_dict(
+        fig,
+        validate,
+        remove_uids,
+        array_encoding,
+        float_precision,
+        max_decimals,
+        _coerce_skipped_keys(skipped_keys),
     )
+    json_chunks = iter_json_plotly(fig_dict, pretty=pretty, engine=engine)
 
     # Try to cast `file` as a pathlib object `path`.
     # ----------------------------------------------
@@ -274,16 +873,16 @@ def write_json(fig, file, validate=True, pretty=False, remove_uids=True, engine=
         # descriptor with a `write()` method or it's an invalid object.
         path = None
 
+    compression = validate_coerce_compression(compression, path)
+
     # Open file
     # ---------
     if path is None:
         # We previously failed to make sense of `file` as a pathlib object.
         # Attempt to write to `file` as an open file descriptor.
-        try:
-            file.write(json_str)
+        if hasattr(file, "write"):
+            write_text_chunks(json_chunks, file=file, compression=compression)
             return
-        except AttributeError:
-            pass
         raise ValueError(
             """
 The 'file' argument '{file}' is not a string, pathlib.Path object, or file descriptor.
@@ -293,11 +892,11 @@ The 'file' argument '{file}' is not a string, pathlib.Path object, or file descr
         )
     else:
         # We previously succeeded in interpreting `file` as a pathlib object.
-        # Now we can use `write_bytes()`.
-        path.write_text(json_str)
+        # Now we can write the chunks to it.
+        write_text_chunks(json_chunks, path=path, compression=compression)
 
 
-def from_json_plotly(value, engine=None):
+def from_json_plotly(value, engine=None, decode_typed_arrays=False):
     """
     Parse JSON string using the specified JSON engine
 
@@ -316,6 +915,12 @@ def from_json_plotly(value, engine=None):
         If not specified, the default engine is set to the current value of
         plotly.io.json.config.default_engine.
 
+    decode_typed_arrays: bool (default False)
+        True if base64 encoded typed arrays (dicts with "dtype" and "bdata"
+        keys) should be decoded to read-only numpy arrays, False if they
+        should be returned as they are. The arrays are views of the decoded
+        bytes, so they are not copied again.
+
     Returns
     -------
     dict
@@ -359,10 +964,19 @@ from_json_plotly requires a string or bytes argument but received value of type
             value = value.decode("utf-8")
         value_dict = json.loads(value)
 
+    if decode_typed_arrays:
+        convert_from_base64(value_dict)
+
     return value_dict
 
 
-def from_json(value, output_type="Figure", skip_invalid=False, engine=None):
+def from_json(
+    value,
+    output_type="Figure",
+    skip_invalid=False,
+    engine=None,
+    decode_typed_arrays=False,
+):
     """
     Construct a figure from a JSON string
 
@@ -389,6 +1003,12 @@ def from_json(value, output_type="Figure", skip_invalid=False, engine=None):
         If not specified, the default engine is set to the current value of
         plotly.io.json.config.default_engine.
 
+    decode_typed_arrays: bool (default False)
+        True if base64 encoded typed arrays (dicts with "dtype" and "bdata"
+        keys) should be decoded to read-only numpy arrays, False if they
+        should be returned as they are. The arrays are views of the decoded
+        bytes, so they are not copied again.
+
     Raises
     ------
     ValueError
@@ -402,7 +1022,9 @@ def from_json(value, output_type="Figure", skip_invalid=False, engine=None):
 
     # Decode JSON
     # -----------
-    fig_dict = from_json_plotly(value, engine=engine)
+    fig_dict = from_json_plotly(
+        value, engine=engine, decode_typed_arrays=decode_typed_arrays
+    )
 
     # Validate coerce output type
     # ---------------------------
@@ -414,7 +1036,13 @@ def from_json(value, output_type="Figure", skip_invalid=False, engine=None):
     return fig
 
 
-def read_json(file, output_type="Figure", skip_invalid=False, engine=None):
+def read_json(
+    file,
+    output_type="Figure",
+    skip_invalid=False,
+    engine=None,
+    decode_typed_arrays=False,
+):
     """
     Construct a figure from the JSON contents of a local file or readable
     Python object
@@ -423,7 +1051,9 @@ def read_json(file, output_type="Figure", skip_invalid=False, engine=None):
     ----------
     file: str or readable
        A string containing the path to a local file or a read-able Python
-       object (e.g. a pathlib.Path object or an open file descriptor)
+       object (e.g. a pathlib.Path object or an open file descriptor).
+       Paths ending in ".gz" or ".zst" are decompressed with gzip or
+       Zstandard, as are compressed bytes read from a readable object.
 
     output_type: type or str (default 'Figure')
         The output figure type or type name.
@@ -443,6 +1073,12 @@ def read_json(file, output_type="Figure", skip_invalid=False, engine=None):
         If not specified, the default engine is set to the current value of
         plotly.io.json.config.default_engine.
 
+    decode_typed_arrays: bool (default False)
+        True if base64 encoded typed arrays (dicts with "dtype" and "bdata"
+        keys) should be decoded to read-only numpy arrays, False if they
+        should be returned as they are. The arrays are views of the decoded
+        bytes, so they are not copied again.
+
     Returns
     -------
     Figure or FigureWidget
@@ -465,38 +1101,176 @@ def read_json(file, output_type="Figure", skip_invalid=False, engine=None):
 
     # Read file contents into JSON string
     # -----------------------------------
+    # gzip and zstd compressed contents are decompressed
     if path is not None:
-        json_str = path.read_text()
+        json_str = read_text(path=path)
     else:
-        json_str = file.read()
+        json_str = read_text(file=file)
 
     # Construct and return figure
     # ---------------------------
     return from_json(
-        json_str, skip_invalid=skip_invalid, output_type=output_type, engine=engine
+        json_str,
+        skip_invalid=skip_invalid,
+        output_type=output_type,
+        engine=engine,
+        decode_typed_arrays=decode_typed_arrays,
     )
 
 
 def clean_to_json_compatible(obj, **kwargs):
-    # Try handling value as a scalar value that we have a conversion for.
-    # Return immediately if we know we've hit a primitive value
+    numpy_allowed = kwargs.get("numpy_allowed", False)
+    datetime_allowed = kwargs.get("datetime_allowed", False)
+    modules = kwargs.get("modules", {})
+
+    if modules["sage_all"] is not None:
+        # Sage numbers can't be recognized by type, so every value that is
+        # not a primitive or a container is inspected by the generic converter
+        def get_converter(cls):
+            converter = _build_json_converter(cls, modules)
+            return _clean_json_value if callable(converter) else converter
+
+    else:
+
+        def get_converter(cls):
+            try:
+                return _json_converters[cls]
+            except KeyError:
+                return _json_converters.setdefault(
+                    cls, _build_json_converter(cls, modules)
+                )
+
+    # Walk the structure with an explicit stack, writing each cleaned value
+    # into its (already created) parent container
+    result = [obj]
+    stack = [(result, 0, obj)]
+    while stack:
+        parent, key, value = stack.pop()
+        converter = get_converter(value.__class__)
+
+        if converter is _JSON_PRIMITIVE:
+            continue
+        elif converter is _JSON_DICT:
+            cleaned = dict(value)
+            for k, v in cleaned.items():
+                if get_converter(v.__class__) is not _JSON_PRIMITIVE:
+                    stack.append((cleaned, k, v))
+        elif converter is _JSON_LIST:
+            if not value:
+                continue
+            cleaned = list(value)
+            for i, v in enumerate(cleaned):
+                if get_converter(v.__class__) is not _JSON_PRIMITIVE:
+                    stack.append((cleaned, i, v))
+        else:
+            cleaned, recurse = converter(
+                value, numpy_allowed, datetime_allowed, modules
+            )
+            if recurse and isinstance(cleaned, (dict, list, tuple)):
+                # e.g. the output of to_plotly_json, or the list of an object
+                # array, which may hold values that need cleaning
+                stack.append((parent, key, cleaned))
+                continue
+
+        parent[key] = cleaned
+
+    return result[0]
+
+
+# Markers of the values that clean_to_json_compatible handles itself
+_JSON_PRIMITIVE = "primitive"
+_JSON_DICT = "dict"
+_JSON_LIST = "list"
+
+# Cache of the converters used by clean_to_json_compatible, keyed on the
+# type of the value
+_json_converters = {}
+
 
+def _build_json_converter(cls, modules):
+    """
+    Choose the converter that clean_to_json_compatible uses for values of a
+    given type
+
+    Converters accept the value, numpy_allowed, datetime_allowed and
+    modules arguments, and return a tuple of the converted value and a
+    bool that is True if the converted value must be cleaned recursively.
+    """
     # Bail out fast for simple scalar types
-    if isinstance(obj, (int, float, str)):
-        return obj
+    if issubclass(cls, (int, float, str)) or cls is type(None):
+        return _JSON_PRIMITIVE
+    elif issubclass(cls, dict):
+        return _JSON_DICT
+    elif issubclass(cls, (list, tuple)):
+        return _JSON_LIST
 
-    if isinstance(obj, dict):
-        return {k: clean_to_json_compatible(v, **kwargs) for k, v in obj.items()}
-    elif isinstance(obj, (list, tuple)):
-        if obj:
-            # Must process list recursively even though it may be slow
-            return [clean_to_json_compatible(v, **kwargs) for v in obj]
+    np = modules["np"]
+    if np is not None:
+        if cls is type(np.ma.core.masked):
+            return _clean_json_value
+        elif issubclass(cls, np.ndarray):
+            return _clean_json_ndarray
+        elif issubclass(cls, np.datetime64):
+            return _clean_json_str
+        elif issubclass(cls, np.generic):
+            return _clean_json_tolist
 
-    # unpack kwargs
-    numpy_allowed = kwargs.get("numpy_allowed", False)
-    datetime_allowed = kwargs.get("datetime_allowed", False)
+    if cls is datetime.datetime:
+        return _clean_json_datetime
+    elif cls is datetime.date:
+        return _clean_json_date
+    elif cls is decimal.Decimal:
+        return _clean_json_decimal
+    elif hasattr(cls, "to_plotly_json") and not any(
+        hasattr(cls, attr) for attr in ("to_pydatetime", "isoformat", "tolist")
+    ):
+        return _clean_json_plotly
 
-    modules = kwargs.get("modules", {})
+    return _clean_json_value
+
+
+def _clean_json_str(obj, numpy_allowed, datetime_allowed, modules):
+    return str(obj), False
+
+
+def _clean_json_tolist(obj, numpy_allowed, datetime_allowed, modules):
+    return obj.tolist(), False
+
+
+def _clean_json_decimal(obj, numpy_allowed, datetime_allowed, modules):
+    return float(obj), False
+
+
+def _clean_json_datetime(obj, numpy_allowed, datetime_allowed, modules):
+    return (obj if datetime_allowed else obj.isoformat()), False
+
+
+def _clean_json_date(obj, numpy_allowed, datetime_allowed, modules):
+    return (obj if datetime_allowed else obj.isoformat()), True
+
+
+def _clean_json_plotly(obj, numpy_allowed, datetime_allowed, modules):
+    return obj.to_plotly_json(), True
+
+
+def _clean_json_ndarray(obj, numpy_allowed, datetime_allowed, modules):
+    np = modules["np"]
+    kind = obj.dtype.kind
+    if numpy_allowed and kind in ("b", "i", "u", "f"):
+        return np.ascontiguousarray(obj), False
+    elif kind == "M":
+        # datetime64 array
+        return np.datetime_as_string(obj).tolist(), False
+    elif kind == "O":
+        # Treat object array as a lists, continue processing
+        return obj.tolist(), True
+    else:
+        return obj.tolist(), False
+
+
+def _clean_json_value(obj, numpy_allowed, datetime_allowed, modules):
+    # Convert a value that is not a primitive or a container by probing
+    # the conversions it supports
     sage_all = modules["sage_all"]
     np = modules["np"]
     pd = modules["pd"]
@@ -505,53 +1279,31 @@ def clean_to_json_compatible(obj, **kwargs):
     # Sage
     if sage_all is not None:
         if obj in sage_all.RR:
-            return float(obj)
+            return float(obj), False
         elif obj in sage_all.ZZ:
-            return int(obj)
+            return int(obj), False
 
     # numpy
     if np is not None:
         if obj is np.ma.core.masked:
-            return float("nan")
+            return float("nan"), False
         elif isinstance(obj, np.ndarray):
-            if numpy_allowed and obj.dtype.kind in ("b", "i", "u", "f"):
-                return np.ascontiguousarray(obj)
-            elif obj.dtype.kind == "M":
-                # datetime64 array
-                return np.datetime_as_string(obj).tolist()
-            elif obj.dtype.kind == "U":
-                return obj.tolist()
-            elif obj.dtype.kind == "O":
-                # Treat object array as a lists, continue processing
-                obj = obj.tolist()
+            return _clean_json_ndarray(obj, numpy_allowed, datetime_allowed, modules)
         elif isinstance(obj, np.datetime64):
-            return str(obj)
+            return str(obj), False
 
     # pandas
     if pd is not None:
         if obj is pd.NaT:
-            return None
+            return None, False
         elif isinstance(obj, (pd.Series, pd.DatetimeIndex)):
             if numpy_allowed and obj.dtype.kind in ("b", "i", "u", "f"):
-                return np.ascontiguousarray(obj.values)
+                return np.ascontiguousarray(obj.values), False
             elif obj.dtype.kind == "M":
-                if isinstance(obj, pd.Series):
-                    with warnings.catch_warnings():
-                        warnings.simplefilter("ignore", FutureWarning)
-                        # Series.dt.to_pydatetime will return Index[object]
-                        # https://github.com/pandas-dev/pandas/pull/52459
-                        dt_values = np.array(obj.dt.to_pydatetime()).tolist()
-                else:  # DatetimeIndex
-                    dt_values = obj.to_pydatetime().tolist()
-
-                if not datetime_allowed:
-                    # Note: We don't need to handle dropping timezones here because
-                    # numpy's datetime64 doesn't support them and pandas's tz_localize
-                    # above drops them.
-                    for i in range(len(dt_values)):
-                        dt_values[i] = dt_values[i].isoformat()
-
-                return dt_values
+                # The strings are the same as those produced by isoformat, and
+                # by orjson from datetime objects, so they are used whether or
+                # not datetime objects are allowed
+                return _datetime_values_to_isoformat(obj, np, pd), False
 
     # datetime and date
     try:
@@ -563,25 +1315,25 @@ def clean_to_json_compatible(obj, **kwargs):
 
     if not datetime_allowed:
         try:
-            return obj.isoformat()
+            return obj.isoformat(), False
         except (TypeError, AttributeError):
             pass
     elif isinstance(obj, datetime.datetime):
-        return obj
+        return obj, False
 
     # Try .tolist() convertible, do not recurse inside
     try:
-        return obj.tolist()
+        return obj.tolist(), False
     except AttributeError:
         pass
 
     # Do best we can with decimal
     if isinstance(obj, decimal.Decimal):
-        return float(obj)
+        return float(obj), False
 
     # PIL
     if image is not None and isinstance(obj, image.Image):
-        return ImageUriValidator.pil_image_to_uri(obj)
+        return ImageUriValidator.pil_image_to_uri(obj), False
 
     # Plotly
     try:
@@ -590,11 +1342,115 @@ def clean_to_json_compatible(obj, **kwargs):
         pass
 
     # Recurse into lists and dictionaries
-    if isinstance(obj, dict):
-        return {k: clean_to_json_compatible(v, **kwargs) for k, v in obj.items()}
-    elif isinstance(obj, (list, tuple)):
-        if obj:
-            # Must process list recursively even though it may be slow
-            return [clean_to_json_compatible(v, **kwargs) for v in obj]
+    return obj, True
 
-    return obj
+
+def _datetime_values_to_isoformat(obj, np, pd):
+    """
+    Format the values of a datetime pandas Series or DatetimeIndex as the
+    strings returned by the isoformat method of the corresponding datetime
+    objects, without constructing those objects
+
+    Values are truncated to microseconds, and the fractional part is omitted
+    for values that fall on a whole second. Missing values are formatted as
+    "NaT".
+
+    Parameters
+    ----------
+    obj: pd.Series or pd.DatetimeIndex
+    np: module
+    pd: module
+
+    Returns
+    -------
+    list of str
+    """
+    index = pd.DatetimeIndex(obj)
+    tz = index.tz
+    if tz is not None:
+        # Format the local wall times, and append the UTC offsets below
+        local = index.tz_localize(None)
+    else:
+        local = index
+
+    ticks = local.values.astype("M8[us]").view("int64")
+    nat = np.isnat(local.values)
+    ticks[nat] = 0
+
+    # Split into date and time of day, and compute the calendar date of each
+    # day (http://howardhinnant.github.io/date_algorithms.html#civil_from_days)
+    days, time_of_day = np.divmod(ticks, 86400000000)
+    days += 719468
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (
+        day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096
+    ) // 365
+    day_of_year = day_of_era - (
+        365 * year_of_era + year_of_era // 4 - year_of_era // 100
+    )
+    month_index = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * month_index + 2) // 5 + 1
+    month = np.where(month_index < 10, month_index + 3, month_index - 9)
+    year = year_of_era + era * 400 + (month <= 2)
+
+    if year.size and (year.min() < 1 or year.max() > 9999):
+        # Out of the range of datetime objects
+        return [dt.isoformat() for dt in np.array(index.to_pydatetime()).tolist()]
+
+    hour, time_of_day = np.divmod(time_of_day, 3600000000)
+    minute, time_of_day = np.divmod(time_of_day, 60000000)
+    second, microsecond = np.divmod(time_of_day, 1000000)
+
+    # Write the characters of the strings into an array of unicode code
+    # points, which is then viewed as an array of fixed width strings. The
+    # array is filled one character position at a time, so it is built
+    # transposed to keep those writes contiguous.
+    width = 26 if tz is None else 35
+    chars = np.zeros((width, len(ticks)), dtype="uint32")
+
+    def write_digits(row, values, ndigits):
+        for i in range(ndigits - 1, -1, -1):
+            values, digit = np.divmod(values, 10)
+            np.add(digit, ord("0"), out=chars[row + i], casting="unsafe")
+
+    write_digits(0, year, 4)
+    write_digits(5, month, 2)
+    write_digits(8, day, 2)
+    write_digits(11, hour, 2)
+    write_digits(14, minute, 2)
+    write_digits(17, second, 2)
+    write_digits(20, microsecond, 6)
+    chars[[4, 7]] = ord("-")
+    chars[10] = ord("T")
+    chars[[13, 16]] = ord(":")
+    chars[19] = ord(".")
+
+    whole_seconds = microsecond == 0
+    chars[19:26, whole_seconds] = 0
+
+    if tz is not None:
+        # UTC offsets as +HH:MM, or +HH:MM:SS if they include seconds,
+        # written after the microseconds and then moved to the place of the
+        # fractional part on whole seconds
+        offsets = (local.values - index.tz_convert(None).values).astype("m8[s]")
+        offsets = offsets.view("int64")
+        offsets[nat] = 0
+        chars[26] = np.where(offsets < 0, ord("-"), ord("+"))
+        offset_hour, offset_seconds = np.divmod(np.abs(offsets), 3600)
+        offset_minute, offset_second = np.divmod(offset_seconds, 60)
+        write_digits(27, offset_hour, 2)
+        write_digits(30, offset_minute, 2)
+        write_digits(33, offset_second, 2)
+        chars[[29, 32]] = ord(":")
+        chars[32:, offset_second == 0] = 0
+
+        for row in range(19, 28):
+            chars[row] = np.where(whole_seconds, chars[row + 7], chars[row])
+        chars[28:, whole_seconds] = 0
+
+    chars[:, nat] = 0
+    chars[:3, nat] = [[ord("N")], [ord("a")], [ord("T")]]
+
+    chars = np.ascontiguousarray(chars.T)
+    return chars.view("U{width}".format(width=width)).ravel().tolist()
@@ -1,8 +1,13 @@
 import os
 import json
+import queue
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
 import plotly
 from plotly.io._utils import validate_coerce_fig_to_dict
+from plotly.io._image_cache import ImageCache, image_cache_key
 
 try:
     from kaleido.scopes.plotly import PlotlyScope
@@ -21,6 +26,142 @@ except ImportError:
     PlotlyScope = None
     scope = None
 
+# Kaleido configuration class
+# ---------------------------
+class KaleidoConfig(object):
+    """
+    Settings of the image export functions that are not settings of the
+    Kaleido scope
+    """
+
+    def __init__(self):
+        self._async_workers = 1
+        self._image_cache_dir = None
+        self._image_cache_size = 2**30
+        self._full_figure_cache_size = 128
+
+    @property
+    def async_workers(self):
+        """
+        The maximum number of figures exported concurrently by the coroutines
+        to_image_async, write_image_async and
+        full_figure_for_development_async. Further calls wait without
+        blocking the event loop. Each concurrent Kaleido export uses its own
+        Kaleido process.
+
+        Returns
+        -------
+        int
+        """
+        return self._async_workers
+
+    @async_workers.setter
+    def async_workers(self, val):
+        if not isinstance(val, int) or isinstance(val, bool) or val < 1:
+            raise ValueError(
+                "async_workers must be a positive integer\n"
+                "    Received value: {val}".format(val=repr(val))
+            )
+        self._async_workers = val
+
+    @property
+    def image_cache_dir(self):
+        """
+        Directory of the cache of static images, or None (the default) to
+        disable the cache.
+
+        When the cache is enabled, the images exported by to_image,
+        write_image and the functions based on them are stored in this
+        directory, and exporting the same figure with the same options and
+        plotly.js version again returns the stored image without running
+        Kaleido or Orca. The directory can be shared by several processes.
+
+        Images are keyed on the figure, the export options and the
+        rendering settings of the Kaleido scope or of the orca configuration
+        (the plotlyjs, mathjax, topojson and mapbox_access_token settings).
+
+        Returns
+        -------
+        str or pathlib.Path or None
+        """
+        return self._image_cache_dir
+
+    @image_cache_dir.setter
+    def image_cache_dir(self, val):
+        if val is not None and not isinstance(val, (str, Path)):
+            raise ValueError(
+                "image_cache_dir must be a string, a pathlib.Path or None\n"
+                "    Received value: {val}".format(val=repr(val))
+            )
+        self._image_cache_dir = val
+
+    @property
+    def image_cache_size(self):
+        """
+        Maximum total size in bytes of the images in the image cache
+        (default 1 GiB). When it is exceeded, the least recently used
+        images are removed.
+
+        Returns
+        -------
+        int
+        """
+        return self._image_cache_size
+
+    @image_cache_size.setter
+    def image_cache_size(self, val):
+        if not isinstance(val, int) or isinstance(val, bool) or val < 0:
+            raise ValueError(
+                "image_cache_size must be a non-negative integer\n"
+                "    Received value: {val}".format(val=repr(val))
+            )
+        self._image_cache_size = val
+
+    @property
+    def full_figure_cache_size(self):
+        """
+        Maximum number of full figures computed by
+        full_figure_for_development that are kept in memory (default 128),
+        or 0 to disable the in-memory cache. When image_cache_dir is set,
+        full figures are also stored in the image cache.
+
+        Full figures are keyed on the input figure, the default image size
+        and the plotlyjs, mathjax, topojson and mapbox_access_token settings
+        of the Kaleido scope and the plotly.js version, and each call returns
+        a new figure or dict.
+
+        Returns
+        -------
+        int
+        """
+        return self._full_figure_cache_size
+
+    @full_figure_cache_size.setter
+    def full_figure_cache_size(self, val):
+        if not isinstance(val, int) or isinstance(val, bool) or val < 0:
+            raise ValueError(
+                "full_figure_cache_size must be a non-negative integer\n"
+                "    Received value: {val}".format(val=repr(val))
+            )
+        self._full_figure_cache_size = val
+        with _full_figure_cache_lock:
+            while len(_full_figure_cache) > val:
+                _full_figure_cache.popitem(last=False)
+
+
+# In-memory cache of full figures, from their keys to the JSON bytes returned
+# by Kaleido, in least recently used order
+_full_figure_cache = OrderedDict()
+_full_figure_cache_lock = threading.Lock()
+
+config = KaleidoConfig()
+
+# Additional Kaleido scopes used by write_images to export figures
+# concurrently. They are kept alive between calls, so that their Kaleido
+# processes are only started once.
+_scope_pool = []
+_scope_pool_lock = threading.Lock()
+
 
 def to_image(
     fig, format=None, width=None, height=None, scale=None, validate=True, engine="auto"
@@ -90,6 +231,17 @@ def to_image(
     bytes
         The image data
     """
+    return _to_image(fig, format, width, height, scale, validate, engine)
+
+
+def _to_image(fig, format, width, height, scale, validate, engine, scopes=None):
+    """
+    Convert a figure to a static image bytes string. Kaleido exports use a
+    scope taken from the scopes queue if it is not None, and the module-level
+    scope otherwise.
+
+    See to_image for a description of the other parameters.
+    """
     # Handle engine
     # -------------
     if engine == "auto":
@@ -108,18 +260,22 @@ def to_image(
                 # message advising the installation of kaleido
                 engine = "kaleido"
 
+    image_cache = _get_image_cache()
+
     if engine == "orca":
         # Fall back to legacy orca image export path
-        from ._orca import to_image as to_image_orca
-
-        return to_image_orca(
-            fig,
-            format=format,
-            width=width,
-            height=height,
-            scale=scale,
-            validate=validate,
-        )
+        from ._orca import to_image as to_image_orca, config as orca_config
+
+        if image_cache is None:
+            return to_image_orca(
+                fig,
+                format=format,
+                width=width,
+                height=height,
+                scale=scale,
+                validate=validate,
+            )
+        defaults = orca_config
     elif engine != "kaleido":
         raise ValueError(
             "Invalid image export engine specified: {engine}".format(
@@ -128,7 +284,7 @@ def to_image(
         )
 
     # Raise informative error message if Kaleido is not installed
-    if scope is None:
+    elif scope is None:
         raise ValueError(
             """
 Image export using the "kaleido" engine requires the kaleido package,
@@ -136,17 +292,85 @@ which can be installed using pip:
     $ pip install -U kaleido
 """
         )
+    else:
+        defaults = scope
 
     # Validate figure
     # ---------------
     fig_dict = validate_coerce_fig_to_dict(fig, validate)
-    img_bytes = scope.transform(
-        fig_dict, format=format, width=width, height=height, scale=scale
-    )
+
+    # Look up cached image
+    # --------------------
+    if image_cache is not None:
+        key = image_cache_key(
+            fig_dict,
+            engine,
+            format or defaults.default_format,
+            width or defaults.default_width,
+            height or defaults.default_height,
+            scale or defaults.default_scale,
+            _render_settings(engine),
+        )
+        img_bytes = image_cache.get(key)
+        if img_bytes is not None:
+            return img_bytes
+
+    # Export image
+    # ------------
+    if engine == "orca":
+        img_bytes = to_image_orca(
+            fig_dict,
+            format=format,
+            width=width,
+            height=height,
+            scale=scale,
+            validate=False,
+        )
+    else:
+        with _checkout_scope(scopes) as export_scope:
+            img_bytes = export_scope.transform(
+                fig_dict, format=format, width=width, height=height, scale=scale
+            )
+
+    if image_cache is not None:
+        image_cache.put(key, img_bytes)
 
     return img_bytes
 
 
+def _render_settings(engine):
+    # Settings of the export engine that affect rendering, besides the export
+    # options, which are part of the cache keys
+    if engine == "orca":
+        from ._orca import config as orca_config
+
+        return {
+            name: getattr(orca_config, name)
+            for name in ("plotlyjs", "mathjax", "topojson", "mapbox_access_token")
+        }
+    return {flag: getattr(scope, flag) for flag in scope._scope_flags}
+
+
+# Image cache of the last cache settings, as ((directory, size), cache)
+_image_cache = None
+
+
+def _get_image_cache():
+    # Return the ImageCache for the current settings, or None if disabled
+    global _image_cache
+
+    directory = config.image_cache_dir
+    if directory is None:
+        return None
+
+    settings = (directory, config.image_cache_size)
+    cached = _image_cache
+    if cached is None or cached[0] != settings:
+        cached = (settings, ImageCache(*settings))
+        _image_cache = cached
+    return cached[1]
+
+
 def write_image(
     fig,
     file,
@@ -227,21 +451,49 @@ def write_image(
     -------
     None
     """
+    _write_image(fig, file, format, scale, width, height, validate, engine)
+
+
+def _write_image(
+    fig, file, format, scale, width, height, validate, engine, scopes=None
+):
+    """
+    Convert a figure to a static image and write it to a file or writeable
+    object. See _to_image for a description of the scopes parameter, and
+    write_image for a description of the other parameters.
+    """
     # Try to cast `file` as a pathlib object `path`.
     # ----------------------------------------------
+    path = _as_path(file)
+
+    # Infer format if not specified
+    # -----------------------------
+    format = _infer_format(path, file, format)
+
+    # Request image
+    # -------------
+    # Do this first so we don't create a file if image conversion fails
+    img_data = _to_image(fig, format, width, height, scale, validate, engine, scopes)
+
+    # Open file
+    # ---------
+    _write_bytes(img_data, path, file)
+
+
+def _as_path(file):
     if isinstance(file, str):
         # Use the standard Path constructor to make a pathlib object.
-        path = Path(file)
+        return Path(file)
     elif isinstance(file, Path):
         # `file` is already a Path object.
-        path = file
+        return file
     else:
         # We could not make a Path object out of file. Either `file` is an open file
         # descriptor with a `write()` method or it's an invalid object.
-        path = None
+        return None
 
-    # Infer format if not specified
-    # -----------------------------
+
+def _infer_format(path, file, format):
     if path is not None and format is None:
         ext = path.suffix
         if ext:
@@ -259,22 +511,10 @@ For example:
                     file=file
                 )
             )
+    return format
 
-    # Request image
-    # -------------
-    # Do this first so we don't create a file if image conversion fails
-    img_data = to_image(
-        fig,
-        format=format,
-        scale=scale,
-        width=width,
-        height=height,
-        validate=validate,
-        engine=engine,
-    )
 
-    # Open file
-    # ---------
+def _write_bytes(img_data, path, file):
     if path is None:
         # We previously failed to make sense of `file` as a pathlib object.
         # Attempt to write to `file` as an open file descriptor.
@@ -296,6 +536,170 @@ The 'file' argument '{file}' is not a string, pathlib.Path object, or file descr
         path.write_bytes(img_data)
 
 
+def write_images(
+    figs,
+    files,
+    format=None,
+    scale=None,
+    width=None,
+    height=None,
+    validate=True,
+    workers=1,
+):
+    """
+    Convert a sequence of figures to static images with Kaleido and write
+    them to files or writeable objects
+
+    The figures are exported by `workers` Kaleido processes concurrently.
+    The first process is the one used by to_image and write_image, and the
+    others are started on first use and kept alive for later calls. A
+    figure that fails to be exported doesn't stop the export of the others:
+    the error is returned instead.
+
+    Parameters
+    ----------
+    figs: iterable
+        Figure objects or dicts representing figures
+
+    files: iterable
+        Strings representing local file paths or writeable objects (e.g.
+        pathlib.Path objects or open file descriptors), one per figure
+
+    format: str or None
+        The desired image format. See write_image for the supported formats.
+        If not specified, the format of each file path is inferred from its
+        extension, and the format of writeable objects defaults to
+        `plotly.io.kaleido.scope.default_format`.
+
+    width: int or None
+        The width of the exported images in layout pixels. If not specified,
+        will default to `plotly.io.kaleido.scope.default_width`.
+
+    height: int or None
+        The height of the exported images in layout pixels. If not
+        specified, will default to `plotly.io.kaleido.scope.default_height`.
+
+    scale: int or float or None
+        The scale factor to use when exporting the figures. If not
+        specified, will default to `plotly.io.kaleido.scope.default_scale`.
+
+    validate: bool
+        True if the figures should be validated before being converted to
+        images, False otherwise.
+
+    workers: int (default 1)
+        Number of Kaleido processes exporting figures concurrently
+
+    Returns
+    -------
+    list
+        For each figure, None if its image was written, or the exception
+        raised while exporting it
+    """
+    from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+    import itertools
+
+    if scope is None:
+        raise ValueError(
+            """
+Image export using the "kaleido" engine requires the kaleido package,
+which can be installed using pip:
+    $ pip install -U kaleido
+"""
+        )
+
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+        raise ValueError("Invalid workers: %s" % workers)
+
+    # Each scope exports one figure at a time, so scopes are taken from a
+    # queue by the threads for the duration of an export
+    free_scopes = _scope_queue(workers)
+
+    def export(fig, file):
+        _write_image(
+            fig, file, format, scale, width, height, validate, "kaleido", free_scopes
+        )
+
+    # Submit figures
+    # --------------
+    # At most two figures per worker are submitted ahead, so that figures
+    # can be generated lazily by the figs iterable
+    errors = {}
+    pending = {}
+    sentinel = object()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for i, (fig, file) in enumerate(
+            itertools.zip_longest(figs, files, fillvalue=sentinel)
+        ):
+            if fig is sentinel or file is sentinel:
+                raise ValueError("figs and files must have the same length")
+
+            if len(pending) >= 2 * workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    errors[pending.pop(future)] = future.exception()
+
+            pending[executor.submit(export, fig, file)] = i
+
+        for future, i in pending.items():
+            errors[i] = future.exception()
+
+    return [errors[i] for i in range(len(errors))]
+
+
+def _get_scopes(n):
+    """
+    Return n Kaleido scopes: the module-level scope, followed by scopes from
+    the pool of additional scopes
+    """
+    with _scope_pool_lock:
+        while len(_scope_pool) < n - 1:
+            pool_scope = PlotlyScope(chromium_args=scope.chromium_args)
+            _scope_pool.append(pool_scope)
+
+        return [scope] + _scope_pool[: n - 1]
+
+
+def _scope_queue(n):
+    # Queue of n scopes for _checkout_scope
+    free_scopes = queue.Queue()
+    for free_scope in _get_scopes(n):
+        free_scopes.put(free_scope)
+    return free_scopes
+
+
+@contextmanager
+def _checkout_scope(scopes):
+    """
+    Take a scope from the scopes queue for the duration of the context, or
+    use the module-level scope if scopes is None
+
+    Scopes from the pool are given the current settings of the module-level
+    scope. Setting a scope flag restarts the Kaleido process, so flags are
+    only set if they differ.
+    """
+    if scopes is None:
+        yield scope
+        return
+
+    free_scope = scopes.get()
+    try:
+        if free_scope is not scope:
+            for flag in PlotlyScope._scope_flags:
+                if getattr(free_scope, flag) != getattr(scope, flag):
+                    setattr(free_scope, flag, getattr(scope, flag))
+            for name in (
+                "default_format",
+                "default_width",
+                "default_height",
+                "default_scale",
+            ):
+                setattr(free_scope, name, getattr(scope, name))
+        yield free_scope
+    finally:
+        scopes.put(free_scope)
+
+
 def full_figure_for_development(fig, warn=True, as_dict=False):
     """
     Compute default values for all attributes not specified in the input figure and
@@ -304,6 +708,10 @@ def full_figure_for_development(fig, warn=True, as_dict=False):
     during development to learn more about how Plotly.js computes default values and is
     not generally necessary or recommended for production use.
 
+    Full figures are cached in memory, and in the image cache when it is enabled,
+    so that repeated calls on the same figure don't run Kaleido again. See
+    `plotly.io.kaleido.config.full_figure_cache_size`.
+
     Parameters
     ----------
     fig:
@@ -321,7 +729,15 @@ def full_figure_for_development(fig, warn=True, as_dict=False):
     plotly.graph_objects.Figure or dict
         The full figure
     """
+    return _full_figure_for_development(fig, warn, as_dict)
 
+
+def _full_figure_for_development(fig, warn, as_dict, scopes=None):
+    """
+    Compute the full figure of a figure. See _to_image for a description of
+    the scopes parameter, and full_figure_for_development for a description
+    of the other parameters.
+    """
     # Raise informative error message if Kaleido is not installed
     if scope is None:
         raise ValueError(
@@ -341,7 +757,8 @@ which can be installed using pip:
             "To suppress this warning, set warn=False"
         )
 
-    fig = json.loads(scope.transform(fig, format="json").decode("utf-8"))
+    fig_dict = validate_coerce_fig_to_dict(fig, False)
+    fig = json.loads(_full_figure_json(fig_dict, scopes).decode("utf-8"))
     if as_dict:
         return fig
     else:
@@ -350,4 +767,164 @@ which can be installed using pip:
         return go.Figure(fig, skip_invalid=True)
 
 
-__all__ = ["to_image", "write_image", "scope", "full_figure_for_development"]
+def _full_figure_json(fig_dict, scopes):
+    """
+    Return the JSON bytes of the full figure of a figure dict, from the
+    in-memory cache or the image cache when possible
+    """
+    max_size = config.full_figure_cache_size
+    image_cache = _get_image_cache()
+    if not max_size and image_cache is None:
+        with _checkout_scope(scopes) as export_scope:
+            return export_scope.transform(fig_dict, format="json")
+
+    key = image_cache_key(
+        fig_dict,
+        "kaleido",
+        "json",
+        scope.default_width,
+        scope.default_height,
+        None,
+        _render_settings("kaleido"),
+    )
+    with _full_figure_cache_lock:
+        full_fig_json = _full_figure_cache.get(key)
+        if full_fig_json is not None:
+            _full_figure_cache.move_to_end(key)
+            return full_fig_json
+
+    if image_cache is not None:
+        full_fig_json = image_cache.get(key)
+
+    if full_fig_json is None:
+        with _checkout_scope(scopes) as export_scope:
+            full_fig_json = export_scope.transform(fig_dict, format="json")
+        if image_cache is not None:
+            image_cache.put(key, full_fig_json)
+
+    if max_size:
+        with _full_figure_cache_lock:
+            _full_figure_cache[key] = full_fig_json
+            _full_figure_cache.move_to_end(key)
+            while len(_full_figure_cache) > max_size:
+                _full_figure_cache.popitem(last=False)
+
+    return full_fig_json
+
+
+# Asynchronous export
+# -------------------
+# Thread pool and queue of scopes of the coroutines, with the number of
+# workers and the module-level scope they were created for
+_async_pool = None
+_async_pool_lock = threading.Lock()
+
+
+def _get_async_pool():
+    global _async_pool
+    from concurrent.futures import ThreadPoolExecutor
+
+    with _async_pool_lock:
+        workers = config.async_workers
+        if _async_pool is None or _async_pool[:2] != (workers, scope):
+            if _async_pool is not None:
+                _async_pool[2].shutdown(wait=False)
+            executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="plotly-image-export"
+            )
+            scopes = _scope_queue(workers) if scope is not None else None
+            _async_pool = (workers, scope, executor, scopes)
+        return _async_pool[2:]
+
+
+async def _run_async(func, *args):
+    # Run func in the thread pool of the coroutines, passing the queue of
+    # scopes as the last argument
+    import asyncio
+
+    executor, scopes = _get_async_pool()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, func, *args, scopes)
+
+
+async def to_image_async(
+    fig, format=None, width=None, height=None, scale=None, validate=True, engine="auto"
+):
+    """
+    Coroutine that converts a figure to a static image bytes string
+
+    The export runs in a thread pool, so that the event loop is not blocked
+    while Kaleido or Orca renders the image. At most
+    `plotly.io.kaleido.config.async_workers` figures are exported at once.
+
+    See to_image for a description of the parameters.
+
+    Returns
+    -------
+    bytes
+        The image data
+    """
+    return await _run_async(
+        _to_image, fig, format, width, height, scale, validate, engine
+    )
+
+
+async def write_image_async(
+    fig,
+    file,
+    format=None,
+    scale=None,
+    width=None,
+    height=None,
+    validate=True,
+    engine="auto",
+):
+    """
+    Coroutine that converts a figure to a static image and writes it to a
+    file or writeable object
+
+    The export runs in a thread pool, so that the event loop is not blocked
+    while Kaleido or Orca renders the image. At most
+    `plotly.io.kaleido.config.async_workers` figures are exported at once.
+
+    See write_image for a description of the parameters.
+
+    Returns
+    -------
+    None
+    """
+    await _run_async(
+        _write_image, fig, file, format, scale, width, height, validate, engine
+    )
+
+
+async def full_figure_for_development_async(fig, warn=True, as_dict=False):
+    """
+    Coroutine that computes default values for all attributes not specified
+    in the input figure and returns the output as a "full" figure
+
+    The computation runs in a thread pool, so that the event loop is not
+    blocked while Kaleido runs plotly.js. At most
+    `plotly.io.kaleido.config.async_workers` figures are processed at once.
+
+    See full_figure_for_development for a description of the parameters.
+
+    Returns
+    -------
+    plotly.graph_objects.Figure or dict
+        The full figure
+    """
+    return await _run_async(_full_figure_for_development, fig, warn, as_dict)
+
+
+__all__ = [
+    "to_image",
+    "write_image",
+    "write_images",
+    "to_image_async",
+    "write_image_async",
+    "full_figure_for_development_async",
+    "scope",
+    "config",
+    "full_figure_for_development",
+]
@@ -318,7 +318,7 @@ Failed to write orca configuration file at '{path}'""".format(
         The server URL to use for an external orca server, or None if orca
         should be managed locally
 
-        Overrides executable, port, timeout, mathjax, topojson,
+        Overrides executable, port, timeout, pool_size, mathjax, topojson,
         and mapbox_access_token
 
         Returns
@@ -349,6 +349,7 @@ The server_url property must be a string, but received value of type {typ}.
         self.executable = None
         self.port = None
         self.timeout = None
+        self.pool_size = None
         self.mathjax = None
         self.topojson = None
         self.mapbox_access_token = None
@@ -479,6 +480,46 @@ The timeout property must be a number, but received value of type {typ}.
         # Server must restart before setting is active
         shutdown_server()
 
+    @property
+    def pool_size(self):
+        """
+        The number of orca server processes to launch.
+
+        Image requests are dispatched to the server with the fewest requests
+        in progress, in round-robin order among equally busy servers, so
+        that images may be exported from several threads at once. Server
+        processes that have exited are restarted before the next request,
+        and servers that time out on a request are replaced once the other
+        requests in progress on them have completed.
+
+        If the port property is set, the first server listens on that port
+        and the others on ports that are chosen automatically.
+
+        Returns
+        -------
+        int
+        """
+        return self._props.get("pool_size", 1)
+
+    @pool_size.setter
+    def pool_size(self, val):
+
+        if val is None:
+            self._props.pop("pool_size", None)
+        else:
+            if not isinstance(val, int) or isinstance(val, bool) or val < 1:
+                raise ValueError(
+                    """
+The pool_size property must be a positive integer, but received value of type {typ}.
+    Received value: {val}""".format(
+                        typ=type(val), val=val
+                    )
+                )
+            self._props["pool_size"] = val
+
+        # Server must restart before setting is active
+        shutdown_server()
+
     @property
     def default_width(self):
         """
@@ -755,6 +796,7 @@ orca configuration
     executable: {executable}
     port: {port}
     timeout: {timeout}
+    pool_size: {pool_size}
     default_width: {default_width}
     default_height: {default_height}
     default_scale: {default_scale}
@@ -774,6 +816,7 @@ constants
             port=self.port,
             executable=self.executable,
             timeout=self.timeout,
+            pool_size=self.pool_size,
             default_width=self.default_width,
             default_height=self.default_height,
             default_scale=self.default_scale,
@@ -1210,8 +1253,11 @@ def reset_status():
 
 # Initialze process control variables
 # -----------------------------------
+# orca_state["servers"] holds one dict per orca server process, with the
+# process, its port, its command and the number of requests in progress.
+# orca_state["proc"] and orca_state["port"] refer to the first server.
 orca_lock = threading.Lock()
-orca_state = {"proc": None, "shutdown_timer": None}
+orca_state = {"proc": None, "shutdown_timer": None, "servers": [], "next_server": 0}
 
 
 # Shutdown
@@ -1225,7 +1271,7 @@ def cleanup():
 
 def shutdown_server():
     """
-    Shutdown the running orca server process, if any
+    Shutdown the running orca server processes, if any
 
     Returns
     -------
@@ -1237,31 +1283,13 @@ def shutdown_server():
         with orca_lock:
             if orca_state["proc"] is not None:
 
-                # We use psutil to kill all child processes of the main orca
-                # process. This prevents any zombie processes from being
-                # left over, and it saves us from needing to write
-                # OS-specific process management code here.
-
-                parent = psutil.Process(orca_state["proc"].pid)
-                for child in parent.children(recursive=True):
-                    try:
-                        child.terminate()
-                    except:
-                        # We tried, move on
-                        pass
-
-                try:
-                    # Kill parent process
-                    orca_state["proc"].terminate()
-
-                    # Wait for the process to shutdown
-                    child_status = orca_state["proc"].wait()
-                except:
-                    # We tried, move on
-                    pass
+                for server in orca_state["servers"]:
+                    _kill_server_process(server["proc"])
 
                 # Update our internal process management state
                 orca_state["proc"] = None
+                orca_state["servers"] = []
+                orca_state["next_server"] = 0
 
                 if orca_state["shutdown_timer"] is not None:
                     orca_state["shutdown_timer"].cancel()
@@ -1277,11 +1305,124 @@ def shutdown_server():
                 status._props["command"] = None
 
 
+def _kill_server_process(proc):
+    # We use psutil to kill all child processes of the main orca
+    # process. This prevents any zombie processes from being
+    # left over, and it saves us from needing to write
+    # OS-specific process management code here.
+    try:
+        parent = psutil.Process(proc.pid)
+        children = parent.children(recursive=True)
+    except:
+        # The process has already exited
+        children = []
+
+    for child in children:
+        try:
+            child.terminate()
+        except:
+            # We tried, move on
+            pass
+
+    try:
+        # Kill parent process
+        proc.terminate()
+
+        # Wait for the process to shutdown
+        proc.wait()
+    except:
+        # We tried, move on
+        pass
+
+
+def _start_server_process(index):
+    """
+    Launch the orca server process at position `index` of the pool. Must be
+    called with orca_lock held.
+    """
+    # Determine server port
+    if index == 0 and config.port is not None:
+        port = config.port
+    else:
+        port = find_open_port()
+
+    # Build orca command list
+    cmd_list = status._props["executable_list"] + [
+        "serve",
+        "-p",
+        str(port),
+        "--plotly",
+        config.plotlyjs,
+        "--graph-only",
+    ]
+
+    if config.topojson:
+        cmd_list.extend(["--topojson", config.topojson])
+
+    if config.mathjax:
+        cmd_list.extend(["--mathjax", config.mathjax])
+
+    if config.mapbox_access_token:
+        cmd_list.extend(["--mapbox-access-token", config.mapbox_access_token])
+
+    # Create subprocess that launches the orca server on the
+    # specified port.
+    DEVNULL = open(os.devnull, "wb")
+    with orca_env():
+        stderr = DEVNULL if "CI" in os.environ else None  # fix for CI
+        proc = subprocess.Popen(cmd_list, stdout=DEVNULL, stderr=stderr)
+
+    return {
+        "proc": proc,
+        "port": port,
+        "command": cmd_list,
+        "active": 0,
+        "unhealthy": False,
+    }
+
+
+def _restart_server_process(server):
+    """
+    Replace an orca server process of the pool by a new one. Must be called
+    with orca_lock held.
+    """
+    index = orca_state["servers"].index(server)
+    _kill_server_process(server["proc"])
+    new_server = _start_server_process(index)
+    orca_state["servers"][index] = new_server
+    if index == 0:
+        _update_server_status()
+    return new_server
+
+
+def _replace_unhealthy_servers():
+    """
+    Restart the orca server processes that were marked as unhealthy and have
+    no requests in progress. Must be called with orca_lock held.
+    """
+    for server in list(orca_state["servers"]):
+        if server["unhealthy"] and server["active"] == 0:
+            _restart_server_process(server)
+
+
+def _update_server_status():
+    # Update orca.status so the user has an accurate view
+    # of the state of the orca server
+    server = orca_state["servers"][0]
+    orca_state["proc"] = server["proc"]
+    orca_state["port"] = server["port"]
+    status._props["state"] = "running"
+    status._props["pid"] = server["proc"].pid
+    status._props["port"] = server["port"]
+    status._props["command"] = server["command"]
+
+
 # Launch or get server
 def ensure_server():
     """
-    Start an orca server if none is running. If a server is already running,
-    then reset the timeout countdown
+    Start the orca server processes if none are running, and restart the
+    ones that have exited. If servers are already running, then reset the
+    timeout countdown
 
     Returns
     -------
@@ -1327,51 +1468,19 @@ Install using conda:
             if orca_state["shutdown_timer"] is not None:
                 orca_state["shutdown_timer"].cancel()
 
-            # Start a new server process if none is active
+            # Start new server processes if none are active
             if orca_state["proc"] is None:
-
-                # Determine server port
-                if config.port is None:
-                    orca_state["port"] = find_open_port()
-                else:
-                    orca_state["port"] = config.port
-
-                # Build orca command list
-                cmd_list = status._props["executable_list"] + [
-                    "serve",
-                    "-p",
-                    str(orca_state["port"]),
-                    "--plotly",
-                    config.plotlyjs,
-                    "--graph-only",
+                orca_state["servers"] = [
+                    _start_server_process(i) for i in range(config.pool_size)
                 ]
-
-                if config.topojson:
-                    cmd_list.extend(["--topojson", config.topojson])
-
-                if config.mathjax:
-                    cmd_list.extend(["--mathjax", config.mathjax])
-
-                if config.mapbox_access_token:
-                    cmd_list.extend(
-                        ["--mapbox-access-token", config.mapbox_access_token]
-                    )
-
-                # Create subprocess that launches the orca server on the
-                # specified port.
-                DEVNULL = open(os.devnull, "wb")
-                with orca_env():
-                    stderr = DEVNULL if "CI" in os.environ else None  # fix for CI
-                    orca_state["proc"] = subprocess.Popen(
-                        cmd_list, stdout=DEVNULL, stderr=stderr
-                    )
-
-                # Update orca.status so the user has an accurate view
-                # of the state of the orca server
-                status._props["state"] = "running"
-                status._props["pid"] = orca_state["proc"].pid
-                status._props["port"] = orca_state["port"]
-                status._props["command"] = cmd_list
+                orca_state["next_server"] = 0
+                _update_server_status()
+            else:
+                # Restart the server processes that have exited
+                for server in list(orca_state["servers"]):
+                    if server["proc"].poll() is not None:
+                        _restart_server_process(server)
+                _replace_unhealthy_servers()
 
             # Create new shutdown timer if a timeout was specified
             if config.timeout is not None:
@@ -1383,6 +1492,42 @@ Install using conda:
                 orca_state["shutdown_timer"] = t
 
 
+@contextmanager
+def _checkout_server():
+    """
+    Context manager that selects the healthy orca server process with the
+    fewest requests in progress, in round-robin order among equally busy
+    servers, and counts a request against it while the context is active
+    """
+    with orca_lock:
+        servers = orca_state["servers"]
+        start = orca_state["next_server"] % len(servers) if servers else 0
+        candidates = [
+            server
+            for server in servers[start:] + servers[:start]
+            if not server["unhealthy"]
+        ]
+        if not candidates:
+            # The servers were shut down, or are waiting to be replaced.
+            # Retry after they are restarted.
+            server = None
+        else:
+            server = min(candidates, key=lambda s: s["active"])
+            orca_state["next_server"] = start + 1
+            server["active"] += 1
+
+    if server is None:
+        raise OSError("orca server is not running")
+
+    try:
+        yield server
+    finally:
+        with orca_lock:
+            server["active"] -= 1
+            # Replace the server if it became unhealthy during the request
+            _replace_unhealthy_servers()
+
+
 @retry(min_wait=5, max_wait=10, max_delay=60000)
 def request_image_with_retrying(**kwargs):
     """
@@ -1392,21 +1537,32 @@ def request_image_with_retrying(**kwargs):
     from requests import post
     from plotly.io.json import to_json_plotly
 
+    request_params = {k: v for k, v, in kwargs.items() if v is not None}
+    json_str = to_json_plotly(request_params)
+
     if config.server_url:
-        server_url = config.server_url
-    else:
+        response = post(config.server_url + "/", data=json_str)
+        if response.status_code == 522:
+            # On "522: client socket timeout", keep trying
+            raise OSError("522: client socket timeout")
+        return response
+
+    # Make sure the server processes are running before each attempt
+    ensure_server()
+
+    with _checkout_server() as server:
         server_url = "http://{hostname}:{port}".format(
-            hostname="localhost", port=orca_state["port"]
+            hostname="localhost", port=server["port"]
         )
-
-    request_params = {k: v for k, v, in kwargs.items() if v is not None}
-    json_str = to_json_plotly(request_params)
-    response = post(server_url + "/", data=json_str)
+        response = post(server_url + "/", data=json_str)
 
     if response.status_code == 522:
-        # On "522: client socket timeout", return server and keep trying
-        shutdown_server()
-        ensure_server()
+        # On "522: client socket timeout", keep trying with other servers.
+        # The server is restarted once the requests that other threads sent
+        # to it have completed.
+        with orca_lock:
+            server["unhealthy"] = True
+            _replace_unhealthy_servers()
         raise OSError("522: client socket timeout")
 
     return response
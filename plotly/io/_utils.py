@@ -1,17 +1,24 @@
+import gzip
+import io
+import itertools
+
 import plotly
 import plotly.graph_objs as go
 from plotly.offline import get_plotlyjs_version
+from _plotly_utils.optional_imports import get_module
 
 
-def validate_coerce_fig_to_dict(fig, validate):
+def validate_coerce_fig_to_dict(fig, validate, convert_arrays=True):
     from plotly.basedatatypes import BaseFigure
 
     if isinstance(fig, BaseFigure):
-        fig_dict = fig.to_dict()
+        fig_dict = fig._to_dict(convert_arrays=convert_arrays)
     elif isinstance(fig, dict):
         if validate:
             # This will raise an exception if fig is not a valid plotly figure
-            fig_dict = plotly.graph_objs.Figure(fig).to_plotly_json()
+            fig_dict = plotly.graph_objs.Figure(fig)._to_dict(
+                convert_arrays=convert_arrays
+            )
         else:
             fig_dict = fig
     elif hasattr(fig, "to_plotly_json"):
@@ -48,3 +55,167 @@ def plotly_cdn_url(cdn_ver=get_plotlyjs_version()):
     return "https://cdn.plot.ly/plotly-{cdn_ver}.min.js".format(
         cdn_ver=cdn_ver,
     )
+
+
+# Compression formats, with the file suffixes they are inferred from and the
+# magic bytes that compressed data starts with
+_compression_suffixes = {".gz": "gzip", ".zst": "zstd"}
+_compression_magic = {"gzip": b"\x1f\x8b", "zstd": b"\x28\xb5\x2f\xfd"}
+
+
+def validate_coerce_compression(compression, path):
+    """
+    Resolve the compression argument of a writer function
+
+    Parameters
+    ----------
+    compression: str or None
+        One of "gzip", "zstd", None or "infer". If "infer", the compression
+        is inferred from the suffix of path (".gz" or ".zst")
+    path: pathlib.Path or None
+        Path of the file to write
+
+    Returns
+    -------
+    str or None
+        "gzip", "zstd" or None
+    """
+    if compression == "infer":
+        if path is None:
+            return None
+        return _compression_suffixes.get(path.suffix.lower())
+    elif compression in (None, "gzip", "zstd"):
+        return compression
+    else:
+        raise ValueError(
+            """
+Invalid compression: {compression}
+    Must be one of: 'gzip', 'zstd', None, 'infer'""".format(
+                compression=repr(compression)
+            )
+        )
+
+
+def _get_zstandard():
+    zstandard = get_module("zstandard")
+    if zstandard is None:
+        raise ValueError("zstd compression requires the zstandard package")
+    return zstandard
+
+
+def _open_compressed(file, mode, compression, encoding=None):
+    # Open a path or a file object for compressed reading or writing. File
+    # objects are left open when the returned object is closed
+    if compression == "gzip":
+        return gzip.open(file, mode, encoding=encoding)
+    else:
+        return _get_zstandard().open(file, mode, encoding=encoding, closefd=False)
+
+
+def read_text(path=None, file=None):
+    """
+    Read the text of a pathlib.Path or a readable object, decompressing it
+    if it is gzip or zstd compressed
+
+    The compression of a file is inferred from the suffix of path (".gz"
+    or ".zst"), and the compression of bytes read from a readable object
+    from their first bytes. Compressed text is decoded as UTF-8, while
+    uncompressed files are read with the default encoding of
+    pathlib.Path.read_text and readable objects are read as they are.
+
+    Parameters
+    ----------
+    path: pathlib.Path or None
+        Path of the file to read
+    file: readable or None
+        Readable object to read from if path is None
+
+    Returns
+    -------
+    str or bytes
+    """
+    if path is not None:
+        compression = validate_coerce_compression("infer", path)
+        if compression is None:
+            return path.read_text()
+        with _open_compressed(path, "rt", compression, "utf-8") as f:
+            return f.read()
+
+    data = file.read()
+    if isinstance(data, bytes):
+        compression = _detect_compression(data)
+        if compression is not None:
+            with _open_compressed(io.BytesIO(data), "rt", compression, "utf-8") as f:
+                return f.read()
+    return data
+
+
+def _detect_compression(data):
+    for compression, magic in _compression_magic.items():
+        if data.startswith(magic):
+            return compression
+    return None
+
+
+def write_text_chunks(chunks, path=None, file=None, encoding=None, compression=None):
+    """
+    Write an iterator of string chunks to a pathlib.Path or a writeable
+    object
+
+    If the chunks add up to less than 1MB, they are joined and written at
+    once. Otherwise, they are written as they are generated, so that the
+    full text is never held in memory.
+
+    Parameters
+    ----------
+    chunks: iterator of str
+        Chunks of text to write
+    path: pathlib.Path or None
+        Path of the file to write
+    file: writeable or None
+        Writeable object to write to if path is None
+    encoding: str or None
+        Encoding used to write to path. If None, the default encoding of
+        pathlib.Path.write_text is used, or UTF-8 if the text is compressed
+    compression: str or None
+        If "gzip" or "zstd", the text is compressed as it is written, and
+        file must be opened in binary mode
+
+    Returns
+    -------
+    None
+    """
+    if compression is not None:
+        with _open_compressed(
+            path if path is not None else file, "wt", compression, encoding or "utf-8"
+        ) as f:
+            for chunk in chunks:
+                f.write(chunk)
+        return
+
+    chunks = iter(chunks)
+    buffered = []
+    buffered_size = 0
+    for chunk in chunks:
+        buffered.append(chunk)
+        buffered_size += len(chunk)
+        if buffered_size >= 2**20:
+            break
+    else:
+        # Write short text at once
+        text = "".join(buffered)
+        if path is None:
+            file.write(text)
+        elif encoding is None:
+            path.write_text(text)
+        else:
+            path.write_text(text, encoding)
+        return
+
+    if path is None:
+        for chunk in itertools.chain(buffered, chunks):
+            file.write(chunk)
+    else:
+        with path.open("w", encoding=encoding) as f:
+            for chunk in itertools.chain(buffered, chunks):
+                f.write(chunk)
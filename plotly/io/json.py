@@ -5,5 +5,6 @@ from ._json import (
     read_json,
     config,
     to_json_plotly,
+    iter_json_plotly,
     from_json_plotly,
 )
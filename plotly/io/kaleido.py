@@ -1 +1,10 @@
-from ._kaleido import to_image, write_image, scope
+from ._kaleido import (
+    to_image,
+    write_image,
+    write_images,
+    to_image_async,
+    write_image_async,
+    full_figure_for_development_async,
+    scope,
+    config,
+)
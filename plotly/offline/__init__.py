@@ -7,6 +7,8 @@ from .offline import (
     download_plotlyjs,
     get_plotlyjs_version,
     get_plotlyjs,
+    get_plotlyjs_bytes,
+    clear_plotlyjs_cache,
     enable_mpl_offline,
     init_notebook_mode,
     iplot,
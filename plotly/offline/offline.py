@@ -14,6 +14,11 @@ from ._plotlyjs_version import __plotlyjs_version__
 
 __IMAGE_FORMATS = ["jpeg", "png", "webp", "svg"]
 
+# In-memory copies of the plotly.js bundle, which are read from the package
+# data on first use. plotly.io also stores the script tag that embeds the
+# bundle in HTML output here, so that it is cleared along with the bundle.
+_plotlyjs_cache = {}
+
 
 def download_plotlyjs(download_url):
     warnings.warn(
@@ -81,11 +86,48 @@ def get_plotlyjs():
     >>> with open('multi_plot.html', 'w') as f:
     ...      f.write(html) # doctest: +SKIP
     """
-    path = os.path.join("package_data", "plotly.min.js")
-    plotlyjs = pkgutil.get_data("plotly", path).decode("utf-8")
+    plotlyjs = _plotlyjs_cache.get("str")
+    if plotlyjs is None:
+        plotlyjs = get_plotlyjs_bytes().decode("utf-8")
+        _plotlyjs_cache["str"] = plotlyjs
     return plotlyjs
 
 
+def get_plotlyjs_bytes():
+    """
+    Return the contents of the minified plotly.js library as UTF-8 encoded
+    bytes.
+
+    Like get_plotlyjs, the bundle is read once and kept in memory until
+    clear_plotlyjs_cache is called.
+
+    Returns
+    -------
+    bytes
+        Contents of the minified plotly.js library as bytes
+    """
+    plotlyjs = _plotlyjs_cache.get("bytes")
+    if plotlyjs is None:
+        path = os.path.join("package_data", "plotly.min.js")
+        plotlyjs = pkgutil.get_data("plotly", path)
+        _plotlyjs_cache["bytes"] = plotlyjs
+    return plotlyjs
+
+
+def clear_plotlyjs_cache():
+    """
+    Release the in-memory copies of the plotly.js library returned by
+    get_plotlyjs and get_plotlyjs_bytes, and embedded in HTML output, so
+    that the library is read from the package data again the next time it
+    is needed.
+
+    Returns
+    -------
+    None
+    """
+    _plotlyjs_cache.clear()
+
+
 def _build_resize_script(plotdivid, plotly_root="Plotly"):
     resize_script = (
         '<script type="text/javascript">'
@@ -1,34 +1,207 @@
 import importlib
+import json
+import os.path as opath
+
+import _plotly_utils.basevalidators
 from _plotly_utils.basevalidators import LiteralValidator
 
+_registry_path = opath.join(opath.dirname(__file__), "validators", "_validators.jsonl")
+
 
 class ValidatorCache(object):
     _cache = {}
+    _registry = {}
+    _registry_index = None
 
     @staticmethod
     def get_validator(parent_path, prop_name):
 
         key = (parent_path, prop_name)
         if key not in ValidatorCache._cache:
-
-            if "." not in parent_path and prop_name == "type":
-                # Special case for .type property of traces
-                validator = LiteralValidator("type", parent_path, parent_path)
-            else:
-                lookup_name = None
-                if parent_path == "layout":
-                    from .graph_objects import Layout
-
-                    match = Layout._subplotid_prop_re.match(prop_name)
-                    if match:
-                        lookup_name = match.group(1)
-
-                lookup_name = lookup_name or prop_name
-                class_name = lookup_name.title() + "Validator"
-                validator = getattr(
-                    importlib.import_module("plotly.validators." + parent_path),
-                    class_name,
-                )(plotly_name=prop_name)
-            ValidatorCache._cache[key] = validator
+            ValidatorCache._cache[key] = ValidatorCache.build_validator(
+                parent_path, prop_name
+            )
 
         return ValidatorCache._cache[key]
+
+    @staticmethod
+    def build_validator(parent_path, prop_name, **kwargs):
+        """
+        Construct a new, uncached, validator instance
+
+        Validators are built from the compact validator registry that is
+        generated alongside the plotly.validators package. Properties that
+        are missing from the registry fall back to importing the generated
+        validator class.
+
+        Parameters
+        ----------
+        parent_path : str
+            Path string of the parent object (e.g. 'scatter.marker'), or
+            the empty string for top-level figure properties
+        prop_name : str
+            Name of the property (e.g. 'color')
+        kwargs
+            Additional validator constructor params (e.g. set_uid)
+
+        Returns
+        -------
+        _plotly_utils.basevalidators.BaseValidator
+        """
+        if "." not in parent_path and prop_name == "type":
+            # Special case for .type property of traces
+            return LiteralValidator("type", parent_path, parent_path)
+
+        lookup_name = ValidatorCache._lookup_name(parent_path, prop_name)
+        entry = ValidatorCache._get_registry(parent_path).get(lookup_name)
+
+        if entry is None:
+            validator_class = ValidatorCache._import_validator_class(
+                parent_path, lookup_name
+            )
+            return validator_class(plotly_name=prop_name, **kwargs)
+
+        validator_class = getattr(_plotly_utils.basevalidators, entry["superclass"])
+        params = dict(entry["params"], **kwargs)
+        if "data_class_str" in params:
+            # Compound validator docs are only needed to build error
+            # messages, so they are loaded on demand
+            params.setdefault("data_docs", None)
+
+        return validator_class(plotly_name=prop_name, parent_name=parent_path, **params)
+
+    @staticmethod
+    def get_data_docs(parent_path, prop_name):
+        """
+        Load the constructor docs of a compound property from its generated
+        validator class
+
+        Parameters
+        ----------
+        parent_path : str
+        prop_name : str
+
+        Returns
+        -------
+        str
+        """
+        lookup_name = ValidatorCache._lookup_name(parent_path, prop_name)
+        validator_class = ValidatorCache._import_validator_class(
+            parent_path, lookup_name
+        )
+        return validator_class(plotly_name=prop_name).data_docs
+
+    @staticmethod
+    def _lookup_name(parent_path, prop_name):
+        # Map layout subplot properties (e.g. xaxis2) to their base
+        # property (e.g. xaxis)
+        if parent_path == "layout":
+            from .graph_objects import Layout
+
+            match = Layout._subplotid_prop_re.match(prop_name)
+            if match:
+                return match.group(1)
+
+        return prop_name
+
+    @staticmethod
+    def _import_validator_class(parent_path, lookup_name):
+        module_str = "plotly.validators"
+        if parent_path:
+            module_str += "." + parent_path
+
+        class_name = lookup_name.title() + "Validator"
+        return getattr(importlib.import_module(module_str), class_name)
+
+    @staticmethod
+    def _get_registry(parent_path):
+        # Registry entries of the properties of parent_path. Each parent
+        # path is stored as a separate line of the registry file, so only
+        # the entries of the parent paths that are used get decoded
+        entries = ValidatorCache._registry.get(parent_path)
+        if entries is not None:
+            return entries
+
+        index = ValidatorCache._get_registry_index()
+        if parent_path in index:
+            offset, length = index[parent_path]
+            with open(_registry_path, "rb") as f:
+                f.seek(offset)
+                entries = json.loads(f.read(length))
+        else:
+            entries = {}
+
+        ValidatorCache._registry[parent_path] = entries
+        return entries
+
+    @staticmethod
+    def _get_registry_index():
+        # The first line of the registry file maps each parent path to the
+        # offset and length of its line, relative to the end of the index
+        if ValidatorCache._registry_index is None:
+            try:
+                with open(_registry_path, "rb") as f:
+                    index = json.loads(f.readline())
+                    start = f.tell()
+            except FileNotFoundError:
+                # Registry has not been generated, rely on the generated
+                # validator modules
+                index, start = {}, 0
+
+            ValidatorCache._registry_index = {
+                parent_path: (start + offset, length)
+                for parent_path, (offset, length) in index.items()
+            }
+
+        return ValidatorCache._registry_index
+
+
+def warmup(trace_types=None, layout=True):
+    """
+    Construct the validators, and import the graph_objs classes, that are
+    needed to build figures with the specified trace types
+
+    This is useful for preforking servers (e.g. gunicorn or uwsgi), which
+    can call warmup in the parent process so that worker processes don't
+    each pay this cost when they build their first figure.
+
+    Parameters
+    ----------
+    trace_types : list of str or None
+        Trace types (e.g. ['scatter', 'bar']) to warm up. If None
+        (default), all trace types are warmed up.
+    layout : bool
+        If True (default), also warm up the validators of the layout
+        hierarchy
+
+    Returns
+    -------
+    None
+    """
+    data_validator = ValidatorCache.get_validator("", "data")
+    if trace_types is None:
+        trace_types = list(data_validator.class_strs_map)
+
+    visited = set()
+    for trace_type in trace_types:
+        _warmup_datatype(data_validator.get_trace_class(trace_type), visited)
+
+    if layout:
+        _warmup_datatype(ValidatorCache.get_validator("", "layout").data_class, visited)
+
+
+def _warmup_datatype(datatype_class, visited):
+    from _plotly_utils.basevalidators import (
+        CompoundValidator,
+        CompoundArrayValidator,
+    )
+
+    path_str = datatype_class._path_str
+    if path_str in visited:
+        return
+    visited.add(path_str)
+
+    for prop in sorted(datatype_class._valid_props):
+        validator = ValidatorCache.get_validator(path_str, prop)
+        if isinstance(validator, (CompoundValidator, CompoundArrayValidator)):
+            _warmup_datatype(validator.data_class, visited)
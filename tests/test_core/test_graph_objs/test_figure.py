@@ -217,3 +217,118 @@ def test_set_subplots():
     # Test that calling on a figure that already has subplots throws an error.
     with pytest.raises(ValueError, match=r"^This figure already has subplots\.$"):
         fig1.set_subplots(2, 3)
+
+
+def test_to_dict_independent_of_figure():
+    fig = go.Figure(
+        go.Scatter(y=[1, 3, 2], marker={"color": "red"}),
+        layout={"annotations": [{"text": "a"}], "xaxis": {"range": [0, 1]}},
+    )
+    d = fig.to_dict()
+    d["data"][0]["y"].append(4)
+    d["data"][0]["marker"]["color"] = "blue"
+    d["layout"]["annotations"][0]["text"] = "b"
+
+    assert fig.data[0].y == (1, 3, 2)
+    assert fig.data[0].marker.color == "red"
+    assert fig.layout.annotations[0].text == "a"
+
+    fig.layout.xaxis.range = [1, 2]
+    assert d["layout"]["xaxis"]["range"] == [0, 1]
+
+
+def test_reassigned_objects_keep_properties():
+    fig = go.Figure(go.Scatter(y=[1, 3, 2], marker={"color": "red"}))
+    old_layout = fig.layout
+    old_layout.title.text = "old"
+    old_marker = fig.data[0].marker
+
+    fig.layout = {"title": {"text": "new"}}
+    fig.data[0].marker = {"color": "blue"}
+    assert old_layout.title.text == "old"
+    assert old_marker.color == "red"
+    assert fig.layout.title.text == "new"
+    assert fig.data[0].marker.color == "blue"
+
+    # Mutating the unparented objects doesn't affect the figure
+    old_layout.title.text = "changed"
+    old_marker.color = "green"
+    assert fig.layout.title.text == "new"
+    assert fig.data[0].marker.color == "blue"
+
+    old_trace = fig.data[0]
+    fig.data = []
+    assert old_trace.y == (1, 3, 2)
+    assert old_trace.marker.color == "blue"
+
+
+def test_figures_from_same_trace_are_independent():
+    trace = go.Scatter(y=[1, 3, 2], marker={"color": "red"})
+    fig1 = go.Figure(trace)
+    fig2 = go.Figure(fig1)
+    fig2.data[0].marker.color = "blue"
+
+    assert trace.marker.color == "red"
+    assert fig1.data[0].marker.color == "red"
+    assert fig2.data[0].marker.color == "blue"
+
+
+def test_clone():
+    import numpy as np
+
+    x = np.arange(10.0)
+    fig = go.Figure(
+        go.Scatter(x=x, y=[1, 3, 2], marker={"color": "red"}),
+        layout={"title": {"text": "title"}, "xaxis2": {"range": [0, 1]}},
+        frames=[{"data": [{"y": [3, 2, 1]}], "name": "frame"}],
+    )
+    clone = fig.clone()
+
+    assert isinstance(clone, go.Figure)
+    assert clone is not fig
+    assert clone.to_plotly_json() == fig.to_plotly_json()
+    assert go.Figure(fig).to_plotly_json() == fig.to_plotly_json()
+
+    # Read-only arrays are shared
+    assert clone.data[0].x is fig.data[0].x
+
+    # Updates are independent
+    clone.data[0].marker.color = "blue"
+    clone.layout.xaxis2.range = [1, 2]
+    clone.frames[0].data[0].y = [1, 1, 1]
+    assert fig.data[0].marker.color == "red"
+    assert fig.layout.xaxis2.range == (0, 1)
+    assert fig.frames[0].data[0].y == (3, 2, 1)
+
+    # Updates of the clone are validated
+    with pytest.raises(ValueError):
+        clone.data[0].marker.color = "not a color"
+    with pytest.raises(ValueError):
+        clone.layout.title.text = {}
+
+
+def test_figure_does_not_alias_input_values():
+    meta = {"a": [1]}
+    customdata = [[1, 2], [3, 4]]
+    fig = go.Figure(go.Scatter(meta=meta, customdata=customdata))
+    meta["a"].append(2)
+    customdata[0].append(5)
+
+    assert fig.data[0].meta == {"a": [1]}
+    assert fig.to_dict()["data"][0]["customdata"] == [[1, 2], [3, 4]]
+
+    fig.layout.updatemenus = [{"buttons": [{"args": [{"visible": [True]}]}]}]
+    args = fig.layout.updatemenus[0].buttons[0].args
+    fig2 = go.Figure(layout={"updatemenus": [{"buttons": [{"args": args}]}]})
+    fig2.layout.updatemenus[0].buttons[0].args[0]["visible"].append(False)
+    assert fig.layout.updatemenus[0].buttons[0].args[0] == {"visible": [True]}
+
+
+def test_figures_from_same_trace_do_not_share_values():
+    trace = go.Scatter(meta={"a": [1]})
+    f1 = go.Figure(trace)
+    f2 = go.Figure(trace)
+
+    f1.data[0].meta["a"] = 99
+    assert f2.data[0].meta == {"a": [1]}
+    assert trace.meta == {"a": [1]}
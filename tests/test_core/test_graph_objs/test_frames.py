@@ -18,6 +18,24 @@ def return_prop_descriptions(prop_descrip_text):
 
 
 class FramesTest(TestCase):
+    def setUp(self):
+        # Some tests assign properties of the Frame class itself, restore
+        # them so that they don't affect the frames of other tests
+        saved = {
+            name: Frame.__dict__[name]
+            for name in ("data", "layout", "frame")
+            if name in Frame.__dict__
+        }
+
+        def restore():
+            for name in ("data", "layout", "frame"):
+                if name in saved:
+                    setattr(Frame, name, saved[name])
+                elif name in Frame.__dict__:
+                    delattr(Frame, name)
+
+        self.addCleanup(restore)
+
     def test_instantiation(self):
 
         native_frames = [
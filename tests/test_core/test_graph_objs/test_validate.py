@@ -34,3 +34,177 @@ def test_validate_false():
 
     finally:
         pio.templates.default = template
+
+
+def test_validate_false_public_argument():
+    template = pio.templates.default
+    try:
+        pio.templates.default = None
+
+        fig = go.Figure(validate=False, **build_invalid_fig())
+        assert json.loads(fig.to_json()) == expected_invalid_dict
+
+    finally:
+        pio.templates.default = template
+
+
+def test_validation_context():
+    template = pio.templates.default
+    try:
+        pio.templates.default = None
+
+        with pio.validation(False):
+            assert not pio.config.validate
+            fig = go.Figure(**build_invalid_fig())
+            scatter = go.Scatter(marker_color="not a color", bogus=1)
+
+        assert pio.config.validate
+        assert json.loads(fig.to_json()) == expected_invalid_dict
+        assert scatter.to_plotly_json() == {
+            "type": "scatter",
+            "marker": {"color": "not a color"},
+            "bogus": 1,
+        }
+
+        # Validation applies again outside of the context
+        with pytest.raises(ValueError):
+            go.Figure(**build_invalid_fig())
+
+    finally:
+        pio.templates.default = template
+
+
+def test_validation_context_attribute_access():
+    spec = dict(
+        data=[dict(type="scatter", x=[1, 2], marker=dict(line=dict(width=2)))],
+        layout=dict(title=dict(text="title"), xaxis2=dict(range=[0, 2])),
+    )
+    with pio.validation(False):
+        fig = go.Figure(spec)
+
+    assert fig.data[0].x == (1, 2)
+    assert fig.data[0].marker.line.width == 2
+    assert fig.layout.title.text == "title"
+    assert fig.layout.xaxis2.range == (0, 2)
+    assert fig.to_dict() == go.Figure(spec).to_dict()
+
+
+def test_validation_context_scope():
+    with pio.validation(False):
+        fig = go.Figure(layout_title_text="title")
+        scatter = go.Scatter()
+        fig.update_layout(xaxis_range="not a range")
+        fig.add_scatter(marker_color="not a color")
+
+    # Objects built in the context validate updates outside of it
+    with pytest.raises(ValueError):
+        fig.update_layout(yaxis_range="not a range")
+    with pytest.raises(ValueError):
+        fig.add_scatter(marker_color="not a color")
+    with pytest.raises(ValueError):
+        scatter.marker.color = "not a color"
+
+    # Figures built with validate=False don't
+    fig = go.Figure(validate=False)
+    fig.update_layout(yaxis_range="not a range")
+    assert fig.layout.to_plotly_json()["yaxis"] == {"range": "not a range"}
+
+
+def test_validation_context_copy_of_edited_figure_is_validated():
+    fig = go.Figure(layout_title_text="title")
+    with pio.validation(False):
+        fig.update_layout(xaxis_range="not a range")
+
+    with pytest.raises(ValueError):
+        go.Figure(fig)
+
+
+def test_validation_context_none_removes_property():
+    fig = go.Figure(data=[go.Scatter(name="trace")], layout_title_text="title")
+    with pio.validation(False):
+        fig.layout.title = None
+        fig.data[0].name = None
+        fig.data[0].marker = dict(color="red")
+        fig.data[0].marker = None
+
+    assert "title" not in fig.layout.to_plotly_json()
+    assert fig.data[0].to_plotly_json() == {"type": "scatter"}
+
+
+def test_validation_context_batch_update():
+    fig = go.Figure(data=[go.Scatter(name="trace")])
+    with pio.validation(False):
+        with fig.batch_update():
+            fig.data[0].name = "renamed"
+            fig.layout.xaxis.range = [0, 2]
+            assert fig.data[0].name == "trace"
+            assert fig.layout.xaxis.range is None
+
+    assert fig.data[0].name == "renamed"
+    assert fig.layout.xaxis.range == (0, 2)
+
+
+def test_validation_context_restored_on_error():
+    with pytest.raises(RuntimeError):
+        with pio.validation(False):
+            raise RuntimeError()
+
+    assert pio.config.validate
+
+
+def test_figure_from_unvalidated_figure_is_validated():
+    fig = go.Figure(validate=False, **build_invalid_fig())
+    with pytest.raises(ValueError):
+        go.Figure(fig)
+
+    with pio.validation(False):
+        fig = go.Figure(**build_invalid_fig())
+    with pytest.raises(ValueError):
+        go.Figure(fig)
+
+    # Figures that weren't validated can still be copied without validation
+    assert go.Figure(fig, validate=False).to_dict() == fig.to_dict()
+
+
+def test_validation_context_thread_local():
+    import threading
+
+    entered = threading.Event()
+    done = threading.Event()
+    errors = []
+
+    def build_unvalidated():
+        try:
+            with pio.validation(False):
+                entered.set()
+                done.wait(10)
+                go.Scatter(marker_color="not a color")
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=build_unvalidated)
+    thread.start()
+    try:
+        assert entered.wait(10)
+
+        # Validation is still enabled in other threads
+        assert pio.config.validate
+        with pytest.raises(ValueError):
+            go.Scatter(marker_color="not a color")
+    finally:
+        done.set()
+        thread.join()
+
+    # Validation was disabled in the thread that entered the context
+    assert not errors
+
+
+def test_validation_context_invalid():
+    with pytest.raises(ValueError):
+        with pio.validation("no"):
+            pass
+
+
+def test_validate_config_invalid():
+    with pytest.raises(ValueError):
+        pio.config.validate = "no"
@@ -0,0 +1,99 @@
+import re
+
+import pytest
+
+import plotly.graph_objects as go
+from _plotly_utils.basevalidators import CompoundValidator, LiteralValidator
+from plotly.validator_cache import ValidatorCache, warmup
+
+
+def validator_state(validator):
+    # Nested item validators are compared by their repr without addresses
+    return re.sub(
+        " at 0x[0-9a-f]+",
+        "",
+        repr({k: v for k, v in vars(validator).items() if k != "data_docs"}),
+    )
+
+
+@pytest.mark.parametrize(
+    "parent_path,prop_name",
+    [
+        ("", "layout"),
+        ("", "frames"),
+        ("frame", "data"),
+        ("frame", "layout"),
+        ("scatter", "x"),
+        ("scatter.marker", "color"),
+        ("scatter.marker", "symbol"),
+        ("layout", "annotations"),
+        ("layout", "template"),
+        ("layout", "title"),
+        ("layout", "xaxis2"),
+        ("layout.template.data", "scatter"),
+        ("layout.xaxis", "range"),
+        ("bar.marker.colorbar", "tickformatstops"),
+    ],
+)
+def test_registry_matches_generated_validator(parent_path, prop_name):
+    validator = ValidatorCache.build_validator(parent_path, prop_name)
+    lookup_name = ValidatorCache._lookup_name(parent_path, prop_name)
+    generated = ValidatorCache._import_validator_class(parent_path, lookup_name)(
+        plotly_name=prop_name
+    )
+
+    assert isinstance(generated, type(validator))
+    assert validator_state(validator) == validator_state(generated)
+
+
+def test_registry_compound_docs_loaded_on_demand():
+    validator = ValidatorCache.build_validator("scatter", "marker")
+    assert isinstance(validator, CompoundValidator)
+    assert validator.data_docs is None
+
+    generated = ValidatorCache._import_validator_class("scatter", "marker")()
+    assert validator.description() == generated.description()
+
+
+def test_registry_decodes_used_parent_paths_only(monkeypatch):
+    monkeypatch.setattr(ValidatorCache, "_registry", {})
+    ValidatorCache.build_validator("scatter.marker", "color")
+    ValidatorCache.build_validator("layout", "xaxis2")
+    assert set(ValidatorCache._registry) == {"scatter.marker", "layout"}
+
+
+def test_registry_missing_parent_path(monkeypatch):
+    monkeypatch.setattr(ValidatorCache, "_registry", {})
+    assert ValidatorCache._get_registry("not.a.path") == {}
+
+
+def test_trace_type_validator():
+    validator = ValidatorCache.get_validator("scatter", "type")
+    assert isinstance(validator, LiteralValidator)
+    assert validator.val == "scatter"
+
+
+def test_get_validator_cached():
+    validator = ValidatorCache.get_validator("scatter", "x")
+    assert ValidatorCache.get_validator("scatter", "x") is validator
+    assert ValidatorCache.build_validator("scatter", "x") is not validator
+
+
+@pytest.fixture
+def empty_validator_cache():
+    cache = dict(ValidatorCache._cache)
+    ValidatorCache._cache.clear()
+    yield ValidatorCache._cache
+    ValidatorCache._cache.clear()
+    ValidatorCache._cache.update(cache)
+
+
+def test_warmup(empty_validator_cache):
+    warmup(trace_types=["bar"], layout=False)
+    assert ("bar", "x") in empty_validator_cache
+    assert ("bar.marker.colorbar", "tickformatstops") in empty_validator_cache
+    assert ("scatter", "x") not in empty_validator_cache
+    assert ("layout", "xaxis") not in empty_validator_cache
+
+    marker_validator = empty_validator_cache[("bar", "marker")]
+    assert marker_validator._data_class is go.bar.Marker
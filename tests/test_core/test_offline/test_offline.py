@@ -433,3 +433,24 @@ class PlotlyOfflineTestCase(PlotlyOfflineBaseTestCase):
             fig_frames, output_type="div", auto_play=False, image="png"
         )
         self.assertIn(download_image, html)
+
+    def test_plotlyjs_cache(self):
+        plotlyjs = plotly.offline.get_plotlyjs()
+        self.assertIs(plotly.offline.get_plotlyjs(), plotlyjs)
+        self.assertEqual(plotly.offline.get_plotlyjs_bytes().decode("utf-8"), plotlyjs)
+
+        # The bundle is read again after the cache is cleared
+        plotly.offline.clear_plotlyjs_cache()
+        plotlyjs2 = plotly.offline.get_plotlyjs()
+        self.assertIsNot(plotlyjs2, plotlyjs)
+        self.assertEqual(plotlyjs2, plotlyjs)
+
+        html = plotly.offline.plot(fig, output_type="div", include_plotlyjs=True)
+        self.assertIn(plotlyjs2, html)
+
+        # The script tag embedding the bundle in HTML is released as well
+        from plotly.offline.offline import _plotlyjs_cache
+
+        self.assertIn("script", _plotlyjs_cache)
+        plotly.offline.clear_plotlyjs_cache()
+        self.assertEqual(_plotlyjs_cache, {})
@@ -0,0 +1,118 @@
+import io
+
+import numpy as np
+import pytest
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+
+@pytest.fixture
+def fig1():
+    return go.Figure(
+        [
+            go.Scatter(x=np.arange(100), y=np.linspace(0, 1, 100), name="line"),
+            go.Heatmap(z=np.arange(12, dtype="float32").reshape(3, 4)),
+            go.Bar(x=["a", "b", "c"], y=[1, 2, 3]),
+        ],
+        layout={"title": {"text": "Figure title"}},
+    )
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_write_read_binary_path(fig1, tmp_path, mmap):
+    path = tmp_path / "fig.plotly"
+    pio.write_binary(fig1, path)
+    fig2 = pio.read_binary(path, mmap=mmap)
+
+    assert fig2.to_dict() == fig1.to_dict()
+    np.testing.assert_array_equal(fig2.data[0].y, fig1.data[0].y)
+    assert fig2.data[1].z.shape == (3, 4)
+    assert isinstance(fig2.data[0].y, np.memmap) == mmap
+    assert not fig2.data[0].y.flags.writeable
+
+
+def test_write_read_binary_str_path(fig1, tmp_path):
+    path = str(tmp_path / "fig.plotly")
+    fig1.write_binary(path)
+    assert pio.read_binary(path).to_dict() == fig1.to_dict()
+
+
+def test_write_read_binary_filelike(fig1):
+    f = io.BytesIO()
+    pio.write_binary(fig1, f)
+    f.seek(0)
+    assert pio.read_binary(f).to_dict() == fig1.to_dict()
+
+
+def test_write_binary_typed_array_specs(fig1):
+    # Typed array specs of unvalidated dicts are stored as binary arrays
+    f = io.BytesIO()
+    pio.write_binary(fig1.to_dict(), f, validate=False)
+    assert b"bdata" not in f.getvalue()
+    f.seek(0)
+    assert pio.read_binary(f).to_dict() == fig1.to_dict()
+
+
+def test_read_binary_output_type(fig1):
+    f = io.BytesIO()
+    pio.write_binary(fig1, f)
+    f.seek(0)
+    fig2 = pio.read_binary(f, output_type="Figure")
+    assert isinstance(fig2, go.Figure)
+
+
+def test_write_read_binary_reserved_keys(fig1):
+    # Dicts of the figure that look like array references are preserved
+    meta = {
+        "bref": 1,
+        "dtype": "f8",
+        "__bref__": 2,
+        "__b": {"__b__bref__": [3], "shape": [4]},
+        "values": np.arange(3),
+    }
+    fig1.layout.meta = meta
+    f = io.BytesIO()
+    pio.write_binary(fig1, f)
+    f.seek(0)
+    fig2 = pio.read_binary(f)
+
+    assert fig2.layout.meta.keys() == meta.keys()
+    assert fig2.layout.meta["__b"] == meta["__b"]
+    np.testing.assert_array_equal(fig2.layout.meta["values"], meta["values"])
+    assert fig2.to_dict() == fig1.to_dict()
+
+
+def test_read_binary_copy_arrays_thread_local(fig1, monkeypatch):
+    import threading
+    from plotly.io import _binary
+
+    copy_arrays = []
+
+    def build_figure(fig_dict, skip_invalid):
+        # Other threads keep the copy policy of the configuration
+        thread = threading.Thread(
+            target=lambda: copy_arrays.append(pio.config.copy_arrays)
+        )
+        thread.start()
+        thread.join()
+        copy_arrays.append(pio.config.copy_arrays)
+        return go.Figure(fig_dict, skip_invalid=skip_invalid)
+
+    monkeypatch.setattr(_binary, "validate_coerce_output_type", lambda _: build_figure)
+    f = io.BytesIO()
+    pio.write_binary(fig1, f)
+    f.seek(0)
+    fig2 = pio.read_binary(f)
+
+    assert copy_arrays == ["always", "if_writeable"]
+    assert pio.config.copy_arrays == "always"
+    assert not fig2.data[0].y.flags.writeable
+
+
+def test_read_binary_invalid():
+    with pytest.raises(ValueError):
+        pio.read_binary(io.BytesIO(b'{"data": []}'))
+
+    with pytest.raises(ValueError):
+        pio.read_binary(1)
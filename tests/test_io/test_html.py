@@ -7,6 +7,7 @@ import numpy as np
 import plotly.graph_objs as go
 import plotly.io as pio
 from plotly.io._utils import plotly_cdn_url
+from plotly.offline import get_plotlyjs
 
 
 if sys.version_info >= (3, 3):
@@ -45,3 +46,54 @@ def test_html_deterministic(fig1):
     assert pio.to_html(fig1, include_plotlyjs="cdn", div_id=div_id) == pio.to_html(
         fig1, include_plotlyjs="cdn", div_id=div_id
     )
+
+
+def test_write_html_streamed(tmp_path):
+    fig = go.Figure(go.Scattergl(y=np.random.rand(200000)))
+    path = tmp_path / "fig.html"
+    div_id = "plotly-root"
+    pio.write_html(fig, path, include_plotlyjs="cdn", div_id=div_id)
+    assert path.read_text(encoding="utf-8") == pio.to_html(
+        fig, include_plotlyjs="cdn", div_id=div_id
+    )
+
+
+def test_write_html_gzip(fig1, tmp_path):
+    import gzip
+
+    path = tmp_path / "fig.html.gz"
+    div_id = "plotly-root"
+    pio.write_html(fig1, path, include_plotlyjs="cdn", div_id=div_id)
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        assert f.read() == pio.to_html(fig1, include_plotlyjs="cdn", div_id=div_id)
+
+
+def test_html_report(fig1):
+    figs = [fig1, go.Figure(go.Bar(y=[1, 2])), {"data": [{"type": "scatter"}]}]
+    html = pio.to_html_report(figs, title="Report <1>")
+
+    assert html.startswith("<html>") and html.endswith("</html>")
+    assert "<title>Report &lt;1&gt;</title>" in html
+    assert html.count(get_plotlyjs()) == 1
+    assert html.count('class="plotly-graph-div"') == 3
+    assert html.count("Plotly.newPlot(") == 3
+    assert "height:450px" in html
+    assert "renderLazily" not in html
+
+
+def test_html_report_lazy(fig1):
+    html = pio.to_html_report([fig1, fig1], include_plotlyjs="cdn", lazy=True)
+    assert plotly_cdn_url() in html
+    assert html.count('window.PLOTLYENV.renderLazily("') == 2
+    assert "IntersectionObserver" in html
+
+
+def test_write_html_report(fig1, tmp_path):
+    path = tmp_path / "report.html"
+    figs = (go.Figure(go.Scatter(y=[i, 1])) for i in range(3))
+    pio.write_html_report(figs, path, include_plotlyjs="directory")
+
+    html = path.read_text(encoding="utf-8")
+    assert html.count('<script charset="utf-8" src="plotly.min.js"></script>') == 1
+    assert html.count('class="plotly-graph-div"') == 3
+    assert (tmp_path / "plotly.min.js").exists()
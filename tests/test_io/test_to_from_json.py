@@ -4,6 +4,8 @@ import pytest
 import plotly
 import numpy as np
 import json
+import base64
+import io
 import os
 import tempfile
 from unittest.mock import MagicMock
@@ -69,6 +71,236 @@ def test_to_json_pretty_print(fig1):
     )
 
 
+def test_to_json_array_encoding():
+    y = np.linspace(0, 1, 11)
+    fig = go.Figure(go.Scatter(y=y))
+
+    trace = json.loads(pio.to_json(fig))["data"][0]
+    assert trace["y"]["dtype"] == "f8"
+
+    trace = json.loads(pio.to_json(fig, float_precision="float32"))["data"][0]
+    assert trace["y"]["dtype"] == "f4"
+    decoded = np.frombuffer(base64.b64decode(trace["y"]["bdata"]), dtype="f4")
+    np.testing.assert_array_equal(decoded, y.astype("float32"))
+
+    trace = json.loads(pio.to_json(fig, max_decimals=1))["data"][0]
+    decoded = np.frombuffer(base64.b64decode(trace["y"]["bdata"]), dtype="f8")
+    np.testing.assert_array_equal(decoded, np.round(y, 1))
+
+    trace = json.loads(pio.to_json(fig, array_encoding=None))["data"][0]
+    assert trace["y"] == y.tolist()
+
+    # The figure itself is left unchanged
+    np.testing.assert_array_equal(fig.data[0].y, y)
+
+
+def test_convert_to_base64_skipped_keys():
+    from _plotly_utils.utils import convert_to_base64
+
+    fig_dict = {"x": np.arange(3), "range": np.arange(2), "geojson": [np.arange(2)]}
+    convert_to_base64(fig_dict, max_decimals=1)
+    assert fig_dict["x"]["dtype"] == "i1"
+    assert isinstance(fig_dict["range"], np.ndarray)
+    assert isinstance(fig_dict["geojson"][0], np.ndarray)
+
+
+def test_convert_to_base64_custom_skipped_keys():
+    from _plotly_utils.utils import convert_to_base64
+
+    fig_dict = {"x": np.arange(3), "range": np.arange(2), "y": [np.arange(2)]}
+    convert_to_base64(fig_dict, skipped_keys=["y"])
+    assert fig_dict["x"]["dtype"] == "i1"
+    assert fig_dict["range"]["dtype"] == "i1"
+    assert isinstance(fig_dict["y"][0], np.ndarray)
+
+
+def test_to_json_skipped_keys():
+    fig = go.Figure(go.Scatter(x=np.arange(3.0), y=np.arange(3.0)))
+
+    trace = json.loads(pio.to_json(fig, skipped_keys=["y"]))["data"][0]
+    assert trace["x"]["dtype"] == "f8"
+    assert trace["y"] == [0.0, 1.0, 2.0]
+
+    # Options that don't use the default encoding and the threaded encoder
+    # skip the same keys
+    trace = json.loads(
+        pio.to_json(fig, skipped_keys=["y"], float_precision="float32", workers=2)
+    )["data"][0]
+    assert trace["x"]["dtype"] == "f4"
+    assert trace["y"] == [0.0, 1.0, 2.0]
+
+    trace = fig.to_dict(skipped_keys=["x"])["data"][0]
+    assert isinstance(trace["x"], np.ndarray)
+    assert trace["y"]["dtype"] == "f8"
+
+
+def test_write_json_skipped_keys():
+    fig = go.Figure(go.Scatter(x=np.arange(3.0), y=np.arange(3.0)))
+    buf = io.StringIO()
+    pio.write_json(fig, buf, skipped_keys=("x",))
+    trace = json.loads(buf.getvalue())["data"][0]
+    assert trace["x"] == [0.0, 1.0, 2.0]
+    assert trace["y"]["dtype"] == "f8"
+
+
+def test_to_json_cache_skipped_keys():
+    fig = go.Figure(go.Scatter(x=np.arange(3.0)))
+    encoded = fig.to_json()
+    skipped = fig.to_json(skipped_keys=["x"])
+    assert skipped != encoded
+    assert fig.to_json(skipped_keys={"x"}) is skipped
+    assert fig.to_json() == encoded
+
+
+def test_to_json_skipped_keys_invalid(fig1):
+    with pytest.raises(ValueError):
+        pio.to_json(fig1, skipped_keys="range")
+
+
+def test_to_json_array_encoding_invalid(fig1):
+    with pytest.raises(ValueError):
+        pio.to_json(fig1, array_encoding="bogus")
+
+    with pytest.raises(ValueError):
+        pio.to_json(fig1, float_precision="float16")
+
+
+def test_to_json_cache():
+    fig = go.Figure(go.Scatter(y=[1, 2, 3]))
+    json1 = pio.to_json(fig)
+    assert fig.to_json() is json1
+    assert pio.to_json(fig, pretty=True) is not json1
+    assert pio.to_json(fig, engine="json") == json1
+
+    def check_changed(update):
+        before = fig.to_json()
+        update()
+        after = fig.to_json()
+        assert after != before
+        assert after == pio.to_json(fig.to_dict(), validate=False)
+
+    check_changed(lambda: setattr(fig.data[0].marker, "color", "red"))
+    check_changed(lambda: fig.update_layout(title_text="Title"))
+    check_changed(lambda: fig.plotly_restyle({"name": "trace"}, 0))
+    check_changed(lambda: fig.plotly_relayout({"xaxis.range": [0, 2]}))
+    check_changed(lambda: fig.add_bar(y=[3, 2, 1]))
+    check_changed(lambda: setattr(fig, "data", fig.data[::-1]))
+    check_changed(lambda: setattr(fig, "data", fig.data[:1]))
+    check_changed(lambda: setattr(fig, "layout", {"width": 500}))
+
+    def batch():
+        with fig.batch_update():
+            fig.data[0].opacity = 0.5
+            fig.layout.height = 400
+
+    check_changed(batch)
+
+    # Figures that are not validated
+    fig = go.Figure(go.Scatter(y=[1, 2, 3]), validate=False)
+    check_changed(lambda: setattr(fig.data[0].marker, "color", "red"))
+    check_changed(lambda: fig.update_layout(title_text="Title"))
+
+
+def test_to_json_cache_frames():
+    fig = go.Figure(go.Scatter(y=[1, 2]), frames=[go.Frame(data=[go.Scatter(y=[2])])])
+    json1 = fig.to_json()
+    fig.frames[0].data[0].y = [3]
+    assert fig.to_json() != json1
+
+
+def test_to_json_cache_last_entry():
+    fig = go.Figure(go.Scatter(y=[1, 2, 3]))
+    json1 = fig.to_json()
+    json2 = fig.to_json(pretty=True)
+    assert fig.to_json(pretty=True) is json2
+    assert fig.to_json() is not json1
+    assert fig._json_cache[2] == json1
+
+
+def test_to_json_cache_mutable_values():
+    # Dicts stored as-is
+    fig = go.Figure(layout={"meta": {"a": 1}})
+    json1 = fig.to_json()
+    fig.layout.meta["a"] = 2
+    assert fig.to_json() != json1
+    assert '"meta":{"a":2}' in fig.to_json()
+
+    fig = go.Figure(go.Scatter(y=[1, 2]))
+    fig.to_json()
+    meta = {"a": 1}
+    fig.plotly_relayout({"meta": meta})
+    json1 = fig.to_json()
+    meta["a"] = 2
+    assert fig.to_json() != json1
+
+    # Arrays shared with the caller
+    arr = np.array([1.0, 2.0, 3.0])
+    copy_arrays = pio.config.copy_arrays
+    try:
+        pio.config.copy_arrays = "never"
+        fig = go.Figure(go.Scatter(y=arr))
+    finally:
+        pio.config.copy_arrays = copy_arrays
+    json1 = fig.to_json()
+    arr[0] = 4.0
+    assert fig.to_json() != json1
+    assert fig.to_json() == pio.to_json(fig.to_dict(), validate=False)
+
+    # Copied arrays, validated lists, and decoded typed arrays are cached
+    for fig in [
+        go.Figure(go.Scatter(y=np.arange(3.0), marker_colorscale="Viridis")),
+        pio.from_json(go.Figure(go.Scatter(y=np.arange(3.0))).to_json()),
+    ]:
+        fig.update_layout(xaxis_range=[0, 2])
+        json1 = fig.to_json()
+        assert fig.to_json() is json1
+
+
+def test_to_json_cache_disabled():
+    fig = go.Figure(go.Scatter(y=[1, 2, 3]))
+    json1 = fig.to_json()
+    try:
+        pio.json.config.cache = False
+        json2 = fig.to_json()
+        assert json2 == json1 and json2 is not json1
+        assert fig._json_cache is None
+    finally:
+        pio.json.config.cache = True
+    assert fig.to_json() is not json1
+
+    with pytest.raises(ValueError):
+        pio.json.config.cache = "no"
+
+
+@pytest.mark.parametrize("engine", ["json", "auto"])
+@pytest.mark.parametrize("pretty", [False, True])
+def test_to_json_workers(engine, pretty):
+    fig = go.Figure(
+        [go.Scatter(y=np.arange(10) * i, name="trace %d" % i) for i in range(5)],
+        layout={"title": {"text": "Title"}, "xaxis": {"range": np.array([0, 9])}},
+        frames=[go.Frame(data=[go.Scatter(y=np.arange(3) + i)]) for i in range(3)],
+    )
+    for kwargs in [{}, {"float_precision": "float32"}, {"array_encoding": None}]:
+        expected = pio.to_json(fig, pretty=pretty, engine=engine, **kwargs)
+        result = pio.to_json(fig, pretty=pretty, engine=engine, workers=4, **kwargs)
+        assert result == expected
+
+    # Dicts that are not validated, and figures without traces
+    fig_dict = {"data": [{"type": "bar", "y": [1, 2]}], "layout": {}}
+    for fig in [fig_dict, {}, go.Figure()]:
+        expected = pio.to_json(fig, validate=False, pretty=pretty, engine=engine)
+        result = pio.to_json(
+            fig, validate=False, pretty=pretty, engine=engine, workers=2
+        )
+        assert result == expected
+
+
+def test_to_json_workers_invalid(fig1):
+    for workers in [0, 1.5, "2"]:
+        with pytest.raises(ValueError):
+            pio.to_json(fig1, workers=workers)
+
+
 # from_json
 # ---------
 def test_from_json(fig1):
@@ -102,6 +334,33 @@ def test_from_json_output_type(fig1, fig_type_spec, fig_type):
     assert pio.to_json(fig1_loaded) == pio.to_json(fig1.to_dict())
 
 
+def test_from_json_decode_typed_arrays():
+    fig = go.Figure(
+        [
+            go.Scatter(x=np.arange(5), y=np.linspace(0, 1, 5)),
+            go.Heatmap(z=np.arange(6, dtype="float32").reshape(2, 3)),
+        ]
+    )
+    fig_json = pio.to_json(fig)
+
+    fig_dict = pio.json.from_json_plotly(fig_json, decode_typed_arrays=True)
+    y = fig_dict["data"][0]["y"]
+    np.testing.assert_array_equal(y, np.linspace(0, 1, 5))
+    assert not y.flags.writeable
+    z = fig_dict["data"][1]["z"]
+    assert z.dtype == np.dtype("float32")
+    np.testing.assert_array_equal(z, np.arange(6).reshape(2, 3))
+
+    fig2 = pio.from_json(fig_json, decode_typed_arrays=True)
+    np.testing.assert_array_equal(fig2.data[0].x, np.arange(5))
+    np.testing.assert_array_equal(fig2.data[1].z, fig.data[1].z)
+    assert fig2.to_dict()["data"] == fig.to_dict()["data"]
+
+    # Typed array specs are left as they are by default
+    fig_dict = pio.json.from_json_plotly(fig_json)
+    assert fig_dict["data"][0]["y"]["dtype"] == "f8"
+
+
 def test_from_json_invalid(fig1):
     dict1 = fig1.to_dict()
 
@@ -262,6 +521,40 @@ def test_write_json_from_file_string(fig1, pretty, remove_uids):
         assert result == expected
 
 
+@pytest.mark.parametrize(
+    "compression,suffix,magic",
+    [("gzip", ".gz", b"\x1f\x8b"), ("zstd", ".zst", b"\x28\xb5\x2f\xfd")],
+)
+def test_write_read_json_compressed(fig1, tmp_path, compression, suffix, magic):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    expected = pio.to_json(fig1)
+
+    # Compression inferred from the file suffix
+    path = tmp_path / ("fig1.json" + suffix)
+    pio.write_json(fig1, path)
+    assert path.read_bytes().startswith(magic)
+    assert pio.read_json(path).to_dict() == fig1.to_dict()
+    assert pio.read_json(str(path)).to_dict() == fig1.to_dict()
+
+    # Binary file objects, with compressed contents detected when reading
+    buffer = io.BytesIO()
+    pio.write_json(fig1, buffer, compression=compression)
+    assert buffer.getvalue().startswith(magic)
+    buffer.seek(0)
+    assert pio.read_json(buffer).to_dict() == fig1.to_dict()
+
+    # No compression
+    path = tmp_path / ("fig2.json" + suffix)
+    pio.write_json(fig1, path, compression=None)
+    assert path.read_text() == expected
+
+
+def test_write_json_compression_invalid(fig1, tmp_path):
+    with pytest.raises(ValueError):
+        pio.write_json(fig1, tmp_path / "fig1.json", compression="bz2")
+
+
 def test_to_dict_empty_np_array_int64():
     fig = go.Figure(
         [
@@ -221,6 +221,39 @@ def test_datetime_arrays(datetime_array, engine, pretty):
     check_roundtrip(result, engine=engine, pretty=pretty)
 
 
+@pytest.mark.skipif(orjson is None, reason="orjson is not installed")
+@pytest.mark.parametrize("tz", [None, "UTC", "US/Eastern", "Asia/Kolkata"])
+def test_datetime_series_orjson(tz):
+    values = pd.Series(
+        [
+            pd.Timestamp("2003-07-12 08:34:22"),
+            pd.Timestamp("2003-07-12 08:34:22.5"),
+            pd.Timestamp("1969-12-31 23:59:59.123456789"),
+            pd.NaT,
+        ]
+    )
+    if tz is not None:
+        values = values.dt.tz_localize(tz)
+    result = pio.to_json_plotly(build_test_dict(values), engine="orjson")
+
+    # Sub-microsecond precision is truncated, and the fractional part is
+    # dropped on whole seconds, as with datetime.isoformat
+    suffix = {
+        None: "",
+        "UTC": "+00:00",
+        "US/Eastern": "-04:00",
+        "Asia/Kolkata": "+05:30",
+    }[tz]
+    dt_values = [
+        "2003-07-12T08:34:22" + suffix,
+        "2003-07-12T08:34:22.500000" + suffix,
+        "1969-12-31T23:59:59.123456" + suffix.replace("-04:00", "-05:00"),
+        "NaT",
+    ]
+    expected = build_test_dict_string(to_json_test(dt_values))
+    assert result == expected
+
+
 def test_object_array(engine, pretty):
     fig = px.scatter(px.data.tips(), x="total_bill", y="tip", custom_data=["sex"])
     result = fig.to_plotly_json()
@@ -260,3 +293,65 @@ def test_sanitize_json(engine):
     for bad, good in replacements.items():
         assert bad not in fig_json
         assert good in fig_json
+
+
+@pytest.mark.parametrize("pretty_opt", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 3, 65536])
+def test_iter_json_plotly(engine, pretty_opt, chunk_size):
+    fig = go.Figure(
+        data=[
+            go.Scatter(
+                x=np.arange(10), y=np.linspace(0, 1, 10), text=["a", "</b>"] * 5
+            ),
+            go.Bar(x=list(range(7)), y=list("abcdefg")),
+        ],
+        layout={"title": {"text": "</script> " * 4}},
+    )
+    expected = pio.to_json_plotly(fig, pretty=pretty_opt, engine=engine)
+    chunks = list(
+        pio.iter_json_plotly(
+            fig, pretty=pretty_opt, engine=engine, chunk_size=chunk_size
+        )
+    )
+
+    if chunk_size == 1:
+        assert len(chunks) > 1
+    assert "".join(chunks) == expected
+
+
+def test_write_json_streamed(tmp_path):
+    import plotly.io as plio
+
+    fig = go.Figure(go.Scattergl(x=np.arange(200000), y=np.random.rand(200000)))
+    path = tmp_path / "fig.json"
+    plio.write_json(fig, path)
+    assert path.read_text() == plio.to_json(fig)
+
+
+def test_clean_to_json_compatible_iterative():
+    from plotly.io._json import clean_to_json_compatible
+
+    modules = {"sage_all": None, "np": np, "pd": pd, "image": None}
+
+    # Deeply nested values don't hit the recursion limit
+    value = [np.int64(1)]
+    for _ in range(sys.getrecursionlimit() * 2):
+        value = [value]
+    cleaned = clean_to_json_compatible(value, modules=modules)
+    for _ in range(sys.getrecursionlimit() * 2):
+        cleaned = cleaned[0]
+    assert cleaned == [1] and type(cleaned[0]) is int
+
+    # Converted values are cleaned recursively, and inputs aren't modified
+    value = {
+        "annotations": [{"x": np.int64(i), "text": "a"} for i in range(3)],
+        "data": (go.Scatter(x=np.array(["2020-01-01"], dtype="M8[ns]")),),
+        "empty": (),
+    }
+    cleaned = clean_to_json_compatible(value, numpy_allowed=True, modules=modules)
+    assert cleaned == {
+        "annotations": [{"x": i, "text": "a"} for i in range(3)],
+        "data": [{"type": "scatter", "x": ["2020-01-01T00:00:00.000000000"]}],
+        "empty": (),
+    }
+    assert type(value["annotations"][0]["x"]) is np.int64
@@ -1,9 +1,13 @@
+import json
+from collections import OrderedDict
+import plotly.graph_objects as go
 import plotly.io as pio
 import plotly.io.kaleido
 from contextlib import contextmanager
 from io import BytesIO
 from pathlib import Path
 from unittest.mock import Mock
+import pytest
 
 fig = {"layout": {"title": {"text": "figure title"}}}
 
@@ -163,3 +167,221 @@ def test_bytesio():
     bio_bytes = bio.read()
     to_image_bytes = pio.to_image(fig, format="jpg", engine="kaleido", validate=False)
     assert bio_bytes == to_image_bytes
+
+
+class FakeScope:
+    """Stand-in for kaleido's PlotlyScope that records the exports it performs"""
+
+    _scope_flags = ("plotlyjs",)
+    chromium_args = ()
+
+    def __init__(self, chromium_args=()):
+        self.plotlyjs = None
+        self.default_format = "png"
+        self.default_width = 700
+        self.default_height = 500
+        self.default_scale = 1
+        self.exported = []
+
+    def transform(self, fig, format=None, width=None, height=None, scale=None):
+        import time
+
+        time.sleep(0.01)
+        if format == "json":
+            return json.dumps({"data": [], "layout": fig["layout"]}).encode()
+        self.exported.append(fig["layout"]["title"]["text"])
+        return "{title}.{format}".format(
+            title=fig["layout"]["title"]["text"], format=format
+        ).encode()
+
+
+def test_write_images(tmp_path, monkeypatch):
+    scope = FakeScope()
+    scope.plotlyjs = "plotly.min.js"
+    monkeypatch.setattr(pio._kaleido, "scope", scope)
+    monkeypatch.setattr(pio._kaleido, "PlotlyScope", FakeScope)
+    monkeypatch.setattr(pio._kaleido, "_scope_pool", [])
+
+    figs = [{"layout": {"title": {"text": str(i)}}} for i in range(20)]
+    figs[3] = {"layout": {"bogus": 1}}
+    files = [tmp_path / "{i}.png".format(i=i) for i in range(20)]
+    files[5] = tmp_path / "5"
+    files[7] = BytesIO()
+
+    errors = pio.write_images(iter(figs), files, workers=3)
+
+    # Errors are reported for each figure
+    assert len(errors) == 20
+    assert isinstance(errors[3], ValueError)
+    assert isinstance(errors[5], ValueError)
+    assert all(error is None for i, error in enumerate(errors) if i not in (3, 5))
+    assert files[7].getvalue() == b"7.None"
+    assert files[9].read_bytes() == b"9.png"
+
+    # The exports are shared by the scopes, which are kept for later calls
+    scopes = [scope] + pio._kaleido._scope_pool
+    assert len(scopes) == 3
+    assert all(s.exported and s.plotlyjs == "plotly.min.js" for s in scopes)
+    assert sum(len(s.exported) for s in scopes) == 18
+
+    pio.write_images(figs[:2], files[:2], workers=2)
+    assert len(pio._kaleido._scope_pool) == 2
+
+
+def test_write_images_invalid(monkeypatch):
+    monkeypatch.setattr(pio._kaleido, "scope", FakeScope())
+    with pytest.raises(ValueError):
+        pio.write_images([fig], [BytesIO()], workers=0)
+    with pytest.raises(ValueError):
+        pio.write_images([fig, fig], [BytesIO()])
+
+
+def test_image_export_async(monkeypatch):
+    import asyncio
+
+    scope = FakeScope()
+    monkeypatch.setattr(pio._kaleido, "scope", scope)
+    monkeypatch.setattr(pio._kaleido, "PlotlyScope", FakeScope)
+    monkeypatch.setattr(pio._kaleido, "_scope_pool", [])
+    monkeypatch.setattr(pio.kaleido.config, "async_workers", 2)
+
+    figs = [{"layout": {"title": {"text": str(i)}}} for i in range(6)]
+    bio = BytesIO()
+
+    async def export():
+        images = await asyncio.gather(
+            *[pio.to_image_async(f, format="svg", validate=False) for f in figs]
+        )
+        await pio.write_image_async(figs[0], bio, format="png", validate=False)
+        full_fig = await pio.full_figure_for_development_async(
+            figs[1], warn=False, as_dict=True
+        )
+        return images, full_fig
+
+    images, full_fig = asyncio.run(export())
+    assert images == [(str(i) + ".svg").encode() for i in range(6)]
+    assert bio.getvalue() == b"0.png"
+    assert full_fig["layout"]["title"]["text"] == "1"
+
+    # The exports are shared by two scopes
+    assert len(pio._kaleido._scope_pool) == 1
+    assert scope.exported and pio._kaleido._scope_pool[0].exported
+
+
+def test_async_workers_invalid():
+    for val in [0, 1.5, True]:
+        with pytest.raises(ValueError):
+            pio.kaleido.config.async_workers = val
+
+
+def test_image_cache(tmp_path, monkeypatch):
+    scope = FakeScope()
+    monkeypatch.setattr(pio._kaleido, "scope", scope)
+    monkeypatch.setattr(pio.kaleido.config, "image_cache_dir", tmp_path / "cache")
+
+    fig1 = {"layout": {"title": {"text": "1"}}}
+    assert pio.to_image(fig1, format="svg") == b"1.svg"
+    assert pio.to_image(fig1, format="svg") == b"1.svg"
+    assert len(scope.exported) == 1
+
+    # Images are keyed on the figure and the export options
+    pio.to_image(fig1, format="svg", width=100)
+    pio.to_image({"layout": {"title": {"text": "2"}}}, format="svg")
+    assert len(scope.exported) == 3
+
+    # Default options are resolved before the lookup
+    pio.to_image(fig1)
+    scope.default_format = "jpg"
+    assert pio.to_image(fig1) == b"1.None"
+    assert len(scope.exported) == 5
+
+    bio = BytesIO()
+    pio.write_image(fig1, bio, format="svg")
+    assert bio.getvalue() == b"1.svg"
+    assert len(scope.exported) == 5
+    assert len(list((tmp_path / "cache").iterdir())) == 5
+
+    # Images are keyed on the rendering settings of the scope
+    scope.plotlyjs = "other/plotly.min.js"
+    pio.to_image(fig1, format="svg")
+    assert len(scope.exported) == 6
+
+
+def test_image_cache_eviction(tmp_path):
+    import os
+    from plotly.io._image_cache import ImageCache
+
+    cache = ImageCache(tmp_path, max_size=30)
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.put(key, b"0123456789")
+        os.utime(tmp_path / key, (i, i))
+
+    # Reading an image marks it as recently used
+    assert cache.get("a") == b"0123456789"
+    cache.put("d", b"0123456789")
+    assert cache.get("b") is None
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a", "c", "d"]
+    assert cache.get("missing") is None
+
+
+def test_image_cache_config_invalid():
+    with pytest.raises(ValueError):
+        pio.kaleido.config.image_cache_dir = 1
+    with pytest.raises(ValueError):
+        pio.kaleido.config.image_cache_size = -1
+
+
+def test_full_figure_cache(tmp_path, monkeypatch):
+    scope = FakeScope()
+    transforms = []
+
+    def transform(fig, format=None, **kwargs):
+        transforms.append(fig)
+        return FakeScope.transform(scope, fig, format=format, **kwargs)
+
+    monkeypatch.setattr(scope, "transform", transform)
+    monkeypatch.setattr(pio._kaleido, "scope", scope)
+    monkeypatch.setattr(pio._kaleido, "_full_figure_cache", OrderedDict())
+    monkeypatch.setattr(pio.kaleido.config, "full_figure_cache_size", 2)
+
+    figs = [{"layout": {"title": {"text": str(i)}}} for i in range(3)]
+    full_fig = pio.full_figure_for_development(figs[0], warn=False, as_dict=True)
+    assert full_fig["layout"]["title"]["text"] == "0"
+
+    # Each call returns a new dict
+    full_fig["layout"]["title"]["text"] = "modified"
+    full_fig = pio.full_figure_for_development(figs[0], warn=False, as_dict=True)
+    assert full_fig["layout"]["title"]["text"] == "0"
+    assert len(transforms) == 1
+
+    # Figure objects are keyed on their dict
+    for _ in range(2):
+        full_fig = pio.full_figure_for_development(go.Figure(figs[0]), warn=False)
+        assert full_fig.layout.title.text == "0"
+    assert len(transforms) == 2
+
+    # The least recently used full figures are evicted
+    pio.full_figure_for_development(figs[1], warn=False)
+    pio.full_figure_for_development(figs[0], warn=False)
+    assert len(transforms) == 4
+    pio.full_figure_for_development(figs[2], warn=False)
+    pio.full_figure_for_development(figs[0], warn=False)
+    assert len(transforms) == 5
+
+    # Full figures are keyed on the rendering settings of the scope
+    scope.plotlyjs = "other/plotly.min.js"
+    pio.full_figure_for_development(figs[0], warn=False)
+    assert len(transforms) == 6
+    scope.plotlyjs = None
+
+    # Full figures are stored in the image cache when it is enabled
+    monkeypatch.setattr(pio.kaleido.config, "full_figure_cache_size", 0)
+    monkeypatch.setattr(pio.kaleido.config, "image_cache_dir", tmp_path)
+    pio.full_figure_for_development(figs[0], warn=False)
+    pio.full_figure_for_development(figs[0], warn=False)
+    assert len(transforms) == 7
+    assert len(pio._kaleido._full_figure_cache) == 0
+    assert len(list(tmp_path.iterdir())) == 1
+
+    with pytest.raises(ValueError):
+        pio.kaleido.config.full_figure_cache_size = -1
@@ -0,0 +1,149 @@
+import pytest
+import requests
+
+import plotly.io as pio
+from plotly.io import _orca
+
+pytest.importorskip("psutil")
+
+
+class FakeProcess(object):
+    # Stand-in for the subprocess.Popen object of an orca server
+    pid = 2**22 + 1
+
+    def __init__(self, cmd_list, **kwargs):
+        self.port = int(cmd_list[cmd_list.index("-p") + 1])
+        self.returncode = None
+
+    def poll(self):
+        return self.returncode
+
+    def terminate(self):
+        self.returncode = -15
+
+    def wait(self):
+        return self.returncode
+
+
+class FakeResponse(object):
+    def __init__(self, status_code, content=b"image"):
+        self.status_code = status_code
+        self.content = content
+
+
+@pytest.fixture
+def fake_orca(monkeypatch):
+    # Launch fake orca servers and record the ports of the image requests
+    ports = []
+    responses = {}
+
+    def post(url, data):
+        port = int(url.split(":")[-1].rstrip("/"))
+        ports.append(port)
+        return responses.pop(port, FakeResponse(200))
+
+    pio.orca.shutdown_server()
+    monkeypatch.setattr(_orca.subprocess, "Popen", FakeProcess)
+    monkeypatch.setattr(requests, "post", post)
+    monkeypatch.setitem(_orca.status._props, "executable_list", ["orca"])
+    monkeypatch.setitem(_orca.status._props, "state", "validated")
+
+    yield ports, responses
+
+    pio.orca.shutdown_server()
+    pio.orca.config.pool_size = None
+
+
+def test_pool_size_invalid():
+    for val in [0, -1, 2.0, "2", True]:
+        with pytest.raises(ValueError):
+            pio.orca.config.pool_size = val
+    assert pio.orca.config.pool_size == 1
+
+
+def test_pool_round_robin(fake_orca):
+    ports, _ = fake_orca
+    pio.orca.config.pool_size = 3
+
+    for _ in range(6):
+        assert _orca.to_image({}, format="png", validate=False) == b"image"
+
+    server_ports = [server["port"] for server in _orca.orca_state["servers"]]
+    assert len(set(server_ports)) == 3
+    assert ports == server_ports * 2
+    assert _orca.status.port == server_ports[0]
+
+
+def test_pool_least_busy(fake_orca):
+    ports, _ = fake_orca
+    pio.orca.config.pool_size = 2
+    pio.orca.ensure_server()
+    busy, idle = _orca.orca_state["servers"]
+
+    # The first server is kept busy by a request in progress
+    with _orca._checkout_server() as server:
+        assert server is busy
+        _orca.to_image({}, format="png", validate=False)
+        _orca.to_image({}, format="png", validate=False)
+
+    assert ports == [idle["port"], idle["port"]]
+
+
+def test_pool_restart(fake_orca):
+    ports, responses = fake_orca
+    pio.orca.config.pool_size = 2
+    pio.orca.ensure_server()
+    first, second = _orca.orca_state["servers"]
+
+    # A server process that exited is restarted before the next request
+    second["proc"].returncode = 1
+    _orca.to_image({}, format="png", validate=False)
+    _orca.to_image({}, format="png", validate=False)
+    servers = _orca.orca_state["servers"]
+    assert servers[0] is first
+    assert servers[1] is not second
+    assert ports == [first["port"], servers[1]["port"]]
+
+    # A server that times out on a request is restarted
+    responses[first["port"]] = FakeResponse(522)
+    with pytest.raises(OSError):
+        _orca.request_image_with_retrying.__wrapped__(figure={}, format="png")
+    assert first["proc"].returncode is not None
+    assert _orca.orca_state["servers"][0] is not first
+    assert _orca.status.port == _orca.orca_state["servers"][0]["port"]
+
+
+def test_pool_replace_busy_server(fake_orca):
+    ports, responses = fake_orca
+    pio.orca.ensure_server()
+    (server,) = _orca.orca_state["servers"]
+
+    with _orca._checkout_server():
+        # A server that times out while other requests are in progress on it
+        # is not sent new requests, and is only replaced once they complete
+        responses[server["port"]] = FakeResponse(522)
+        with pytest.raises(OSError):
+            _orca.request_image_with_retrying.__wrapped__(figure={}, format="png")
+        assert server["unhealthy"]
+        assert server["proc"].returncode is None
+
+        with pytest.raises(OSError):
+            _orca.request_image_with_retrying.__wrapped__(figure={}, format="png")
+        assert ports == [server["port"]]
+
+    assert server["proc"].returncode is not None
+    (new_server,) = _orca.orca_state["servers"]
+    assert new_server is not server
+    response = _orca.request_image_with_retrying.__wrapped__(figure={}, format="png")
+    assert response.status_code == 200
+    assert ports == [server["port"], new_server["port"]]
+
+
+def test_server_url_522_retried(fake_orca, monkeypatch):
+    ports, responses = fake_orca
+    monkeypatch.setitem(pio.orca.config._props, "server_url", "http://localhost:1")
+    responses[1] = FakeResponse(522)
+    with pytest.raises(OSError):
+        _orca.request_image_with_retrying.__wrapped__(figure={}, format="png")
+    response = _orca.request_image_with_retrying.__wrapped__(figure={}, format="png")
+    assert response.status_code == 200
@@ -1,6 +1,7 @@
 import pytest
 from _plotly_utils.basevalidators import ColorValidator
 import numpy as np
+import pandas as pd
 
 
 # Fixtures
@@ -196,6 +197,38 @@ def test_rejection_aok_2D(val, validator_aok):
     assert "Invalid element(s)" in str(validation_failure.value)
 
 
+# ### Large arrays with few distinct colors ###
+@pytest.mark.parametrize("as_type", [list, np.array, pd.Series])
+def test_acceptance_aok_repeated(as_type, validator_aok):
+    val = as_type(["red", "rgb(255, 0, 0)", "#fff"] * 1000)
+    coerce_val = validator_aok.validate_coerce(val)
+
+    if as_type is list:
+        assert coerce_val == val
+    else:
+        assert isinstance(coerce_val, np.ndarray)
+        assert coerce_val.dtype.kind == "U"
+        assert not coerce_val.flags["WRITEABLE"]
+        assert np.array_equal(coerce_val, np.array(val))
+
+
+@pytest.mark.parametrize("as_type", [list, np.array, pd.Series])
+def test_rejection_aok_repeated(as_type, validator_aok):
+    val = as_type(["red", "redd", "#fff", "bluee"] * 1000)
+    with pytest.raises(ValueError) as validation_failure:
+        validator_aok.validate_coerce(val)
+
+    assert "Invalid elements include: ['redd', 'bluee', 'redd'" in str(
+        validation_failure.value
+    )
+
+
+def test_valid_color_str_cache():
+    assert ColorValidator.is_valid_color_str("Dark Orange")
+    assert not ColorValidator.is_valid_color_str("Dark Orangee")
+    assert ColorValidator.is_valid_color_str.cache_info().currsize > 0
+
+
 # Array ok, numbers ok
 # --------------------
 # ### Acceptance ###
@@ -48,3 +48,65 @@ def test_rejection(val, validator):
         validator.validate_coerce(val)
 
     assert "Invalid value" in str(validation_failure.value)
+
+
+# ### Zero-copy ingestion ###
+@pytest.fixture()
+def copy_arrays_config():
+    from _plotly_utils.basevalidators import config
+
+    yield config
+    config.copy_arrays = "always"
+
+
+def test_copy_arrays_always(validator, copy_arrays_config):
+    val = np.arange(10.0)
+    val.flags.writeable = False
+    coerce_val = validator.validate_coerce(val)
+    assert not np.shares_memory(coerce_val, val)
+    assert not coerce_val.flags.writeable
+
+
+def test_copy_arrays_never(validator, copy_arrays_config):
+    copy_arrays_config.copy_arrays = "never"
+    val = np.arange(10.0)
+    coerce_val = validator.validate_coerce(val)
+    assert np.shares_memory(coerce_val, val)
+    assert not coerce_val.flags.writeable
+
+    # The caller's array keeps its flags
+    assert val.flags.writeable
+
+
+def test_copy_arrays_if_writeable(validator, copy_arrays_config):
+    copy_arrays_config.copy_arrays = "if_writeable"
+
+    writeable = np.arange(10.0)
+    assert not np.shares_memory(validator.validate_coerce(writeable), writeable)
+
+    readonly = np.arange(10.0)
+    readonly.flags.writeable = False
+    assert np.shares_memory(validator.validate_coerce(readonly), readonly)
+
+
+def test_copy_arrays_non_contiguous(validator, copy_arrays_config):
+    copy_arrays_config.copy_arrays = "never"
+    val = np.arange(20.0)[::2]
+    coerce_val = validator.validate_coerce(val)
+    assert coerce_val.flags.c_contiguous
+    np.testing.assert_array_equal(coerce_val, val)
+
+
+def test_copy_arrays_figure_shares_memory(copy_arrays_config):
+    import plotly.graph_objects as go
+
+    copy_arrays_config.copy_arrays = "never"
+    val = np.arange(10.0)
+    fig = go.Figure(go.Scatter(x=val))
+    assert np.shares_memory(fig.data[0].x, val)
+    assert np.shares_memory(go.Figure(fig).data[0].x, val)
+
+
+def test_copy_arrays_invalid(copy_arrays_config):
+    with pytest.raises(ValueError):
+        copy_arrays_config.copy_arrays = "sometimes"
@@ -189,3 +189,38 @@ def test_rejection_aok_min_max(val, validator_aok):
         validator_aok.validate_coerce(val)
 
     assert "in the interval [-2, 10]" in str(validation_failure.value)
+
+
+# ### Long lists ###
+@pytest.fixture
+def long_list_config():
+    from _plotly_utils.basevalidators import config
+
+    threshold = config.list_array_threshold
+    config.list_array_threshold = 10
+    yield config
+    config.list_array_threshold = threshold
+    config.lists_as_arrays = False
+
+
+def test_acceptance_aok_long_list(validator_aok, long_list_config):
+    val = list(range(-2, 10)) * 2
+    assert validator_aok.validate_coerce(val) == val
+
+
+def test_acceptance_aok_long_list_as_array(validator_aok, long_list_config):
+    long_list_config.lists_as_arrays = True
+    val = list(range(-2, 10)) * 2
+    v = validator_aok.validate_coerce(val)
+    assert isinstance(v, np.ndarray)
+    assert v.dtype.kind == "i"
+    assert not v.flags["WRITEABLE"]
+    assert np.array_equal(v, val)
+
+
+@pytest.mark.parametrize("val", [list(range(-3, 10)) * 2, [0, 1, 2.0] * 10])
+def test_rejection_aok_long_list(val, validator_aok, long_list_config):
+    with pytest.raises(ValueError) as validation_failure:
+        validator_aok.validate_coerce(val)
+
+    assert "Invalid element(s)" in str(validation_failure.value)
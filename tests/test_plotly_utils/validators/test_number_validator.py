@@ -157,3 +157,50 @@ def test_rejection_aok_min_max(val, validator_aok):
 
     assert "Invalid element(s)" in str(validation_failure.value)
     assert "in the interval [-1, 1.5]" in str(validation_failure.value)
+
+
+# ### Long lists ###
+@pytest.fixture
+def long_list_config():
+    from _plotly_utils.basevalidators import config
+
+    threshold = config.list_array_threshold
+    config.list_array_threshold = 10
+    yield config
+    config.list_array_threshold = threshold
+    config.lists_as_arrays = False
+
+
+def test_acceptance_aok_long_list(validator_aok, long_list_config):
+    val = [0, 0.5, -1, 1.5] * 10
+    v = validator_aok.validate_coerce(val)
+    assert v == val
+    assert v is not val
+    assert [type(e) for e in v] == [type(e) for e in val]
+
+
+def test_acceptance_aok_long_list_as_array(validator_aok, long_list_config):
+    long_list_config.lists_as_arrays = True
+    val = [0, 0.5, -1, 1.5] * 10
+    v = validator_aok.validate_coerce(val)
+    assert isinstance(v, np.ndarray)
+    assert not v.flags["WRITEABLE"]
+    assert np.array_equal(v, np.array(val, dtype="float"))
+
+
+@pytest.mark.parametrize(
+    "val, invalid",
+    [([0, 0.5, -1.6, 2] * 10, "[-1.6, 2, -1.6, 2"), ([0, np_nan()] * 10, "[nan, nan")],
+)
+def test_rejection_aok_min_max_long_list(val, invalid, validator_aok, long_list_config):
+    with pytest.raises(ValueError) as validation_failure:
+        validator_aok.validate_coerce(val)
+
+    assert "Invalid elements include: " + invalid in str(validation_failure.value)
+
+
+def test_rejection_aok_long_list(validator_aok, long_list_config):
+    with pytest.raises(ValueError) as validation_failure:
+        validator_aok.validate_coerce([0, "a"] * 10)
+
+    assert "Invalid element(s)" in str(validation_failure.value)